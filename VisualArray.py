@@ -1,16 +1,35 @@
 from __future__ import annotations
 
-from __vimports import Bar, Color, MainWindow, Qt, SortingAlgorithm, Union, _TWR_FACTORS, \
-    ticker, _resolution, app, shuffle, rand_array, QAction, QSlider, QMenu, \
+from array import array
+
+from __vimports import Bar, Color, MainWindow, Qt, SortingAlgorithm, Union, AGGREGATIONS, \
+    QSpinBox, QAbstractSpinBox, resolution, get_app, shuffle, QAction, QSlider, QMenu, \
     QPushButton, QFont, bubble_sort, insertion_sort, gnome_sort, quick_sort, selection_sort, \
     shaker_sort, comb_sort, brick_sort, heap_sort, intro_sort, shell_sort, tim_sort, \
     merge_sort, radix_sort, radix_sort_v2, hybrid_QSort_v2, hybrid_QSort, middle_quick_sort, \
-    binary_insertion_sort, bim_sort, qim_sort, m_qim_sort, bogo_sort, sysexit
+    binary_insertion_sort, bim_sort, qim_sort, m_qim_sort, bogo_sort, sysexit, Player, OpLog, RecordingThread, \
+    QLabel, QTimer, randrange, perf_counter, READ, WRITE, SWAP, COMPARE, SELECT, ALLOC, Profiler, ALGORITHM, EVENTS, \
+    GENERATORS, generate, scale, AuxBuffer, AUX_READ, AUX_WRITE, AUX_ALLOC, AUX_FREE, TraceCache, cache_key, \
+    BACKGROUND, BAR, ACCESS, SELECTION, QColor, Sonifier, print_exception
 
 """________________________Constants________________________"""
 
-_WR_FACTORS: list[int] = _TWR_FACTORS[-20:] if 20 < len(_TWR_FACTORS) else \
-    [1] * (20 - len(_TWR_FACTORS)) + _TWR_FACTORS  # Slider ticks constant
+
+_MAX_SAMPLE_SIZE: int = 1 << 20  # Largest sample size offered by the slider.
+
+
+def sample_sizes() -> list[int]:
+    """Returns the sample sizes offered by the slider: steps of a factor sqrt(2) from 16 up to _MAX_SAMPLE_SIZE,
+    and the resolution width, at which each element is one pixel column"""
+
+    steps: int = 2 * (_MAX_SAMPLE_SIZE // 16).bit_length() - 1
+
+    return sorted({round(16 * 2 ** (k / 2)) for k in range(steps)} | {resolution()[0]})
+
+
+_STATS_INTERVAL: float = 0.5  # Seconds over which the operations per second are measured.
+
+_SWEEP_FRAMES: int = 60  # Frames the end-of-sort sweep lasts, at 5 columns per frame or more.
 
 _BUILTIN_FUNCS: dict[str, SortingAlgorithm] = {' '.join(__temp.__name__.title().split('_')): __temp for __temp in
                                                [bogo_sort,
@@ -48,11 +67,16 @@ class VisualArray(MainWindow):
     """
 
     def __init__(self, values: list[int] = None, *, only_positive: bool = False, true_random: bool = False,
-                 sample_size: int = _resolution[0], select_color: Color = (0, 255, 0),
+                 sample_size: int = None, select_color: Color = (0, 255, 0),
                  bar_color: Color = (255, 255, 255), access_color: Color = (255, 0, 0),
                  is_separated: bool = True, background_color: Color = (0, 0, 0),
-                 economical: bool = False, no_toolBar: bool = False, delay: float = 0.001) -> None:
+                 economical: bool = False, no_toolBar: bool = False, delay: float = 0.0002,
+                 recorded: bool = True, fps: int = 60, profile: bool = False, distribution: str = None,
+                 seed: int = None, aggregation: str = "max", cached: bool = True,
+                 shuffle_duration: float = 0.0) -> None:
         """Assertions"""
+        sample_size = resolution()[0] if sample_size is None else sample_size
+
         if VisualArray.check_given_values(values):
             sample_size = len(values)  # Checks the length of the given values.
 
@@ -67,35 +91,67 @@ class VisualArray(MainWindow):
 
         self.sample_size: int = sample_size  # Number of elements in the main array.
 
-        self.true_random: bool = true_random  # If False, after sorting the array, the values increase constantly.
+        self.distribution: str = distribution or ("true_random" if true_random else "random")  # Input generator.
+
+        self.seed: Union[int, None] = seed  # Seed of the generated inputs, None for a new input every time.
 
         self.finished: bool = False  # True if the array is sorted.
 
         self.economical: bool = economical  # True results in no coloring when accessing values.
 
-        self.delay: float = 0.001  # A virtual delay to slow down the visualization.
+        self.shuffle_duration: float = shuffle_duration  # Seconds the shuffle is animated over, 0 draws it at once.
+
+        self._shuffle_swaps: array = array('i')  # Partners of the swaps of the animated shuffle, last index first.
+
+        self._shuffle_done: int = 0  # Number of swaps of the animated shuffle already drawn.
+
+        self._shuffle_began: float = 0.0  # Time the animated shuffle started.
+
+        self._sweep_done: int = 0  # Number of columns of the end-of-sort sweep already drawn.
+
+        self.recorded: bool = recorded  # True runs the algorithm on a worker thread and replays its records.
+
+        self.player: Union[Player, None] = None  # Player of the current replay.
+
+        self.history: Union[Player, None] = None  # Player of the current or last replay, kept for seeking.
 
-        self.running: bool = False  # Indicates whether the executed function is paused.
+        self.log: Union[OpLog, None] = None  # Log of the current or last replay.
 
-        """Bar attributes"""
+        self.cache: Union[TraceCache, None] = TraceCache() if cached else None  # Logs of previous recorded runs.
 
-        bar_width: int = _resolution[0] // sample_size - is_separated  # Width of the bars of the array.
+        self.cache_key: Union[str, None] = None  # Key of the run being recorded, cached once it is complete.
 
-        if bar_width < 1:
-            bar_width, is_separated = 1, False
+        self.stats_label: Union[QLabel, None] = None  # Shows the operation counters in the tool bar.
+
+        self.timeline: Union[QSlider, None] = None  # Position in the replay, in the tool bar.
+
+        self._stats_mark: tuple[float, int] = (perf_counter(), 0)  # Time and operation total of the last rate.
+
+        self._ops_per_second: float = 0  # Operations per second measured over the last interval.
 
         """ToolBar attributes"""
 
         super(VisualArray, self).__init__(color=background_color, bar_color=bar_color,
                                           selection_color=select_color, access_color=access_color,
-                                          bar_width=bar_width, is_separated=is_separated,
-                                          only_positive=only_positive, no_toolBar=no_toolBar, delay=delay)
+                                          is_separated=is_separated, only_positive=only_positive,
+                                          no_toolBar=no_toolBar, delay=delay, fps=fps, profile=profile)
 
         self.setWindowTitle("Sorting Visualizer")
 
+        self.aggregation = aggregation  # Shown by the tool bar, checked once the geometry is loaded.
+
+        self._shuffle_timer: QTimer = QTimer()  # Frame clock of the animated shuffle.
+
+        self._shuffle_timer.timeout.connect(self._shuffle_frame)
+
+        self._sweep_timer: QTimer = QTimer()  # Frame clock of the end-of-sort sweep.
+
+        self._sweep_timer.timeout.connect(self._sweep_frame)
+
         if not no_toolBar:
-            self.prompt = self.eco_button = self.only_positive_button = \
-                self.slider = self.algorithm_selector = None
+            self.prompt = self.eco_button = self.only_positive_button = self.record_button = self.profile_button = \
+                self.slider = self.algorithm_selector = self.fps_box = self.rate_box = \
+                self.distribution_selector = self.seed_box = self.aggregation_button = self.sound_button = None
             self.__create_toolBar()
 
         """Container"""
@@ -104,27 +160,30 @@ class VisualArray(MainWindow):
 
         self.load_background()  # Loads the background.
 
-        self._bar_objects: list[Bar] = [self.bar_at(values[i], i) for i in
-                                        range(len(values))]  # Creates and draws the bars from values.
+        self.load_geometry(len(values))  # Computes the x coordinates of the bars.
+
+        self.set_aggregation(aggregation)  # Value shown by a column of several bars.
 
-        self.cache_counter: int = max(_WR_FACTORS[0] // 8, len(self) // 40)
+        self.load_values(values)  # Values of the bars.
+
+        self.clear()  # Draws the bars.
 
         self.update()
 
     def __str__(self) -> str:
         """Returns a string of the values of the bars"""
 
-        return str([int(i) for i in self._bar_objects])
+        return str(self._values.tolist())
 
     def __repr__(self) -> str:
-        """Returns a string of the QRect objects in the array"""
+        """Returns a string of the QRect objects of the bars in the array"""
 
-        return str([str(i) for i in self._bar_objects])
+        return str([str(self.rect_at(i)) for i in range(len(self))])
 
     def __len__(self) -> int:
         """Returns the number of elements in the main array"""
 
-        return len(self._bar_objects)
+        return len(self._values)
 
     def __call__(self, sorting_algorithm: SortingAlgorithm = None) -> None:
         """Has the same effect of calling self.run(sorting_algorithm)"""
@@ -135,12 +194,8 @@ class VisualArray(MainWindow):
         """Returns the Bar located at index if index is an int.
         Else returns a list of Bars in the given index slice"""
 
-        while not self.running:
-            # Pauses the execution of the currently running algorithm.
-
-            if self.isHidden():
-                quit()
-            app.processEvents()
+        if not self.running and not self.wait_while_paused():
+            quit()  # Pauses the execution of the currently running algorithm, exits if the window was closed.
 
         if isinstance(index, slice):
             index = slice(index.start if index.start else 0,
@@ -148,20 +203,26 @@ class VisualArray(MainWindow):
                           index.step if index.step else 1)
 
             if not self.economical:
-                for i in range(*index.indices(index.stop - index.start)):
-                    self.threaded_fill(i, self.access_color)
+                for i in range(*index.indices(len(self))):
+                    self.highlight(i)
+
+            values: array = self._values[index]
 
-            return self._bar_objects[index]
+            self.counts[ALLOC] += 1
+            self.counts[READ] += len(values)
 
-        if self.cache_counter <= len(self.cache):
-            self.process_cache()
+            return [Bar(value, self.counts) for value in values]
 
         index = int(index)
 
         if not self.economical:
-            self.threaded_fill(index, self.access_color)
+            self.highlight(index)
+
+        self.counts[READ] += 1
+
+        self.tick()
 
-        return self._bar_objects[index]
+        return Bar(self._values[index], self.counts)
 
     def __setitem__(self, index: Union[slice, int], new_val: Union[list, Bar, int, VisualArray]) -> None:
         """Changes the value of the bar at the given index, internally and visually, if index is int.
@@ -173,32 +234,29 @@ class VisualArray(MainWindow):
                           index.step if index.step else 1)
 
             for i in range(index.start, index.stop):
-                while not self.running:
-                    if self.isHidden():
-                        quit()
-                    app.processEvents()
+                if not self.running and not self.wait_while_paused():
+                    quit()
 
-                self._bar_objects[i] = self.bar_at(new_val[i - index.start], i)
+                self.bar_at(new_val[i - index.start], i)
+
+            self.counts[WRITE] += len(range(index.start, index.stop))
 
             self.update()
             return
 
-        if not self.economical:
-            self.threaded_fill(index, self.access_color)
-
         index = int(index)
 
-        while not self.running:
-            if self.isHidden():
-                quit()
-            app.processEvents()
+        if not self.running and not self.wait_while_paused():
+            quit()
+
+        self.bar_at(new_val, index)
 
-        if self.cache_counter <= len(self.cache):
-            self.process_cache()
+        if not self.economical:
+            self.highlight(index)
 
-        self._bar_objects[index] = self.bar_at(new_val, index)
+        self.counts[WRITE] += 1
 
-        ticker(self.update)
+        self.tick()
 
     def run(self, func: SortingAlgorithm = None) -> None:
         """Displays the screen and runs the sorting algorithm"""
@@ -209,7 +267,7 @@ class VisualArray(MainWindow):
 
         self.algorithm = func if func is not None else self.algorithm
 
-        app.exec_()
+        get_app().exec_()
 
     def quit(self) -> None:
         self.running = True
@@ -236,13 +294,38 @@ class VisualArray(MainWindow):
 
         # End of buttons
 
+        # Timeline
+
+        self.create_button(self.step_back,
+                           "Pauses the replay and undoes its last operation",
+                           "<")
+
+        self.timeline: QSlider = QSlider(Qt.Horizontal, self)
+
+        self.timeline.setToolTip("Position in the replay, drag to pause and seek. Only for recorded runs")
+
+        self.timeline.setFixedSize(200, 14)
+
+        self.timeline.setDisabled(True)
+
+        self.timeline.valueChanged.connect(self.seek)
+
+        self.tool_bar.addWidget(self.timeline)
+
+        self.create_button(self.step_forward,
+                           "Pauses the replay and plays its next operation",
+                           ">",
+                           separate=False)
+
+        # End of timeline
+
         # Size Slider
 
         self.slider: QSlider = QSlider(Qt.Horizontal, self)
 
         self.slider.setToolTip("Creates a new array of the selected size")
 
-        self.slider.setRange(0, min(19, len(_WR_FACTORS)))
+        self.slider.setRange(0, len(sample_sizes()) - 1)
 
         self.slider.setTickInterval(1)
 
@@ -250,9 +333,9 @@ class VisualArray(MainWindow):
 
         self.slider.setFixedSize(400, 14)
 
-        self.slider.setValue(_WR_FACTORS.index(self.sample_size))
+        self.slider.setValue(min(range(len(sample_sizes())), key=lambda i: abs(sample_sizes()[i] - self.sample_size)))
 
-        self.slider.valueChanged.connect(lambda __value: self.change_size(_WR_FACTORS[__value]))
+        self.slider.valueChanged.connect(lambda __value: self.change_size(sample_sizes()[__value]))
 
         self.tool_bar.addWidget(self.slider)
 
@@ -260,6 +343,60 @@ class VisualArray(MainWindow):
 
         # End of slider
 
+        # Input Distribution Menu
+
+        self.distribution_selector = QPushButton(' '.join(self.distribution.split('_')).title())
+
+        self.distribution_selector.setFixedSize(95, 13)
+
+        self.distribution_selector.setToolTip("Creates a new array of the selected input distribution")
+
+        self.distribution_selector.setFont(QFont("Monaco", 9, QFont.Monospace))
+
+        self.tool_bar.addWidget(self.distribution_selector)
+
+        distributions: QMenu = QMenu()
+
+        for i in GENERATORS:
+            distributions.addAction(' '.join(i.split('_')).title()).setData(i)
+
+        self.distribution_selector.setMenu(distributions)
+
+        def distribution_handler(selected: any) -> None:
+            self.distribution = selected.data()
+            self.distribution_selector.setText(selected.text())
+
+            self.change_size(self.sample_size)
+
+        distributions.triggered.connect(distribution_handler)
+
+        self.seed_box = QSpinBox()
+
+        self.seed_box.setToolTip("Seed of the generated inputs, the same seed always creates the same array")
+
+        self.seed_box.setRange(-1, 2 ** 31 - 1)
+
+        self.seed_box.setSpecialValueText("Seed: Random")
+
+        self.seed_box.setPrefix("Seed: ")
+
+        self.seed_box.setFixedSize(110, 15)
+
+        self.seed_box.setValue(-1 if self.seed is None else self.seed)
+
+        def change_seed(value: int) -> None:
+            self.seed = None if value < 0 else value
+
+            self.change_size(self.sample_size)
+
+        self.seed_box.valueChanged.connect(change_seed)
+
+        self.tool_bar.addWidget(self.seed_box)
+
+        self.tool_bar.addSeparator()
+
+        # End of distribution menu
+
         # Color Pickers
 
         self.create_button(self.bar_color_picker,
@@ -314,7 +451,7 @@ class VisualArray(MainWindow):
         self.algorithm_selector.setMenu(menu)
 
         def menu_handler_main(selected: any) -> None:
-            self.clear_cache()
+            self.clear_highlights()
 
             self.start() if self.running else ...
 
@@ -325,13 +462,73 @@ class VisualArray(MainWindow):
             self.algorithm_selector.setText(' '.join(name.split('_')) if len(name) < 15
                                             else ''.join(_str[0] for _str in name.split('_')))
 
-            self.algorithm(self)
-            self.end_sort()
+            self.stop_replay()
+            self.run_algorithm()
 
         menu.triggered.connect(menu_handler_main)
 
         # End of dropdown menu
 
+        # Operation Counters
+
+        self.stats_label = QLabel()
+
+        self.stats_label.setToolTip("Comparisons, reads, writes, swaps, selections and slice copies of the sorting "
+                                    "algorithm, the reads, writes and peak elements of its auxiliary buffers, "
+                                    "and its operations per second")
+
+        self.stats_label.setFont(QFont("Monaco", 9, QFont.Monospace))
+
+        self.tool_bar.addWidget(self.stats_label)
+
+        self.show_counts()
+
+        self.tool_bar.addSeparator()
+
+        # End of operation counters
+
+        # Pace Controls
+
+        self.fps_box: QSpinBox = QSpinBox()
+
+        self.fps_box.setToolTip("Number of frames drawn per second")
+
+        self.fps_box.setRange(1, 240)
+
+        self.fps_box.setPrefix("FPS: ")
+
+        self.fps_box.setFixedSize(75, 15)
+
+        self.fps_box.setValue(self.governor.fps)
+
+        self.fps_box.valueChanged.connect(lambda __value: self.governor.configure(fps=__value))
+
+        self.tool_bar.addWidget(self.fps_box)
+
+        self.rate_box: QSpinBox = QSpinBox()
+
+        self.rate_box.setToolTip("Number of operations shown per second, coalesced into the frames")
+
+        self.rate_box.setRange(0, 10_000_000)
+
+        self.rate_box.setStepType(QAbstractSpinBox.AdaptiveDecimalStepType)
+
+        self.rate_box.setSpecialValueText("Ops/s: Unlimited")
+
+        self.rate_box.setPrefix("Ops/s: ")
+
+        self.rate_box.setFixedSize(130, 15)
+
+        self.rate_box.setValue(self.governor.ops_per_second)
+
+        self.rate_box.valueChanged.connect(lambda __value: self.governor.configure(ops_per_second=__value))
+
+        self.tool_bar.addWidget(self.rate_box)
+
+        self.tool_bar.addSeparator()
+
+        # End of pace controls
+
         # Only Positive Attribute
 
         self.only_positive_button = QAction(f"Only Positive: {self.only_positive}", self)
@@ -359,8 +556,7 @@ class VisualArray(MainWindow):
         def change_eco() -> None:
             self.economical = not self.economical
             self.eco_button.setText(f"Efficient: {self.economical}")
-            for __i in self.cache:
-                self.load_bar(self._bar_objects[__i])
+            self.clear_highlights()
 
         self.eco_button.triggered.connect(change_eco)
 
@@ -368,48 +564,319 @@ class VisualArray(MainWindow):
 
         # End of efficiency button
 
+        # Recording Button
+
+        self.record_button = QAction(f"Recorded: {self.recorded}", self)
+
+        self.record_button.setToolTip("Runs the sorting algorithm on a worker thread and replays its operations")
+
+        def change_recorded() -> None:
+            self.recorded = not self.recorded
+            self.record_button.setText(f"Recorded: {self.recorded}")
+
+        self.record_button.triggered.connect(change_recorded)
+
+        self.tool_bar.addAction(self.record_button)
+
+        # End of recording button
+
+        # Aggregation Button
+
+        self.aggregation_button = QAction(f"Columns: {self.aggregation.title()}", self)
+
+        self.aggregation_button.setToolTip("Value shown by a pixel column when the elements outnumber the pixels")
+
+        def change_aggregation() -> None:
+            self.set_aggregation(AGGREGATIONS[(AGGREGATIONS.index(self.aggregation) + 1) % len(AGGREGATIONS)])
+            self.aggregation_button.setText(f"Columns: {self.aggregation.title()}")
+            self.render()
+
+        self.aggregation_button.triggered.connect(change_aggregation)
+
+        self.tool_bar.addAction(self.aggregation_button)
+
+        # End of aggregation button
+
+        # Profiling Buttons
+
+        self.profile_button = QAction(f"Profiled: {self.profiler is not None}", self)
+
+        self.profile_button.setToolTip("Times the algorithm, painting, event handling and waiting of the next runs")
+
+        def change_profiled() -> None:
+            self.profiler = None if self.profiler else Profiler(ALGORITHM if self.is_algo_running else EVENTS)
+            self.profile_button.setText(f"Profiled: {self.profiler is not None}")
+
+        self.profile_button.triggered.connect(change_profiled)
+
+        self.tool_bar.addAction(self.profile_button)
+
+        self.create_button(self.print_profile,
+                           "Prints the profile of the current or last run",
+                           "Profile Report",
+                           separate=False)
+
+        # End of profiling buttons
+
+        # Sound Button
+
+        self.sound_button = QAction("Sound: False", self)
+
+        self.sound_button.setToolTip("Plays the accessed values of recorded runs on the audio device, "
+                                     "higher values sound higher")
+
+        def change_sound() -> None:
+            self.sonifier = None if self.sonifier else Sonifier(self.highest_value(), self.only_positive, live=True)
+
+            if self.sonifier and not self.sonifier.output.available:
+                self.sonifier = None
+                self.sound_button.setText("Sound: No Device")
+                return
+
+            self.sound_button.setText(f"Sound: {self.sonifier is not None}")
+
+        self.sound_button.triggered.connect(change_sound)
+
+        self.tool_bar.addAction(self.sound_button)
+
+        # End of sound button
+
     def swap(self, i: int, j: int) -> None:
         """Efficient swap of elements between i and j"""
 
-        self._bar_objects[i], self._bar_objects[j] = \
-            self.bar_at(self[j], i), self.bar_at(self[i], j)
+        if not self.running and not self.wait_while_paused():
+            quit()
+
+        first, second = self._values[i], self._values[j]
+
+        self.bar_at(second, i)
+        self.bar_at(first, j)
+
+        if not self.economical:
+            self.highlight(i)
+            self.highlight(j)
 
-        ticker(self.update)
+        self.counts[SWAP] += 1
+
+        self.tick()
+
+    def buffer(self, size: int) -> AuxBuffer:
+        """Allocates an auxiliary buffer of size zeroed elements, drawn in the lane over the array.
+        Its reads and writes are counted apart from those of the array"""
+
+        if not self.running and not self.wait_while_paused():
+            quit()
+
+        self.counts[AUX_ALLOC] += 1
+
+        return AuxBuffer(self, self.allocate_aux(size), size)
+
+    def release(self, buffer: AuxBuffer) -> None:
+        """Releases an auxiliary buffer, called by AuxBuffer.release()"""
+
+        self.counts[AUX_FREE] += 1
+
+        self.free_aux(buffer.start)
+
+    def aux_read(self, index: int) -> Bar:
+        """Returns the Bar at the given lane index"""
+
+        if not self.running and not self.wait_while_paused():
+            quit()
+
+        self.counts[AUX_READ] += 1
+
+        self.tick()
+
+        return Bar(self.lane.values[index], self.counts)
+
+    def aux_write(self, index: int, new_val: Union[Bar, int]) -> None:
+        """Changes the value at the given lane index, internally and visually"""
+
+        if not self.running and not self.wait_while_paused():
+            quit()
+
+        self.aux_at(new_val, index)
+
+        self.counts[AUX_WRITE] += 1
+
+        self.tick()
+
+    def render(self) -> None:
+        """Draws the frame and shows the operation counters"""
+
+        super().render()
+
+        self.show_counts() if self.stats_label else ...
+
+        self.show_position() if self.timeline else ...
+
+    def show_counts(self) -> None:
+        """Writes the operation counters and the operations per second in the tool bar"""
+
+        now: float = perf_counter()
+        total: int = sum(self.counts)
+
+        if _STATS_INTERVAL <= now - self._stats_mark[0]:
+            self._ops_per_second = max(0, total - self._stats_mark[1]) / (now - self._stats_mark[0])
+            self._stats_mark = (now, total)
+
+        counts: array = self.counts
+
+        self.stats_label.setText(f"Cmp {counts[COMPARE]:,}  R {counts[READ]:,}  W {counts[WRITE]:,}  "
+                                 f"Sw {counts[SWAP]:,}  Sel {counts[SELECT]:,}  Alloc {counts[ALLOC]:,}  "
+                                 f"Aux R {counts[AUX_READ]:,} W {counts[AUX_WRITE]:,} Peak {self.lane.peak:,}  "
+                                 f"| {self._ops_per_second:,.0f} ops/s"
+                                 + (f"  | Cache {self.cache.hit_rate:.0%} hits, "
+                                    f"{(self.cache.memory_bytes + self.cache.disk_bytes) / (1 << 20):,.1f} MB"
+                                    if self.cache is not None else ""))
+
+    def show_position(self) -> None:
+        """Moves the timeline to the position of the replay, without seeking"""
+
+        player: Union[Player, None] = self.player or self.history
+
+        self.timeline.blockSignals(True)
+
+        self.timeline.setDisabled(player is None)
+        self.timeline.setRange(0, len(player.log) if player else 0)
+        self.timeline.setValue(player.position if player else 0)
+
+        self.timeline.blockSignals(False)
+
+    def scrub(self) -> Union[Player, None]:
+        """Pauses the replay and returns its player, a finished replay is resumed at its end.
+        Returns None if there is no replay"""
+
+        self.finish_sweep()
+
+        if self.player is None and self.history is not None:
+            self.player, self.finished, self.is_algo_running = self.history, False, True
+
+        if self.player and self.running:
+            self.start()
+
+        return self.player
+
+    def seek(self, position: int) -> None:
+        """Pauses the replay and shows the array after its first position operations"""
+
+        player: Union[Player, None] = self.scrub()
+
+        player.seek(position) if player else ...
+
+    def step_back(self) -> None:
+        """Pauses the replay and undoes its last operation"""
+
+        player: Union[Player, None] = self.scrub()
+
+        player.step_back() if player else ...
+
+    def step_forward(self) -> None:
+        """Pauses the replay and plays its next operation, the last one finishes the replay"""
+
+        player: Union[Player, None] = self.scrub()
+
+        player.step(1) if player else ...
+
+    def highest_value(self) -> int:
+        """Returns the highest absolute value of the array, the value of the highest pitch"""
+
+        return max(1, max(map(abs, self._values), default=1))
+
+    def print_profile(self) -> None:
+        """Prints the profile of the current or last run, if profiling"""
+
+        if self.profiler:
+            name: str = ' '.join(self.algorithm.__name__.title().split('_')) if self.algorithm else "Run"
+            print(f"{name}, {len(self)} elements\n{self.profiler.report()}\n")
+
+    def reset_counts(self) -> None:
+        """Sets every operation counter to 0 and restarts the operations per second"""
+
+        super().reset_counts()
+
+        self._stats_mark, self._ops_per_second = (perf_counter(), 0), 0
 
     def clear(self) -> None:
-        [self.bar_at(self._bar_objects[i], i) for i in range(len(self))]
+        self.load_bars()
 
-        self.update()
+        self.render()
 
     def end_sort(self) -> None:
-        """Called at the end of the sorting algorithm"""
+        """Called at the end of the sorting algorithm, shows the error instead if the recorded algorithm failed"""
 
-        self.clear_cache()
-        self.clear()
+        if self.player and self.player.error is not None:
+            self.fail(self.player.error)
+            return
 
-        for i in range(len(self) - 1):
-            self.nu_fill(self._bar_objects[i], self.selection_color)
-            self.nu_fill(self._bar_objects[i + 1], self.access_color)
+        self.print_profile()
 
-            if not i % 5:
-                self.update()
+        if self.cache_key and self.player and self.player.is_finished():
+            self.cache.put(self.cache_key, self.player.log, algorithm=self.algorithm.__name__)
 
-        self.clear()
+        self.cache_key = self.player = None
 
         self.running = self.is_algo_running = False
         self.finished = True
 
         self.set_slider_active(True)
 
+        self.clear_highlights()
+        self.clear()
+
+        self._sweep_done = 0
+
+        self._sweep_timer.setInterval(max(1, round(self.governor.interval * 1000)))
+        self._sweep_timer.start()
+
+    def _sweep_frame(self) -> None:
+        """Draws the columns of the end-of-sort sweep due by the current frame, the last frame redraws the bars"""
+
+        step: int = -(-len(self) // self._column_count)  # Elements per column.
+        columns: int = len(range(0, len(self) - step, step))
+
+        due: int = min(columns, self._sweep_done + max(5, -(-columns // _SWEEP_FRAMES)))
+
+        for i in range(self._sweep_done * step, due * step, step):
+            self.paint(i, SELECTION)
+            self.paint(i + step, ACCESS)
+
+        self._sweep_done = due
+
+        if due == columns:
+            self.finish_sweep()
+            return
+
+        self.render()
+
+    def finish_sweep(self) -> None:
+        """Ends the end-of-sort sweep and redraws the bars, if one is running"""
+
+        if self._sweep_timer.isActive():
+            self._sweep_timer.stop()
+            self.clear()
+
+    def fail(self, error: Exception) -> None:
+        """Ends a recorded run whose algorithm raised the error, the array is left as the algorithm left it"""
+
+        print_exception(error)
+
+        self.stats_label.setText(f"{self.algorithm.__name__} failed: {type(error).__name__}: {error}") \
+            if self.stats_label else ...
+
+        self.cache_key = self.player = None
+
+        self.running = self.is_algo_running = self.finished = False
+
+        self.set_slider_active(True)
+
     @staticmethod
     def check_given_values(values: list[int]) -> bool:
         if not values:
             return False
 
-        assert _WR_FACTORS[0] <= len(values) <= _resolution[
-            0], f"len(values) larger than resolution width ({_resolution[0]}) " \
-                f"or less than minimum allowable ({_WR_FACTORS[0]})"
-        assert not (_resolution[0] % len(values)), f"resolution width ({_resolution[0]}) not divisible by len(values)"
+        assert 2 <= len(values), f"len(values) ({len(values)}) less than 2"
         return True
 
     @staticmethod
@@ -417,29 +884,83 @@ class VisualArray(MainWindow):
         if sample_size is None:
             return
 
-        assert _WR_FACTORS[0] <= sample_size, f"sample_size was not given or less than minimum allowable ({_WR_FACTORS[0]})"
-        assert sample_size <= _resolution[0], f"sample size larger than resolution width ({_resolution[0]})"
-        assert not (_resolution[0] % sample_size), f"resolution width ({_resolution[0]}) not divisible by sample_size"
+        assert 2 <= sample_size, f"sample_size ({sample_size}) less than 2"
 
     def shuffle(self) -> None:
-        """Shuffles the array (in real time) and restarts the sorting algorithm"""
+        """Shuffles the array by a single permutation of its values, drawn at once,
+        or animated over self.shuffle_duration seconds of frames without blocking the window"""
+
+        self.stop_replay()
 
         self.finished = False
 
+        self.running = False
+
+        self.reset_counts()
+
+        self.clear_highlights()
+
+        if self.shuffle_duration <= 0:
+            values: list[int] = self._values.tolist()
+            shuffle(values)
+
+            self.load_permutation(values)
+            self.clear()
+            return
+
+        self._shuffle_swaps = array('i', [randrange(i + 1) for i in range(len(self) - 1, 0, -1)])
+        self._shuffle_done, self._shuffle_began = 0, perf_counter()
+
+        self.is_algo_running = True
+
         self.set_slider_active(False)
 
-        self.running = self.is_algo_running = True
+        self._shuffle_timer.setInterval(max(1, round(self.governor.interval * 1000)))
+        self._shuffle_timer.start()
 
-        shuffle(self)
+    def _shuffle_frame(self, finish: bool = False) -> None:
+        """Draws the swaps of the animated shuffle due by the current frame, every remaining swap if finish"""
 
-        self.running = self.is_algo_running = False
+        swaps: array = self._shuffle_swaps
+        values: array = self._values
+        last: int = len(values) - 1
 
-        self.set_slider_active(True)
+        due: int = len(swaps) if finish else \
+            round(len(swaps) * min(1.0, (perf_counter() - self._shuffle_began) / self.shuffle_duration))
+
+        for k in range(self._shuffle_done, due):
+            i, j = last - k, swaps[k]
+            first, second = values[i], values[j]
 
-        self.clear_cache()
+            self.bar_at(second, i)
+            self.bar_at(first, j)
+
+            self.highlight(j) if not self.economical and not finish else ...
+
+        self._shuffle_done = due
+
+        if due == len(swaps):
+            self._shuffle_timer.stop()
+            self._shuffle_swaps = array('i')
+
+            self.is_algo_running = False
+
+            self.set_slider_active(True)
+
+            self.clear_highlights()
+            return
+
+        self.render()
+
+    def finish_shuffle(self) -> None:
+        """Draws the rest of the animated shuffle at once, if one is running"""
+
+        self._shuffle_frame(True) if self._shuffle_timer.isActive() else ...
 
     def start(self) -> None:
-        """Starts / Pauses / Resumes the sorting algorithm or shuffle"""
+        """Starts / Pauses / Resumes the sorting algorithm, an animated shuffle is finished first"""
+
+        self.finish_shuffle()
 
         if self.finished:
             self.end_sort()
@@ -449,17 +970,91 @@ class VisualArray(MainWindow):
 
         self.set_slider_active(not self.running)
 
-        if not self.is_algo_running and self.algorithm:
-            self.is_algo_running = True
-            self.algorithm(self)
-            self.end_sort()
+        if self.player:
+            self.player.play() if self.running else self.player.pause()
+
+        elif not self.is_algo_running and self.algorithm:
+            self.run_algorithm()
+
+    def run_algorithm(self) -> None:
+        """Runs the current sorting algorithm on a worker thread and replays its operations as they arrive,
+        or replays the cached log of the same algorithm on the same values.
+        If not recorded, runs it directly on the array"""
+
+        self.is_algo_running = True
+
+        self.reset_counts()
+
+        if self.recorded:
+            values: list[int] = self._values.tolist()
+
+            key: Union[str, None] = cache_key(self.algorithm, values, only_positive=self.only_positive,
+                                              economical=self.economical) if self.cache is not None else None
+
+            log: Union[OpLog, None] = self.cache.get(key) if self.cache is not None else None
+
+            if log is not None:
+                self.replay(log)
+                return
+
+            source: RecordingThread = RecordingThread(self.algorithm, values, only_positive=self.only_positive,
+                                                      economical=self.economical)
+            source.start()
+
+            self.replay(OpLog(values, self.only_positive), source)
+
+            self.cache_key = key
+            return
+
+        self.profiler.reset(ALGORITHM) if self.profiler else ...
+
+        self.algorithm(self)
+        self.end_sort()
+
+    def replay(self, log: OpLog, source: RecordingThread = None) -> None:
+        """Loads the initial values of the log and animates it, the replay follows Start / Pause.
+        Records streamed by the source are appended to the log while it plays"""
+
+        assert len(log.initial) == len(self), f"log size ({len(log.initial)}) differs from array size ({len(self)})"
+
+        self.stop_replay()
+
+        self.load_values(log.initial)
+
+        self.clear()
+
+        self.is_algo_running = True
+
+        self.reset_counts()
+
+        self.profiler.reset(EVENTS) if self.profiler else ...
+
+        self.sonifier.set_range(self.highest_value(), self.only_positive) if self.sonifier else ...
+
+        self.log = log
+
+        self.player = self.history = Player(self, log, self.end_sort, source)
+
+        self.player.play() if self.running else ...
+
+    def stop_replay(self) -> None:
+        """Stops and discards the current replay, an animated shuffle or end-of-sort sweep is finished first"""
+
+        self.finish_shuffle()
+        self.finish_sweep()
+
+        if self.player:
+            self.player.stop()
+            self.player = None
+            self.is_algo_running = False
+
+        self.history = self.cache_key = None
 
     def rand_values(self) -> list[int]:
-        """Returns an list of random values"""
+        """Returns a list of values of the current distribution, scaled to the height of the screen"""
 
-        return rand_array(1, _resolution[1], self.sample_size, self.true_random) \
-            if self.only_positive else \
-            rand_array(-_resolution[1] // 2 + 1, _resolution[1] // 2 - 1, self.sample_size, self.true_random)
+        return scale(generate(self.distribution, self.sample_size, self.seed), self.sample_size,
+                     self.canvas_size[1], self.only_positive)
 
     def set_slider_active(self, state: bool) -> None:
         """Disables and enables the slider"""
@@ -467,71 +1062,55 @@ class VisualArray(MainWindow):
         self.slider.setDisabled(not state)
         self.slider.setUpdatesEnabled(state)
         self.algorithm_selector.setDisabled(not state)
+        self.distribution_selector.setDisabled(not state)
+        self.seed_box.setDisabled(not state)
         self.only_positive_button.setDisabled(not state)
+        self.record_button.setDisabled(not state)
 
     def change_size(self, size: int) -> None:
         """Creates a new array with the given size"""
 
-        self.cache.clear()
+        self.stop_replay()
 
         self.finished = False
 
         self.sample_size = size
 
-        is_separated: bool = True
-
-        bar_width: int = _resolution[0] // self.sample_size - is_separated
-
-        if bar_width < 1:
-            bar_width, is_separated = 1, False
+        self.load_geometry(size)
 
-        self.bar_width, self.is_separated = bar_width, is_separated
+        self.load_values(self.rand_values())
 
-        self._bar_objects[::] = self.rand_values()
-
-        for i in range(len(self._bar_objects)):
-            self._bar_objects[i] = self.bar_at(self._bar_objects[i], i)
+        self.clear()
 
         self.running = self.is_algo_running = False
 
-        self.cache_counter: int = max(_WR_FACTORS[0] // 8, len(self) // 40)
-
-        self.update()
-
         return
 
-    def color_selector(self, element: int) -> None:
-        """Color wheel widget used to change the color of elements on display"""
+    def color_selector(self, state: int) -> None:
+        """Color wheel widget used to change the color of elements on display.
+        Every color picked is a palette swap, cancelling the wheel restores the previous color"""
 
         was_running: bool = self.running
 
         self.start() if self.running else ...
 
-        attrs: tuple[str, str, str, str] = ("bar_color", "color", "access_color", "selection_color")
-
-        self.color_wheel.show()
+        previous: QColor = self.palette_color(state)
 
-        self.color_wheel.setCurrentColor(super().__getattribute__(attrs[element]))
+        def pick(color: QColor) -> None:
+            self.set_color(state, color)
+            self.render()
 
-        while not self.color_wheel.isHidden():
-            super().__setattr__(attrs[element], self.color_wheel.currentColor())
+        self.color_wheel.setDisabled(False)
+        self.color_wheel.setUpdatesEnabled(True)
+        self.color_wheel.setCurrentColor(previous)
 
-            if element == 2 and not self.economical:
-                for i in self.cache:
-                    self.nu_fill(self._bar_objects[i], self.access_color)
+        self.color_wheel.currentColorChanged.connect(pick)
 
-            else:
-                self.clear_cache() if self.economical and element == 3 else ...
+        accepted: bool = bool(self.color_wheel.exec_())
 
-                for i in range(len(self)):
-                    if i in self.cache:
-                        self.bar_at(self._bar_objects[i], i)
-                        self.nu_fill(self._bar_objects[i], self.access_color)
-                        continue
+        self.color_wheel.currentColorChanged.disconnect(pick)
 
-                    self.bar_at(self._bar_objects[i], i)
-
-            self.update()
+        pick(self.color_wheel.currentColor() if accepted else previous)
 
         self.start() if was_running else ...
         self.color_wheel.setDisabled(True)
@@ -543,19 +1122,19 @@ class VisualArray(MainWindow):
     def bar_color_picker(self) -> None:
         """Place-Holder function for the bar color wheel"""
 
-        return self.color_selector(0)
+        return self.color_selector(BAR)
 
     def background_color_picker(self) -> None:
         """Place-Holder function for the background color wheel"""
 
-        return self.color_selector(1)
+        return self.color_selector(BACKGROUND)
 
     def access_color_picker(self) -> None:
         """Place-Holder function for the access color"""
 
-        return self.color_selector(2)
+        return self.color_selector(ACCESS)
 
     def selection_color_picker(self) -> None:
         """Place-Holder function for the selection color"""
 
-        return self.color_selector(3)
+        return self.color_selector(SELECTION)
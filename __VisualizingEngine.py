@@ -1,85 +1,221 @@
 from __future__ import annotations
 
-from sys import argv
-from time import sleep
-
-from PyQt5.QtCore import QRect, QRunnable, pyqtSlot, QThreadPool, QIODevice
-from PyQt5.QtGui import QColor, QPen, QBrush, QPixmap, QPainter, QFont
+from array import array
+from os import environ
+from sys import argv, maxsize
+from threading import Event, current_thread, main_thread
+from time import perf_counter, sleep
+
+from PyQt5.QtCore import Qt, QRect, QEventLoop
+from PyQt5.QtGui import QColor, QImage, QPixmap, QPainter, QFont, QTransform
 from PyQt5.QtWidgets import QLabel, QApplication, QMainWindow, QAction, \
     QToolBar, QPushButton, QColorDialog
 
-from typing import Union, Callable, TypeVar
-from collections import deque
+from typing import Union, Callable, Iterable, TypeVar
 
+from __profiler import Profiler, PAINT, EVENTS, WAIT
 
-Virtual_Array = TypeVar("Virtual_Array")
+from __auxiliary import Lane
 
-app: QApplication = QApplication(argv)  # PyQt application that runs the code.
 
-app.setStyle("Fusion")  # Style of the tool bar, and its widgets.
+Virtual_Array = TypeVar("Virtual_Array")
+
+Sound = TypeVar("Sound")  # Sonifier of __sonify, which depends on this module.
 
 Color = Union[tuple[int, int, int], QColor]  # Color type used by the classes.
 
-_resolution: list[int, int] = [app.primaryScreen().size().width(),
-                               app.primaryScreen().size().height()]  # Resolution of the display in use.
+_app: Union[QApplication, None] = None  # PyQt application that runs the code, created by get_app().
+
+_resolution: list[int, int] = []  # Resolution of the display in use, filled by resolution().
+
+_HEADLESS_VARIABLE: str = "SORTING_VISUALIZER_HEADLESS"  # Environment variable enabling headless mode, "WxH".
+
+_MERGE_GAP: int = 16  # Dirty spans closer than this many pixels are repainted as one rectangle.
+
+_HIGHLIGHT_FRAMES: int = 2  # Number of frames an accessed bar stays highlighted.
+
+_LANE_SHARE: int = 4  # The auxiliary lane covers 1 / _LANE_SHARE of the top of the canvas.
+
+
+def headless(width: int = 1920, height: int = 1080) -> None:
+    """Switches to headless mode, must be called before any window is created.
+    Qt renders offscreen and the given resolution replaces the one of the primary screen"""
+
+    assert _app is None, "headless mode must be set before the QApplication is created"
+
+    environ["QT_QPA_PLATFORM"] = "offscreen"
+
+    _resolution[:] = [width, height]
+
+
+def get_app() -> QApplication:
+    """Returns the PyQt application, creates it on the first call"""
+
+    global _app
+
+    if _app is None:
+        _app = QApplication.instance() or QApplication(argv)
+
+        _app.setStyle("Fusion")  # Style of the tool bar, and its widgets.
+
+    return _app
+
+
+def resolution() -> list[int, int]:
+    """Returns the resolution in use, queries the primary screen on the first call unless headless"""
+
+    if not _resolution:
+        size = get_app().primaryScreen().size()
+
+        _resolution[:] = [size.width(), size.height()]
+
+    return _resolution
+
+
+if environ.get(_HEADLESS_VARIABLE):
+    headless(*map(int, environ[_HEADLESS_VARIABLE].lower().split('x')))
+
+
+READ, WRITE, SWAP, COMPARE, SELECT, DESELECT, ALLOC, AUX_READ, AUX_WRITE, AUX_ALLOC, AUX_FREE = \
+    range(11)  # Operation codes, used as counter indices.
+
+OP_NAMES: tuple[str, ...] = ("read", "write", "swap", "compare", "select", "deselect", "alloc",
+                             "aux_read", "aux_write", "aux_alloc", "aux_free")  # Names by code.
+
+_UNCOUNTED: array = array('q', bytes(8 * len(OP_NAMES)))  # Counters of the bars that belong to no array.
+
+_FRAMEBUFFER_COLUMNS: int = 128  # Spans drawn in a frame from which they are cut out of a single band of the screen.
+
+BACKGROUND, BAR, ACCESS, SELECTION = range(4)  # States of the pixels, their color indices in the framebuffer.
+
+AGGREGATIONS: tuple[str, ...] = ("max", "min", "last")  # Values a pixel column of several elements can show.
+
+_UNLIMITED_OPS_CHECK: int = 64  # Operations between frame deadline checks when the rate is unlimited.
+
+
+class FrameGovernor:
+    """Paces the visualization: at most fps frames are rendered per second, and at most ops_per_second
+    operations are shown per second, coalesced into those frames. An ops_per_second of 0 is unlimited"""
+
+    def __init__(self, fps: int = 60, ops_per_second: int = 0) -> None:
+        self.fps: int = fps  # Target frame rate.
+
+        self.ops_per_second: int = ops_per_second  # Target operation rate, 0 if unlimited.
+
+        self.ops_per_frame: int = 1  # Operations shown per frame at the target rates.
 
-_UPDATER: bool = False  # Update counter used by ticker.
+        self.interval: float = 0.0  # Seconds between two frames.
 
+        self._next_frame: float = 0.0  # perf_counter() at which the next frame is due.
 
-def ticker(func: Callable) -> None:
-    """Updates the display every other modification"""
+        self._last_frame: float = perf_counter()  # perf_counter() of the last frame of a replay.
 
-    global _UPDATER
-    func() if _UPDATER else ...
-    _UPDATER = not _UPDATER
+        self._credit: float = 0.0  # Fraction of an operation carried over to the next frame of a replay.
 
+        self.configure(fps, ops_per_second)
 
-class Bar(QRect):
-    """Bar class that is responsible for handling comparisons between elements of the array"""
-    def __init__(self, value: int, index: int, width: int, is_separated: bool, is_positive: bool) -> None:
-        """Initializes a QRect object using the appropriate coordinates and dimensions, based on the provided values.
-           Gives the bar its actual value, and draws it on the canvas, WITHOUT UPDATING THE SCREEN.
-        """
+    def configure(self, fps: int = None, ops_per_second: int = None) -> None:
+        """Changes the target frame rate and / or operation rate"""
 
-        if not value:
-            value += 1
+        self.fps = self.fps if fps is None else max(1, fps)
+        self.ops_per_second = self.ops_per_second if ops_per_second is None else max(0, ops_per_second)
 
-        super().__init__(index * (width + is_separated), _resolution[1] - int(value), width - is_separated, int(value)) \
-            if is_positive else \
-            super().__init__(index * (width + is_separated),
-                             _resolution[1] // 2 - (int(value) if 0 < int(value) else 0), width - is_separated,
-                             abs(value))
+        self.interval = 1 / self.fps
+        self.ops_per_frame = max(1, round(self.ops_per_second / self.fps)) if self.ops_per_second \
+            else _UNLIMITED_OPS_CHECK
+
+    def restart(self) -> None:
+        """Starts counting from now, time spent paused is not credited to the next frame"""
+
+        self._last_frame = self._next_frame = perf_counter()
+        self._credit = 0.0
+
+    def wait_for_frame(self) -> bool:
+        """Called once ops_per_frame operations have been done, returns True if a frame is to be rendered.
+        Sleeps until the frame is due if the operation rate is limited"""
+
+        now: float = perf_counter()
+
+        if now < self._next_frame:
+            if not self.ops_per_second:
+                return False
+
+            sleep(self._next_frame - now)
+            now = self._next_frame
+
+        self._next_frame = max(self._next_frame + self.interval, now)
+        return True
+
+    def frame_budget(self) -> int:
+        """Returns the number of operations the current frame of a replay shows, based on the time elapsed"""
+
+        if not self.ops_per_second:
+            return maxsize
+
+        now: float = perf_counter()
+
+        self._credit += min(now - self._last_frame, 4 * self.interval) * self.ops_per_second
+        self._last_frame = now
+
+        ops: int = int(self._credit)
+        self._credit -= ops
+
+        return ops
+
+
+class Bar:
+    """Bar class that is responsible for handling comparisons between elements of the array.
+    Bars are handed to the sorting algorithms on access, the array itself only stores their values"""
+
+    __slots__ = ("val", "counts")
+
+    def __init__(self, value: int, counts: array = None) -> None:
+        """Gives the bar its actual value, and the operation counters its comparisons are counted in"""
 
         self.val: int = value
 
+        self.counts: array = _UNCOUNTED if counts is None else counts
+
     def __eq__(self, other: Union[Bar, int]) -> bool:
         """Equality operation between a bar and another bar, or an int"""
 
+        self.counts[COMPARE] += 1
+
         return self.val == (other.val if isinstance(other, Bar) else other)
 
     def __ne__(self, other: Union[Bar, int]) -> bool:
         """Non-equality operation between a bar and another bar, or an int"""
 
+        self.counts[COMPARE] += 1
+
         return self.val != (other.val if isinstance(other, Bar) else other)
 
     def __lt__(self, other: Union[Bar, int]) -> bool:
         """Less-than operation between a bar and another bar, or an int"""
 
+        self.counts[COMPARE] += 1
+
         return self.val < (other.val if isinstance(other, Bar) else other)
 
     def __gt__(self, other: Union[Bar, int]) -> bool:
         """Greater-than operation between a bar and another bar, or an int"""
 
+        self.counts[COMPARE] += 1
+
         return self.val > (other.val if isinstance(other, Bar) else other)
 
     def __le__(self, other: Union[Bar, int]) -> bool:
         """Less-than-or-equal operation between a bar and another bar, or an int"""
 
+        self.counts[COMPARE] += 1
+
         return self.val <= (other.val if isinstance(other, Bar) else other)
 
     def __ge__(self, other: Union[Bar, int]) -> bool:
         """Greater-than-or-equal operation between a bar and another bar, or an int"""
 
+        self.counts[COMPARE] += 1
+
         return self.val >= (other.val if isinstance(other, Bar) else other)
 
     def __add__(self, other: Union[Bar, int]) -> int:
@@ -183,44 +319,27 @@ class Bar(QRect):
         return float(self.val)
 
     def __str__(self) -> str:
-        """Returns the string representation of QRect"""
-
-        return super().__str__()
+        """Returns the string representation of self.val"""
 
+        return str(self.val)
 
-class ThreadedTask(QRunnable):
-    """Class responsible for multi-threading of tasks"""
+    def __repr__(self) -> str:
+        """Returns the representation of the bar"""
 
-    def __init__(self, parent, func: Callable, *args, **kwargs) -> None:
-        super(ThreadedTask, self).__init__()
-        self.func: Callable = func
-        self.args: list = list(args)  # Args to be given to the threaded function.
-        self.kwargs: dict = kwargs  # Keyword Args to be given to the threaded function.
-        self.parent: Virtual_Array = parent  # VisualArray that is used to determine when to pause the thread.
-
-    @pyqtSlot()
-    def run(self) -> None:
-        """Function that is called once the thread is started by the thread pool of the visual array"""
-
-        while not self.parent.running:
-            app.processEvents()
-
-        """This try-statement is used to make sure that cache collisions are inconsequential. 
-        These collisions occur once the sorting algorithm is paused and then the size is changed."""
-
-        try:
-            self.func(*self.args, **self.kwargs)
-
-        except IndexError:
-            return
+        return f"Bar({self.val})"
 
 
 class MainWindow(QMainWindow):
     """This class is responsible for handling the visualization of the different elements of the visual array"""
 
     def __init__(self, color: Color, bar_color: Color, access_color: Color,
-                 selection_color: Color, bar_width: int, is_separated: bool,
-                 only_positive: bool, no_toolBar: bool, delay: float) -> None:
+                 selection_color: Color, is_separated: bool,
+                 only_positive: bool, no_toolBar: bool, delay: float, fps: int, profile: bool = False,
+                 size: tuple[int, int] = None) -> None:
+        get_app()  # The application has to exist before any widget.
+
+        _resolution: list[int, int] = list(size or resolution())
+
         super().__init__()
 
         if not no_toolBar:  # Does not have any effect in the app.
@@ -236,31 +355,95 @@ class MainWindow(QMainWindow):
 
         """Other attributes"""
 
+        self.canvas_size: tuple[int, int] = (_resolution[0], _resolution[1])  # Width and height of the canvas.
+
         self.label: QLabel = QLabel()  # Label of the MainWindow objects
 
         self.canvas: QPixmap = QPixmap(_resolution[0], _resolution[1])  # Canvas used to display the elements on.
 
-        self.thread_pool: QThreadPool = QThreadPool()  # Thread pool responsible for handling threads.
-
         self.label.setPixmap(self.canvas)
 
         self.setCentralWidget(self.label)  # Centers the canvas.
 
-        self.bar_width: int = bar_width  # Bar width of the canvas.
+        self.bar_width: int = 1  # Width of the narrowest column, set by load_geometry().
+
+        self._values: array = array('i')  # Values of the bars.
+
+        self._x_offsets: array = array('i')  # X coordinate of each column, followed by the right edge.
+
+        self._column_count: int = 1  # Number of columns drawn, one per element unless wider than the screen.
+
+        self._aggregated: bool = False  # True if the columns show several elements each.
+
+        self.aggregation: str = AGGREGATIONS[0]  # Value an aggregated column shows, one of AGGREGATIONS.
+
+        self._column_values: array = array('i')  # Value shown by each aggregated column.
+
+        self._stale: set[int] = set()  # Aggregated columns whose value has to be recomputed before drawing.
+
+        self.separate: bool = is_separated  # Indicates whether the bars are to be separated when wide enough.
 
         self.is_separated: bool = is_separated  # Indicates whether the bars are separated or not.
 
         self.only_positive: bool = only_positive  # Indicates whether the array contains only positive values.
 
-        self.cache: deque = deque()  # Cache used to store access bars.
+        self.frame: int = 0  # Number of frames rendered so far.
+
+        self.highlight_frames: int = _HIGHLIGHT_FRAMES  # Number of frames an accessed bar stays highlighted.
+
+        self._accessed_at: array = array('q')  # Frame in which each column was last accessed.
+
+        self._highlighted: set[int] = set()  # Columns currently highlighted as accessed.
+
+        self._columns: dict[int, int] = {}  # States of the columns to be drawn in the next frame.
+
+        self._fills: list[tuple[QRect, int]] = []  # Other rectangles to be filled in the next frame, by state.
+
+        self._dirty: list[tuple[int, int]] = []  # X spans drawn on since the last update, [left, right).
+
+        self.framebuffer_columns: int = _FRAMEBUFFER_COLUMNS  # Spans per frame from which a single band is cut.
+
+        self._framebuffer: Union[QImage, None] = None  # The screen as the state of each pixel, an indexed image.
+
+        self._pixels: memoryview = memoryview(b"")  # Writable view of the pixels of the framebuffer, row by row.
+
+        self._palette: list[QColor] = [QColor()] * 4  # Color of each state, the color table of the framebuffer.
+
+        self._runs: list[memoryview] = []  # Column of framebuffer height filled with each state.
+
+        self.delay: float = delay  # Artificial delay per operation to slow down the sorting, 0 for none.
+
+        self.governor: FrameGovernor = FrameGovernor(fps, round(1 / delay) if delay else 0)  # Paces the frames.
+
+        self._frame_ops: int = 0  # Operations done since the last frame.
+
+        self.counts: array = array('q', bytes(8 * len(OP_NAMES)))  # Number of operations by operation code.
+
+        self.profiler: Union[Profiler, None] = Profiler() if profile else None  # Times the phases of a run.
 
-        self.delay: float = delay  # Artificial delay to slow down the sorting.
+        self.sonifier: Union[Sound, None] = None  # Plays the accessed values of replayed frames, if set.
+
+        self.lane: Lane = Lane()  # Auxiliary buffers of the running algorithm.
+
+        self._lane_view: Union[QLabel, None] = None  # Draws the lane over the top of the canvas, made when needed.
+
+        self._lane_columns: dict[int, int] = {}  # Values of the lane columns to be drawn in the next frame.
+
+        self._resumed: Event = Event()  # Set while running, threads wait on it while paused.
+
+        self._pause_loops: list[QEventLoop] = []  # Event loops the GUI thread waits in while paused.
+
+        self._resume_requested: float = 0.0  # perf_counter() of the last resume.
+
+        self.resume_latency: float = 0.0  # Seconds between the last resume and the algorithm continuing.
+
+        self.running = False  # Indicates whether the executed function is paused.
 
         """Color attributes"""
 
         self.color_wheel: QColorDialog = QColorDialog()
 
-        self.color: QColor = QColor(*color)
+        self.color: QColor = QColor(*color)  # Colors of the palette, setting one is a palette swap.
 
         self.access_color: QColor = QColor(*access_color)
 
@@ -268,72 +451,624 @@ class MainWindow(QMainWindow):
 
         self.bar_color: QColor = QColor(*bar_color)
 
-    def bar_at(self, value: Union[Bar, int], index: int) -> Bar:
-        """Erases the contents at the given index.
-        Creates and loads a bar object of value := value at the given index"""
+    color = property(lambda self: self._palette[BACKGROUND], lambda self, color: self.set_color(BACKGROUND, color),
+                     doc="Background color")
+
+    bar_color = property(lambda self: self._palette[BAR], lambda self, color: self.set_color(BAR, color),
+                         doc="Color of the bars")
+
+    access_color = property(lambda self: self._palette[ACCESS], lambda self, color: self.set_color(ACCESS, color),
+                            doc="Color of the accessed bars")
+
+    selection_color = property(lambda self: self._palette[SELECTION],
+                               lambda self, color: self.set_color(SELECTION, color), doc="Color of the selected bars")
+
+    @property
+    def running(self) -> bool:
+        """Indicates whether the executed function is running or paused"""
+
+        return self._running
+
+    @running.setter
+    def running(self, state: bool) -> None:
+        """Pauses or resumes the executed function, waking up everything that waits on it"""
+
+        self._running = state
+
+        if not state:
+            self._resumed.clear()
+            return
+
+        self._resume_requested = perf_counter()
+        self._resumed.set()
+
+        for loop in self._pause_loops:
+            loop.quit()
 
-        return self.load_bar(Bar(int(value), index, self.bar_width, self.is_separated, self.only_positive))
+    def wait_while_paused(self) -> bool:
+        """Blocks the caller while paused, without polling.
+        The GUI thread keeps handling events in a nested event loop, other threads sleep until resumed.
+        Returns False if the window was closed instead of resumed"""
 
-    def nu_fill(self, q_rect: Union[QRect, list, tuple], color: QColor) -> None:
-        """Fills the provided QRect object with the given color"""
+        profiler: Union[Profiler, None] = self.profiler
+        previous: int = profiler.switch(WAIT) if profiler else 0
+
+        if current_thread() is not main_thread():
+            self._resumed.wait()
+
+        else:
+            while not self._running and not self.isHidden():
+                loop: QEventLoop = QEventLoop()
+
+                self._pause_loops.append(loop)
+                loop.exec_()
+                self._pause_loops.remove(loop)
+
+        if profiler:
+            profiler.switch(previous)
+            profiler.skip_frame()
+
+        if self._running:
+            self.resume_latency = perf_counter() - self._resume_requested
+
+        return self._running
+
+    def closeEvent(self, event) -> None:
+        """Releases everything that waits while paused, so that it can exit"""
+
+        super().closeEvent(event)
+
+        self._resumed.set()
+
+        for loop in self._pause_loops:
+            loop.quit()
+
+    def load_geometry(self, size: int) -> None:
+        """Computes the columns of an array of the given size: one per element, spread over the screen width,
+        or one per pixel if there are more elements than pixels. Resets the access highlights"""
+
+        width: int = self.canvas_size[0]
+        columns: int = max(1, min(size, width))
+
+        self._column_count, self._aggregated = columns, columns < size
+
+        self.bar_width = width // columns  # Width of the narrowest column.
+
+        self.is_separated = self.separate and 3 <= self.bar_width
+
+        self._x_offsets = array('i', (c * width // columns for c in range(columns + 1)))
+
+        self._column_values = array('i', bytes(4 * columns)) if self._aggregated else array('i')
+
+        self._stale = set(range(columns)) if self._aggregated else set()
+
+        self._accessed_at = array('q', bytes(8 * columns))
+
+        self._highlighted.clear()
+
+    def load_values(self, values: Union[array, list[int]]) -> None:
+        """Replaces the values of the array, the geometry has to be loaded for their number"""
+
+        self._values = array('i', [int(value) or 1 for value in values])
+
+        self._stale = set(range(self._column_count)) if self._aggregated else set()
+
+    def load_permutation(self, values: list[int]) -> None:
+        """Replaces the values of the array by a permutation of them, which need no conversion"""
+
+        self._values = array('i', values)
+
+        self._stale = set(range(self._column_count)) if self._aggregated else set()
+
+    def column(self, index: int) -> int:
+        """Returns the column the element at the given index is drawn in"""
+
+        return index * self._column_count // len(self._values) if self._aggregated else index
+
+    def column_value(self, column: int) -> int:
+        """Returns the value shown by the given column, the aggregation of its elements"""
+
+        if not self._aggregated:
+            return self._values[column]
+
+        if column in self._stale:
+            size: int = len(self._values)
+            elements: array = self._values[-(-column * size // self._column_count):
+                                           -(-(column + 1) * size // self._column_count)]
+
+            self._column_values[column] = max(elements) if self.aggregation == "max" else \
+                min(elements) if self.aggregation == "min" else elements[-1]
+
+            self._stale.discard(column)
+
+        return self._column_values[column]
+
+    def _aggregate(self, index: int, old: int, new: int) -> None:
+        """Updates the value of the column of the element at index, whose value changes from old to new.
+        The column is only recomputed if its minimum or maximum was overwritten by a lesser one"""
+
+        column: int = index * self._column_count // len(self._values)
+
+        if self.aggregation == "last":
+            self._column_values[column] = new
+            self._stale.discard(column)
+            return
+
+        if column in self._stale:
+            return
+
+        current: int = self._column_values[column]
+
+        if (current <= new) if self.aggregation == "max" else (new <= current):
+            self._column_values[column] = new
+
+        elif old == current:
+            self._stale.add(column)
+
+    def set_aggregation(self, aggregation: str) -> None:
+        """Changes the value shown by the columns of several elements, one of AGGREGATIONS"""
+
+        assert aggregation in AGGREGATIONS, f"aggregation ({aggregation}) not one of {AGGREGATIONS}"
+
+        self.aggregation = aggregation
+
+        self._stale = set(range(self._column_count)) if self._aggregated else set()
+
+        self.load_bars()
+
+    def column_rect(self, column: int) -> QRect:
+        """Returns the rectangle of the given column, computed from its current value"""
+
+        value: int = self.column_value(column)
+        height: int = self.canvas_size[1]
+        x: int = self._x_offsets[column]
+        width: int = self._x_offsets[column + 1] - x - self.is_separated
+
+        return QRect(x, height - value, width, value) \
+            if self.only_positive else \
+            QRect(x, height // 2 - (value if 0 < value else 0), width, abs(value))
+
+    def rect_at(self, index: int) -> QRect:
+        """Returns the rectangle of the bar at the given index, computed from its current value.
+        If the elements outnumber the pixels, it is the rectangle of the column of the bar"""
+
+        return self.column_rect(self.column(index))
+
+    def bar_at(self, value: Union[Bar, int], index: int) -> None:
+        """Stores the value at the given index and draws it"""
+
+        value = int(value) or 1
+
+        if self._aggregated:
+            self._aggregate(index, self._values[index], value)
+
+        self._values[index] = value
+        self.load_bar(index)
+
+    def paint(self, index: int, state: int) -> None:
+        """Draws the bar at the given index in the given state (BAR, ACCESS or SELECTION) in the next frame.
+        Only the last state given to a column within a frame is drawn"""
+
+        self._columns[index * self._column_count // len(self._values) if self._aggregated else index] = state
+
+    def nu_fill(self, q_rect: Union[QRect, list, tuple], state: int = BACKGROUND) -> None:
+        """Fills the provided QRect object with the color of the given state in the next frame"""
 
         if isinstance(q_rect, list) or isinstance(q_rect, tuple):
             q_rect: QRect = QRect(*q_rect)
 
+        self.flush()  # Bars queued before the fill must not be drawn over by it.
+
+        self._fills.append((q_rect, state))
+
+    def flush(self) -> None:
+        """Rasterizes everything queued during the frame into the framebuffer, then draws it on the canvas:
+        a few columns are painted as rectangles, more are copied from the framebuffer"""
+
+        fills, self._fills = self._fills, []
+        columns, self._columns = self._columns, {}
+
+        if not fills and not columns:
+            return
+
+        self.load_framebuffer()
+
+        for q_rect, state in fills:
+            self.fill_framebuffer(q_rect, state)
+
+        self.rasterize(columns) if columns else ...
+
+        x_offsets: array = self._x_offsets
+        spans: list[tuple[int, int]] = [(q_rect.x(), q_rect.x() + q_rect.width()) for q_rect, _ in fills]
+
+        if len(columns) < self.framebuffer_columns:
+            self.draw_columns(columns)
+
+        else:
+            spans.extend((x_offsets[first], x_offsets[last + 1]) for first, last in self.column_runs(columns))
+
+        self.present(spans)
+
+    def draw_columns(self, columns: dict[int, int]) -> None:
+        """Paints the given columns on the canvas as rectangles of the colors of their states, grouped by state"""
+
+        x_offsets: array = self._x_offsets
+        height: int = self.canvas_size[1]
+
+        self._dirty.extend((x_offsets[c], x_offsets[c + 1]) for c in columns)
+
+        painter: QPainter = QPainter(self.label.pixmap())
+
+        painter.setPen(Qt.NoPen)  # Without an outline, a rectangle covers exactly its own pixels.
+
+        painter.setBrush(self.color)
+        painter.drawRects([QRect(x_offsets[c], 0, x_offsets[c + 1] - x_offsets[c], height) for c in columns])
+
+        groups: dict[int, list[QRect]] = {}
+
+        for c, state in columns.items():
+            groups.setdefault(state, []).append(self.column_rect(c))
+
+        for state, group in groups.items():
+            painter.setBrush(self._palette[state])
+            painter.drawRects(group)
+
+        painter.end()
+
+    @staticmethod
+    def column_runs(columns: Iterable[int]) -> list[tuple[int, int]]:
+        """Returns the runs of consecutive columns in the given columns, as (first, last) pairs"""
+
+        runs: list[tuple[int, int]] = []
+
+        for c in sorted(columns):
+            if runs and c == runs[-1][1] + 1:
+                runs[-1] = (runs[-1][0], c)
+            else:
+                runs.append((c, c))
+
+        return runs
+
+    def palette_color(self, state: int) -> QColor:
+        """Returns the color the pixels in the given state are shown by"""
+
+        return self._palette[state]
+
+    def set_color(self, state: int, color: QColor) -> None:
+        """Shows every pixel in the given state by the color. Only the palette of the framebuffer changes,
+        the screen is drawn again through it without rasterizing any bar"""
+
+        self._palette[state] = QColor(color)
+
+        if self._framebuffer is None:
+            return
+
+        self._framebuffer.setColor(state, self._palette[state].rgba())
+
+        self.present([(0, self.canvas_size[0])])
+
+        if self._lane_view is not None and not self._lane_view.isHidden():
+            self._lane_view.hide()  # Filled by the new background and drawn again by the next frame.
+            self.load_lane(0, len(self.lane.values))
+
+    def load_framebuffer(self) -> None:
+        """Creates the framebuffer for the size of the canvas, if it does not exist yet, filled by the background"""
+
+        width, height = self.canvas_size
+
+        if self._framebuffer is not None and (self._framebuffer.width(), self._framebuffer.height()) == (height, width):
+            return
+
+        self._framebuffer = QImage(height, width, QImage.Format_Indexed8)
+        self._framebuffer.setColorTable([color.rgba() for color in self._palette])
+        self._framebuffer.fill(BACKGROUND)
+
+        pointer = self._framebuffer.bits()
+        pointer.setsize(self._framebuffer.sizeInBytes())
+        self._pixels = memoryview(pointer)
+
+        self._runs = [memoryview(bytes((state,)) * height) for state in range(len(self._palette))]
+
+    def fill_framebuffer(self, q_rect: QRect, state: int) -> None:
+        """Sets the pixels of the rectangle of the screen to the given state"""
+
+        width, height = self.canvas_size
+        stride: int = self._framebuffer.bytesPerLine()
+        run: memoryview = self._runs[state]
+
+        top, bottom = max(0, q_rect.y()), min(height, q_rect.y() + q_rect.height())
+
+        for x in range(max(0, q_rect.x()), min(width, q_rect.x() + q_rect.width())):
+            self._pixels[(width - 1 - x) * stride + top:(width - 1 - x) * stride + bottom] = run[top:bottom]
+
+    def rasterize(self, columns: dict[int, int]) -> None:
+        """Writes the given columns, by their state, straight into the pixels of the framebuffer.
+        The framebuffer holds the screen rotated by a quarter turn, so that every pixel column of a bar is a row:
+        its background and bar are contiguous slice copies"""
+
+        width, height = self.canvas_size
+
+        pixels: memoryview = self._pixels
+        stride: int = self._framebuffer.bytesPerLine()
+        x_offsets: array = self._x_offsets
+        separation: int = self.is_separated
+        only_positive: bool = self.only_positive
+        runs: list[memoryview] = self._runs
+        background: memoryview = runs[BACKGROUND]
+
+        for c in self._stale.intersection(columns):
+            self.column_value(c)
+
+        values: array = self._column_values if self._aggregated else self._values
+
+        for c, state in columns.items():  # The bar geometry of self.column_rect(), inlined.
+            run: memoryview = runs[state]
+            value: int = values[c]
+
+            top, bottom = (height - value, height) if only_positive else \
+                (height // 2 - (value if 0 < value else 0), height // 2 - (value if 0 < value else 0) + abs(value))
+            top, bottom = min(height, max(0, top)), min(height, max(0, bottom))
+
+            left, right = x_offsets[c], x_offsets[c + 1]
+            row: int = (width - 1 - left) * stride  # Screen column x is row width - 1 - x.
+
+            pixels[row:row + top] = background[:top]
+            pixels[row + top:row + bottom] = run[top:bottom]
+            pixels[row + bottom:row + height] = background[bottom:]
+
+            for x in range(left + 1, right):
+                pixels[(width - 1 - x) * stride:(width - 1 - x) * stride + height] = \
+                    pixels[row:row + height] if x < right - separation else background
+
+    def band(self, left: int, right: int) -> QImage:
+        """Returns the screen between the x coordinates left and right, cut out of the framebuffer"""
+
+        width, height = self.canvas_size
+
+        return self._framebuffer.copy(QRect(0, width - right, height, right - left)).transformed(QTransform().rotate(90))
+
+    def present(self, spans: list[tuple[int, int]]) -> None:
+        """Draws the given x spans [left, right) of the framebuffer on the canvas, through its palette.
+        Many spans are cut out of a single band of the screen, a few are cut out one by one"""
+
+        if not spans:
+            return
+
+        height: int = self.canvas_size[1]
+
+        self._dirty.extend(spans)
+
         painter: QPainter = QPainter(self.label.pixmap())
-        painter.setPen(QPen(color))
-        painter.setBrush(QBrush(color))
-        painter.drawRect(q_rect)
+
+        if self.framebuffer_columns <= len(spans):
+            left: int = min(first for first, _ in spans)
+            band: QImage = self.band(left, max(last for _, last in spans))
+
+            for first, last in spans:
+                painter.drawImage(QRect(first, 0, last - first, height), band,
+                                  QRect(first - left, 0, last - first, height))
+
+        else:
+            for first, last in spans:
+                painter.drawImage(QRect(first, 0, last - first, height), self.band(first, last))
+
         painter.end()
 
     def load_background(self) -> None:
         """Loads the background"""
 
-        self.nu_fill((0, 0, _resolution[0], _resolution[1]), self.color)
+        self.nu_fill((0, 0, *self.canvas_size), BACKGROUND)
+
+    def load_bar(self, index: int) -> None:
+        """Draws the bar at the given index, its column is cleared first"""
+
+        self._columns[index * self._column_count // len(self._values) if self._aggregated else index] = BAR
+
+    def load_bars(self) -> None:
+        """Draws every column"""
+
+        self._columns.update(dict.fromkeys(range(self._column_count), BAR))
+
+    def highlight(self, index: int) -> None:
+        """Marks the column of the index by access color for the next self.highlight_frames frames"""
+
+        column: int = index * self._column_count // len(self._values) if self._aggregated else index
 
-    def load_bar(self, bar: Bar) -> Bar:
-        """Draws the given bar"""
+        self._accessed_at[column] = self.frame
+        self._highlighted.add(column)
+        self._columns[column] = ACCESS
 
-        self.nu_fill((bar.x(), 0, self.bar_width, _resolution[1]), self.color)
-        self.nu_fill(bar, self.bar_color)
-        return bar
+    def expire_highlights(self) -> None:
+        """Removes the access color from the columns that have not been accessed in the last self.highlight_frames"""
 
-    def process_cache(self) -> None:
-        self.bar_at(self._bar_objects[(i := self.cache.popleft())], i)
+        accessed_at: array = self._accessed_at
+        oldest: int = self.frame - self.highlight_frames
 
-    def clear_cache(self) -> None:
-        [self.bar_at(self._bar_objects[(i := self.cache.pop())], i) for _ in range(len(self.cache))]
-        self.update()
+        expired: list[int] = [c for c in self._highlighted if accessed_at[c] <= oldest]
+
+        self._columns.update(dict.fromkeys(expired, BAR))
+
+        self._highlighted.difference_update(expired)
+
+    def clear_highlights(self) -> None:
+        """Removes the access color from every column and renders the frame"""
+
+        self._columns.update(dict.fromkeys(self._highlighted, BAR))
+
+        self._highlighted.clear()
+        self.render()
 
     def select(self, index: int) -> None:
         """Marks the index by selection color"""
 
-        self.nu_fill(self._bar_objects[index], self.selection_color)
+        self.counts[SELECT] += 1
+        self.paint(index, SELECTION)
+
+    def deselect(self, index: int) -> None:
+        """Removes the selection color from the index"""
+
+        self.counts[DESELECT] += 1
+        self.load_bar(index)
+
+    def reset_counts(self) -> None:
+        """Sets every operation counter to 0, the auxiliary buffers of the previous run are discarded"""
+
+        self.counts[:] = array('q', bytes(8 * len(OP_NAMES)))
+
+        self.lane.reset()
+
+    def allocate_aux(self, size: int) -> int:
+        """Allocates an auxiliary buffer of size elements in the lane, returns its start"""
+
+        start: int = self.lane.allocate(size)
+
+        self.load_lane(start, size)
+
+        return start
+
+    def free_aux(self, start: int) -> None:
+        """Releases the auxiliary buffer at start, its elements are cleared from the lane"""
+
+        size: int = self.lane.free(start)
+
+        self.lane.values[start:start + size] = array('i', bytes(self.lane.values.itemsize * size))
+
+        self.load_lane(start, size)
+
+    def aux_at(self, value: Union[Bar, int], index: int) -> None:
+        """Stores the value at the given lane index and draws it"""
 
-    def _real_threaded_fill(self, index: int, color: Color) -> None:
-        """Actual function that changes the color of a bar"""
+        self.lane.values[index] = int(value)
 
-        self.nu_fill(self._bar_objects[index], color)
+        if index < len(self._values):
+            self._lane_columns[self.column(index)] = int(value)
 
-        sleep(self.delay)
+    def load_lane(self, start: int, size: int) -> None:
+        """Draws the lane elements in [start, start + size) by their current value"""
 
-        self.cache.append(index)
+        values: array = self.lane.values
 
-    def threaded_fill(self, index: int, color: Color) -> None:
-        """Creates a thread to change the color of the bar to self.access color for self.delay seconds"""
+        for index in range(start, min(start + size, len(self._values))):
+            self._lane_columns[self.column(index)] = values[index]
 
-        self.thread_pool.tryStart(ThreadedTask(self, self._real_threaded_fill, index, color))
+    def flush_lane(self) -> None:
+        """Draws the lane columns queued during the frame, the lane is only shown while buffers are live"""
 
-    def threaded_update(self) -> None:
-        """Creates a thread that updates the screen"""
+        columns, self._lane_columns = self._lane_columns, {}
 
-        self.thread_pool.tryStart(ThreadedTask(self, self.update))
+        if not self.lane.used:
+            self._lane_view.hide() if self._lane_view is not None and not self._lane_view.isHidden() else ...
+            return
+
+        width, height = self.canvas_size[0], self.canvas_size[1] // _LANE_SHARE
+
+        if self._lane_view is None:
+            self._lane_view = QLabel(self.label)
+            self._lane_view.setGeometry(0, 0, width, height)
+            self._lane_view.setPixmap(QPixmap(width, height))
+
+        if self._lane_view.isHidden():
+            self._lane_view.pixmap().fill(self.color)
+            self._lane_view.show()
+
+        if not columns:
+            return
+
+        x_offsets: array = self._x_offsets
+        scale: float = height / self.canvas_size[1]
+        bottom: int = height - 1 if self.only_positive else height // 2
+
+        painter: QPainter = QPainter(self._lane_view.pixmap())
+
+        painter.setPen(Qt.NoPen)
+
+        painter.setBrush(self.color)
+        painter.drawRects([QRect(x_offsets[c], 0, x_offsets[c + 1] - x_offsets[c], height - 1) for c in columns])
+
+        painter.setBrush(self.bar_color)
+        painter.drawRects([QRect(x_offsets[c], bottom - max(0, round(value * scale)),
+                                 x_offsets[c + 1] - x_offsets[c] - self.is_separated, abs(round(value * scale)))
+                           for c, value in columns.items() if value])
+
+        painter.setBrush(self.selection_color)
+        painter.drawRect(QRect(0, height - 1, width, 1))
+
+        painter.end()
+
+        self._lane_view.update()
+
+    def dirty_spans(self) -> list[tuple[int, int]]:
+        """Returns the x spans drawn on since the last update, spans with small gaps between them are merged"""
+
+        spans: list[tuple[int, int]] = []
+
+        for left, right in sorted(self._dirty):
+            if spans and left <= spans[-1][1] + _MERGE_GAP:
+                spans[-1] = (spans[-1][0], max(right, spans[-1][1]))
+            else:
+                spans.append((left, right))
+
+        self._dirty.clear()
+
+        return spans
+
+    def render(self) -> None:
+        """Draws the frame and schedules a repaint of the columns that changed since the last frame"""
+
+        profiler: Union[Profiler, None] = self.profiler
+        previous: int = profiler.switch(PAINT) if profiler else 0
+
+        self.expire_highlights()
+
+        self.frame += 1
+
+        self.flush()
+
+        self.flush_lane() if self._lane_columns or self.lane.used or self._lane_view is not None else ...
+
+        height: int = self.label.height()
+
+        for left, right in self.dirty_spans():
+            self.label.update(left, 0, right - left, height)
+
+        if profiler:
+            profiler.frame()
+            profiler.switch(previous)
+
+    def tick(self) -> None:
+        """Counts an operation of an algorithm running on the GUI thread,
+        updates the screen once the operation budget of the frame has been spent"""
+
+        self._frame_ops += 1
+
+        if self._frame_ops < self.governor.ops_per_frame:
+            return
+
+        self._frame_ops = 0
+
+        if self.profiler:
+            previous: int = self.profiler.switch(WAIT)
+            due: bool = self.governor.wait_for_frame()
+            self.profiler.switch(previous)
+
+        else:
+            due: bool = self.governor.wait_for_frame()
+
+        if due:
+            self.update()
 
     def update(self) -> None:
-        """Updates the screen"""
+        """Renders the frame and processes the pending events, used while an algorithm runs on the GUI thread"""
+
+        self.render()
+
+        if self.profiler:
+            previous: int = self.profiler.switch(EVENTS)
+            get_app().processEvents()
+            self.profiler.switch(previous)
 
-        super().update()
-        app.processEvents()
+        else:
+            get_app().processEvents()
 
     def create_button(self, function: Callable, tip: str, title: str,
                       separate: bool = True, push: bool = False,
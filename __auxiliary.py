@@ -0,0 +1,136 @@
+"""Auxiliary buffers of the sorting algorithms, the memory they use on top of the array.
+
+Buffers are allocated from a lane, a second array owned by the visual or recording array, so that every access to
+them is counted, drawn and recorded like an access to the array itself. A buffer is released by release(), or at
+the end of a with block:
+
+    with arr.buffer(size) as left:
+        left[0] = arr[0]
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import TypeVar, Union
+
+
+Owner = TypeVar("Owner")  # VisualArray or RecordingArray the buffer belongs to.
+
+Bar = TypeVar("Bar")
+
+
+class Lane:
+    """Elements of the auxiliary buffers, each buffer is a contiguous range of the lane.
+    A buffer is allocated after the last live buffer, so buffers released in reverse order reuse the lane"""
+
+    def __init__(self) -> None:
+        self.values: array = array('i')  # Values of the lane, as long as the furthest buffer ever allocated.
+
+        self.used: int = 0  # End of the last live buffer.
+
+        self.live: int = 0  # Number of elements in live buffers.
+
+        self.peak: int = 0  # Highest number of elements in live buffers at once.
+
+        self._buffers: dict[int, int] = {}  # Size of each live buffer, by start.
+
+    def reset(self) -> None:
+        """Releases every buffer and forgets the peak"""
+
+        self.__init__()
+
+    def copy(self) -> Lane:
+        """Returns an independent copy of the lane, its buffers and its peak"""
+
+        lane: Lane = Lane()
+
+        lane.values, lane.used, lane.live, lane.peak = array('i', self.values), self.used, self.live, self.peak
+        lane._buffers = dict(self._buffers)
+
+        return lane
+
+    def allocate(self, size: int) -> int:
+        """Reserves size zeroed elements, returns the start of the buffer"""
+
+        start: int = self.used
+
+        self.used += size
+        self.live += size
+        self.peak = max(self.peak, self.live)
+
+        zeros: bytes = bytes(self.values.itemsize * size)
+
+        self.values.frombytes(zeros[:self.values.itemsize * max(0, self.used - len(self.values))])  # Elements.
+        self.values[start:self.used] = array('i', zeros)
+
+        self._buffers[start] = size
+
+        return start
+
+    def free(self, start: int) -> int:
+        """Releases the buffer at start, returns its size"""
+
+        size: int = self._buffers.pop(start)
+
+        self.live -= size
+        self.used = max((first + length for first, length in self._buffers.items()), default=0)
+
+        return size
+
+
+class AuxBuffer:
+    """Auxiliary buffer handed to a sorting algorithm, its reads and writes go through its owner"""
+
+    __slots__ = ("owner", "start", "size")
+
+    def __init__(self, owner: Owner, start: int, size: int) -> None:
+        self.owner: Owner = owner  # Array that allocated the buffer, None once released.
+
+        self.start: int = start  # Index of the first element of the buffer in the lane.
+
+        self.size: int = size  # Number of elements of the buffer.
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _lane_index(self, index: int) -> int:
+        """Returns the lane index of the element at the given buffer index"""
+
+        index = int(index)
+        index += self.size if index < 0 else 0
+
+        if not 0 <= index < self.size or self.owner is None:
+            raise IndexError("auxiliary buffer index out of range" if self.owner else "auxiliary buffer released")
+
+        return self.start + index
+
+    def __getitem__(self, index: Union[slice, int, Bar]) -> Union[Bar, list[Bar]]:
+        """Reads the element at index if index is an int, else the elements in the given index slice"""
+
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.size))]
+
+        return self.owner.aux_read(self._lane_index(index))
+
+    def __setitem__(self, index: Union[slice, int], new_val: Union[list, Bar, int]) -> None:
+        """Writes new_val at index if index is an int, else the values in the given index slice"""
+
+        if isinstance(index, slice):
+            for i, value in zip(range(*index.indices(self.size)), new_val):
+                self[i] = value
+            return
+
+        self.owner.aux_write(self._lane_index(index), new_val)
+
+    def release(self) -> None:
+        """Gives the elements of the buffer back to the lane, the buffer cannot be used anymore"""
+
+        if self.owner is not None:
+            self.owner.release(self)
+            self.owner = None
+
+    def __enter__(self) -> AuxBuffer:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.release()
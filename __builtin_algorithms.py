@@ -287,7 +287,7 @@ def intro_partition(arr: Visual_Array, start: int, end: int) -> int:
             j -= 1
 
         if j <= i:
-            arr.bar_at(arr._bar_objects[start], start)
+            arr.deselect(start)
             return j
 
         swap(arr, i, j)
@@ -359,31 +359,37 @@ def find_min_run(n: int, init: int) -> int:
 
 def merge(array: Visual_Array, l: int, m: int, r: int) -> None:
     array_length1, array_length2 = m - l + 1, r - m
-    left, right = [array[l + i] for i in range(array_length1)], [array[m + i + 1] for i in range(array_length2)]
 
-    i, j, k = 0, 0, l
+    with array.buffer(array_length1) as left, array.buffer(array_length2) as right:
+        for i in range(array_length1):
+            left[i] = array[l + i]
 
-    while j < array_length2 and i < array_length1:
-        if left[i] <= right[j]:
+        for j in range(array_length2):
+            right[j] = array[m + j + 1]
+
+        i, j, k = 0, 0, l
+
+        while j < array_length2 and i < array_length1:
+            if left[i] <= right[j]:
+                array[k] = left[i]
+                i += 1
+
+            else:
+                array[k] = right[j]
+                j += 1
+
+            k += 1
+
+        while i < array_length1:
             array[k] = left[i]
+            k += 1
             i += 1
 
-        else:
+        while j < array_length2:
             array[k] = right[j]
+            k += 1
             j += 1
 
-        k += 1
-
-    while i < array_length1:
-        array[k] = left[i]
-        k += 1
-        i += 1
-
-    while j < array_length2:
-        array[k] = right[j]
-        k += 1
-        j += 1
-
 
 def tim_sort(array: Visual_Array, func: Callable = slice_insertion_sort, init_min_run: int = 16) -> None:
     n: int = len(array)
@@ -493,7 +499,7 @@ def middle_partition(arr: Visual_Array, low: int, high: int) -> int:
             high -= 1
 
         if low >= high:
-            arr.bar_at(arr._bar_objects[pivot_index], pivot_index)
+            arr.deselect(pivot_index)
             return high
 
         arr[low], arr[high] = arr[high], arr[low]
@@ -575,31 +581,35 @@ def qim_sort(arr: Visual_Array) -> None:
 
 def countingSort(array: Visual_Array, place: int, version: int) -> None:
     size, count = len(array), [0] * 10
-    place_holder: list[Bar] = array[:] if version else [0] * size
 
-    for i in range(size):
-        count[(place_holder[i] if version else array[i]) // place % 10] += 1
+    with array.buffer(size) as place_holder:
+        if version:
+            for i in range(size):
+                place_holder[i] = array[i]
 
-    for i in range(1, 10):
-        count[i] += count[i - 1]
+        for i in range(size):
+            count[(place_holder[i] if version else array[i]) // place % 10] += 1
 
-    i: int = size
+        for i in range(1, 10):
+            count[i] += count[i - 1]
 
-    if version:
-        while 0 <= (i := i - 1):
-            index: int = place_holder[i] // place
-            array[count[index % 10] - 1] = place_holder[i]
-            count[index % 10] -= 1
+        i: int = size
 
-    else:
-        while 0 <= (i := i - 1):
-            index: int = array[i] // place
-            place_holder[count[index % 10] - 1] = array[i]
-            count[index % 10] -= 1
+        if version:
+            while 0 <= (i := i - 1):
+                index: int = place_holder[i] // place
+                array[count[index % 10] - 1] = place_holder[i]
+                count[index % 10] -= 1
 
-    if not version:
-        for i in range(size):
-            array[i] = place_holder[i]
+        else:
+            while 0 <= (i := i - 1):
+                index: int = array[i] // place
+                place_holder[count[index % 10] - 1] = array[i]
+                count[index % 10] -= 1
+
+        if not version:
+            for i in range(size):
+                array[i] = place_holder[i]
 
 
 def radix_sort(array: Visual_Array, version: int = 0) -> None:
@@ -0,0 +1,241 @@
+"""Content-addressed cache of recorded runs, so that sorting the same input with the same algorithm again replays
+instantly instead of running the algorithm again.
+
+A run is keyed by the identity of the algorithm (its qualified name and the source of its module), the versions of
+the recorder and of the trace format, its flags, the number of values and a hash of the values. Logs are held in an
+in-memory LRU tier bounded in bytes, in front of a directory of trace files bounded in bytes too, whose least recently
+used traces are evicted first:
+
+    cache = TraceCache()
+    log = cache.record(merge_sort, values)  # Runs merge_sort only the first time.
+    print(cache.summary())
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections import OrderedDict
+from hashlib import sha256
+from inspect import getmodule, getsource
+from os import environ, listdir, makedirs, remove, replace, stat, utime
+from os.path import expanduser, join
+from types import CodeType
+from typing import Callable, Union
+
+from __recorder import OpLog, record, MAX_OPS, RECORDER_VERSION
+from __trace import Trace, save_trace, TRACE_VERSION
+
+
+CACHE_DIRECTORY: str = join(environ.get("XDG_CACHE_HOME") or expanduser("~/.cache"),
+                            "SortingVisualizer")  # Default directory of the disk tier.
+
+MEMORY_BYTES: int = 256 << 20  # Default size budget of the memory tier.
+
+DISK_BYTES: int = 2 << 30  # Default size budget of the disk tier.
+
+_SUFFIX: str = ".svt"  # Extension of the trace files of the disk tier.
+
+
+def _code_bytes(code: CodeType) -> bytes:
+    """Returns the bytecode of the code object followed by that of the functions and classes it defines"""
+
+    return code.co_code + b"".join(_code_bytes(const) for const in code.co_consts if isinstance(const, CodeType))
+
+
+def code_digest(algorithm: Callable) -> str:
+    """Returns a hash of the source of the module of the algorithm, so that changing one of the helpers it shares a
+    module with changes it too. Falls back to the bytecode of the algorithm if the source is not available"""
+
+    try:
+        return sha256(getsource(getmodule(algorithm)).encode()).hexdigest()
+    except (OSError, TypeError):  # Defined interactively, or a builtin.
+        code = getattr(algorithm, "__code__", None)
+        return sha256(_code_bytes(code)).hexdigest() if code else ""
+
+
+def cache_key(algorithm: Callable, values: list[int], *, only_positive: bool = False,
+              economical: bool = False) -> str:
+    """Returns the key of a run of the algorithm on the values, a hex digest"""
+
+    digest = sha256(f"{RECORDER_VERSION}.{TRACE_VERSION}|{algorithm.__module__}.{algorithm.__qualname__}|"
+                    f"{code_digest(algorithm)}|{only_positive:d}{economical:d}|{len(values)}|".encode())
+    digest.update(array('i', values).tobytes())
+
+    return digest.hexdigest()
+
+
+def _size(log: OpLog) -> int:
+    """Returns the number of bytes held by the log"""
+
+    return 4 * (len(log.initial) + len(log.records))
+
+
+class TraceCache:
+    """Two tier LRU cache of complete recorded runs by cache_key().
+    The disk tier is disabled if directory is None, a tier is disabled by a budget of 0"""
+
+    def __init__(self, directory: Union[str, None] = CACHE_DIRECTORY, *, memory_bytes: int = MEMORY_BYTES,
+                 disk_bytes: int = DISK_BYTES) -> None:
+        self.directory: Union[str, None] = directory if disk_bytes else None  # Directory of the disk tier.
+
+        self.memory_budget: int = memory_bytes  # Highest number of bytes of the memory tier.
+
+        self.disk_budget: int = disk_bytes  # Highest number of bytes of the disk tier.
+
+        self.memory_bytes: int = 0  # Bytes held by the memory tier.
+
+        self.disk_bytes: int = 0  # Bytes held by the disk tier.
+
+        self.memory_hits: int = 0  # Lookups served by the memory tier.
+
+        self.disk_hits: int = 0  # Lookups served by the disk tier.
+
+        self.misses: int = 0  # Lookups served by neither tier.
+
+        self._memory: OrderedDict[str, OpLog] = OrderedDict()  # Logs of the memory tier, least recently used first.
+
+        self._disk: OrderedDict[str, int] = OrderedDict()  # Sizes of the traces, least recently used first.
+
+        if self.directory is not None:
+            makedirs(self.directory, exist_ok=True)
+            self._scan()
+
+    def _scan(self) -> None:
+        """Loads the traces already in the directory, ordered by their last use"""
+
+        traces: list[tuple[float, str, int]] = []
+
+        for name in listdir(self.directory):
+            if name.endswith(_SUFFIX):
+                info = stat(join(self.directory, name))
+                traces.append((info.st_mtime, name[:-len(_SUFFIX)], info.st_size))
+
+        for _, key, size in sorted(traces):
+            self._disk[key] = size
+            self.disk_bytes += size
+
+        self._evict_disk()
+
+    def _path(self, key: str) -> str:
+        return join(self.directory, key + _SUFFIX)
+
+    def __len__(self) -> int:
+        """Returns the number of runs cached in either tier"""
+
+        return len(self._memory.keys() | self._disk.keys())
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._memory or key in self._disk
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of the lookups served by either tier, 0 before any lookup"""
+
+        lookups: int = self.memory_hits + self.disk_hits + self.misses
+
+        return (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0
+
+    def get(self, key: str) -> Union[OpLog, None]:
+        """Returns the cached log of the key, None if neither tier holds it.
+        A log found on disk is loaded into memory, the log must not be modified"""
+
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            self.memory_hits += 1
+            return self._memory[key]
+
+        if key in self._disk:
+            try:
+                with Trace(self._path(key)) as trace, memoryview(trace.records).cast('B') as records:
+                    log: OpLog = OpLog(trace.initial, trace.only_positive)
+                    log.records.frombytes(records)
+
+            except (OSError, ValueError):  # Removed by another process, or not a trace.
+                self.disk_bytes -= self._disk.pop(key)
+                self.misses += 1
+                return None
+
+            utime(self._path(key))
+            self._disk.move_to_end(key)
+            self.disk_hits += 1
+
+            self._remember(key, log)
+            return log
+
+        self.misses += 1
+        return None
+
+    def put(self, key: str, log: OpLog, *, algorithm: str = "") -> None:
+        """Stores a complete log in both tiers, truncated logs are not cached"""
+
+        if log.truncated:
+            return
+
+        self._remember(key, log)
+
+        if self.directory is None or key in self._disk or self.disk_budget < _size(log):
+            return
+
+        temporary: str = self._path(key) + ".tmp"
+
+        save_trace(log, temporary, algorithm=algorithm)
+        replace(temporary, self._path(key))
+
+        self._disk[key] = stat(self._path(key)).st_size
+        self.disk_bytes += self._disk[key]
+
+        self._evict_disk()
+
+    def record(self, algorithm: Callable, values: list[int], *, only_positive: bool = False,
+               economical: bool = False, max_ops: int = MAX_OPS) -> OpLog:
+        """Returns the log of the algorithm on the values, recorded only if it is not cached"""
+
+        key: str = cache_key(algorithm, values, only_positive=only_positive, economical=economical)
+
+        log: Union[OpLog, None] = self.get(key)
+
+        if log is None:
+            log = record(algorithm, values, only_positive=only_positive, economical=economical, max_ops=max_ops)
+            self.put(key, log, algorithm=algorithm.__name__)
+
+        return log
+
+    def clear(self) -> None:
+        """Removes every run from both tiers, the statistics are kept"""
+
+        self._memory.clear()
+        self.memory_bytes = 0
+
+        budget, self.disk_budget = self.disk_budget, 0
+        self._evict_disk()
+        self.disk_budget = budget
+
+    def summary(self) -> str:
+        """Returns the hit rate and the size of both tiers"""
+
+        return (f"{self.hit_rate:.0%} hits of {self.memory_hits + self.disk_hits + self.misses}, "
+                f"{self.memory_bytes / (1 << 20):.1f} MB in memory, {self.disk_bytes / (1 << 20):.1f} MB on disk")
+
+    def _remember(self, key: str, log: OpLog) -> None:
+        """Puts the log in the memory tier, evicting the least recently used logs above its budget"""
+
+        if key in self._memory or self.memory_budget < _size(log):
+            return
+
+        self._memory[key] = log
+        self.memory_bytes += _size(log)
+
+        while self.memory_budget < self.memory_bytes:
+            self.memory_bytes -= _size(self._memory.popitem(last=False)[1])
+
+    def _evict_disk(self) -> None:
+        """Removes the least recently used traces above the budget of the disk tier"""
+
+        while self.disk_budget < self.disk_bytes:
+            key, size = self._disk.popitem(last=False)
+            self.disk_bytes -= size
+
+            try:
+                remove(self._path(key))
+            except FileNotFoundError:
+                ...
@@ -0,0 +1,173 @@
+"""Offline export of recorded sorting runs as PNG sequences or animated images.
+
+Frames are rendered offscreen from an OpLog by a pool of processes. The log is split into spans of frames, each
+worker receives the array state at the start of its span (a checkpoint) and the records of the span only.
+"""
+
+from __future__ import annotations
+
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from math import ceil
+from multiprocessing import get_context
+from os import cpu_count, makedirs, path
+
+from PyQt5.QtCore import Qt, QRect
+from PyQt5.QtGui import QColor, QImage, QPainter
+
+from __recorder import OpLog, RECORD_WIDTH, apply
+
+try:
+    from PIL import Image  # Optional, only needed for animated images.
+except ImportError:
+    Image = None
+
+
+Color = tuple[int, int, int]
+
+FRAME_NAME: str = "frame_{:06d}.png"  # File name of the frames, by frame number.
+
+SPANS_PER_WORKER: int = 4  # Spans handed to each worker, more spans balance the load better.
+
+"""
+A checkpoint is (first frame, values, selected indices): the state of the array after the records of all
+the frames before the first frame have been applied.
+"""
+
+
+def column_values(values: array, columns: int, aggregation: str = "max") -> list[int]:
+    """Returns the value shown by each of the columns, the aggregation of its elements as in
+    MainWindow.column_value(): column c shows the elements i with i * columns // len(values) == c"""
+
+    size: int = len(values)
+
+    if columns == size:
+        return values.tolist()
+
+    spans: list[array] = [values[-(-c * size // columns):-(-(c + 1) * size // columns)] for c in range(columns)]
+
+    return [max(span) for span in spans] if aggregation == "max" else \
+        [min(span) for span in spans] if aggregation == "min" else [span[-1] for span in spans]
+
+
+def bar_rects(values: array, width: int, height: int, highest: int, only_positive: bool,
+              aggregation: str = "max") -> list[QRect]:
+    """Returns the rectangles of the columns of the values, laid out as by MainWindow.load_geometry():
+    one column per element, or per pixel if the elements outnumber them. Scaled so that a bar of the highest value
+    fills an image of the given size"""
+
+    columns: int = max(1, min(len(values), width))
+    x_offsets: list[int] = [c * width // columns for c in range(columns + 1)]
+    gap: int = 1 if 3 <= width // columns else 0
+
+    if only_positive:
+        scale: float = height / highest
+        return [QRect(x_offsets[c], height - round(v * scale), x_offsets[c + 1] - x_offsets[c] - gap,
+                      round(v * scale)) for c, v in enumerate(column_values(values, columns, aggregation))]
+
+    scale: float = height / 2 / highest
+    return [QRect(x_offsets[c], height // 2 - (round(v * scale) if 0 < v else 0), x_offsets[c + 1] - x_offsets[c] - gap,
+                  abs(round(v * scale))) for c, v in enumerate(column_values(values, columns, aggregation))]
+
+
+def checkpoints(log: OpLog, ops_per_frame: int, frames: int, span: int) -> list[tuple[int, array, set[int]]]:
+    """Returns the checkpoints at the start of every span of frames"""
+
+    values: array = array('i', log.initial)
+    selected: set[int] = set()
+    result: list[tuple[int, array, set[int]]] = []
+
+    for first in range(0, frames, span):
+        if first:
+            begin: int = (first - span) * ops_per_frame * RECORD_WIDTH
+            apply(values, selected, log.records[begin:first * ops_per_frame * RECORD_WIDTH])
+
+        result.append((first, array('i', values), set(selected)))
+
+    return result
+
+
+def render_span(checkpoint: tuple[int, array, set[int]], records: array, frames: int, ops_per_frame: int,
+                directory: str, width: int, height: int, highest: int, only_positive: bool,
+                colors: tuple[Color, Color, Color, Color], aggregation: str = "max") -> int:
+    """Renders the frames of a span to PNG files, starting from its checkpoint. Returns the number of frames.
+    Runs in the worker processes"""
+
+    first, values, selected = checkpoint
+    background, bar, access, selection = (QColor(*color) for color in colors)
+
+    image: QImage = QImage(width, height, QImage.Format_RGB32)
+
+    size: int = len(values)
+    columns: int = max(1, min(size, width))
+
+    for frame in range(frames):
+        accessed: set[int] = set()
+
+        apply(values, selected, records[frame * ops_per_frame * RECORD_WIDTH:
+                                        (frame + 1) * ops_per_frame * RECORD_WIDTH], accessed)
+
+        rects: list[QRect] = bar_rects(values, width, height, highest, only_positive, aggregation)
+
+        accessed_columns: set[int] = {i * columns // size for i in accessed}
+        selected_columns: set[int] = {i * columns // size for i in selected} - accessed_columns
+
+        image.fill(background)
+
+        painter: QPainter = QPainter(image)
+
+        painter.setPen(Qt.NoPen)  # Without an outline, a rectangle covers exactly its own pixels, as on screen.
+
+        for color, indices in ((bar, [c for c in range(columns) if c not in accessed_columns
+                                      and c not in selected_columns]),
+                               (selection, selected_columns),
+                               (access, accessed_columns)):
+            painter.setBrush(color)
+            painter.drawRects([rects[c] for c in indices])
+
+        painter.end()
+
+        image.save(path.join(directory, FRAME_NAME.format(first + frame)))
+
+    return frames
+
+
+def export(log: OpLog, directory: str, *, ops_per_frame: int = 64, width: int = 1920, height: int = 1080,
+           workers: int = None, background_color: Color = (0, 0, 0), bar_color: Color = (255, 255, 255),
+           access_color: Color = (255, 0, 0), select_color: Color = (0, 255, 0), aggregation: str = "max") -> int:
+    """Renders every frame of the log to a PNG file in the directory, ops_per_frame records per frame.
+    Arrays larger than the width show one column per pixel, by the given aggregation of its elements.
+    The frames are rendered by a pool of workers processes, returns the number of frames"""
+
+    makedirs(directory, exist_ok=True)
+
+    workers = workers or cpu_count() or 1
+    frames: int = max(1, ceil(len(log) / ops_per_frame))
+    span: int = max(1, ceil(frames / (workers * SPANS_PER_WORKER)))
+    highest: int = max(1, max(map(abs, log.initial), default=1))  # Value of a bar as high as the image.
+
+    colors: tuple[Color, ...] = (background_color, bar_color, access_color, select_color)
+
+    with ProcessPoolExecutor(workers, mp_context=get_context("spawn")) as pool:  # Qt does not survive a fork.
+        jobs: list = []
+
+        for checkpoint in checkpoints(log, ops_per_frame, frames, span):
+            first: int = checkpoint[0]
+            records: array = array('i', log.records[first * ops_per_frame * RECORD_WIDTH:
+                                                    (first + span) * ops_per_frame * RECORD_WIDTH])  # Picklable.
+
+            jobs.append(pool.submit(render_span, checkpoint, records, min(span, frames - first), ops_per_frame,
+                                    directory, width, height, highest, log.only_positive, colors, aggregation))
+
+        return sum(job.result() for job in jobs)
+
+
+def to_animation(directory: str, frames: int, destination: str, fps: int = 30) -> None:
+    """Combines the frames exported to the directory into an animated image (GIF, WebP, APNG), requires Pillow"""
+
+    if Image is None:
+        raise ImportError("Pillow is required for animated images, install it with: pip install pillow")
+
+    images: list = [Image.open(path.join(directory, FRAME_NAME.format(i))) for i in range(frames)]
+
+    images[0].save(destination, save_all=True, append_images=images[1:], duration=round(1000 / fps), loop=0)
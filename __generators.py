@@ -0,0 +1,128 @@
+"""Seeded generators of input distributions, the same seed always builds the same input.
+
+Every generator returns size levels between 1 and size, built in bulk from a random.Random of its own so that the
+global random state is neither used nor disturbed.
+"""
+
+from __future__ import annotations
+
+from itertools import accumulate
+from random import Random
+from typing import Callable, Union
+
+
+NEARLY_SORTED_SWAPS: int = 32  # Elements per random swap of a nearly sorted input, unless given its swaps.
+
+FEW_UNIQUE_VALUES: int = 8  # Number of distinct values of a few unique input.
+
+SAWTOOTH_TEETH: int = 4  # Number of ascending runs of a sawtooth input.
+
+ZIPF_EXPONENT: float = 1.2  # Exponent of the Zipf distribution, larger values repeat the small levels more.
+
+
+def random_permutation(size: int, rng: Random) -> list[int]:
+    """Every level once, shuffled"""
+
+    values: list[int] = list(range(1, size + 1))
+    rng.shuffle(values)
+
+    return values
+
+
+def true_random(size: int, rng: Random) -> list[int]:
+    """Uniform levels, with repetitions"""
+
+    return [rng.randint(1, size) for _ in range(size)]
+
+
+def ascending(size: int, rng: Random) -> list[int]:
+    """Every level once, sorted"""
+
+    return list(range(1, size + 1))
+
+
+def descending(size: int, rng: Random) -> list[int]:
+    """Every level once, in reverse order"""
+
+    return list(range(size, 0, -1))
+
+
+def nearly_sorted(size: int, rng: Random, swaps: int = None) -> list[int]:
+    """Sorted levels with swaps random swaps, by default one per NEARLY_SORTED_SWAPS elements"""
+
+    values: list[int] = list(range(1, size + 1))
+
+    swaps = (max(1, size // NEARLY_SORTED_SWAPS) if 1 < size else 0) if swaps is None else swaps
+
+    for _ in range(swaps):
+        i, j = rng.randrange(size), rng.randrange(size)
+        values[i], values[j] = values[j], values[i]
+
+    return values
+
+
+def few_unique(size: int, rng: Random) -> list[int]:
+    """FEW_UNIQUE_VALUES evenly spaced levels, uniformly drawn"""
+
+    levels: list[int] = [(k + 1) * size // FEW_UNIQUE_VALUES or 1 for k in range(FEW_UNIQUE_VALUES)]
+
+    return rng.choices(levels, k=size)
+
+
+def sawtooth(size: int, rng: Random) -> list[int]:
+    """SAWTOOTH_TEETH sorted runs of rising levels"""
+
+    tooth: int = max(1, -(-size // SAWTOOTH_TEETH))
+
+    return [(i % tooth + 1) * size // tooth for i in range(size)]
+
+
+def pipe_organ(size: int, rng: Random) -> list[int]:
+    """Rising odd levels followed by falling even levels"""
+
+    return list(range(1, size + 1, 2)) + list(range(size - size % 2, 0, -2))
+
+
+def gaussian(size: int, rng: Random) -> list[int]:
+    """Normally distributed levels around size / 2, with a standard deviation of size / 6"""
+
+    return [min(size, max(1, round(rng.gauss(size / 2, size / 6)))) for _ in range(size)]
+
+
+def zipf(size: int, rng: Random) -> list[int]:
+    """Levels drawn with a probability proportional to 1 / level ** ZIPF_EXPONENT"""
+
+    weights: list[float] = list(accumulate(1 / level ** ZIPF_EXPONENT for level in range(1, size + 1)))
+
+    return rng.choices(range(1, size + 1), cum_weights=weights, k=size)
+
+
+GENERATORS: dict[str, Callable[[int, Random], list[int]]] = {
+    "random": random_permutation,
+    "true_random": true_random,
+    "sorted": ascending,
+    "reversed": descending,
+    "nearly_sorted": nearly_sorted,
+    "few_unique": few_unique,
+    "sawtooth": sawtooth,
+    "pipe_organ": pipe_organ,
+    "gaussian": gaussian,
+    "zipf": zipf,
+}  # Generators by distribution name.
+
+
+def generate(distribution: str, size: int, seed: Union[int, None] = None, **options) -> list[int]:
+    """Returns size levels between 1 and size of the given distribution, built from the given seed.
+    The options are passed on to the generator, e.g. generate("nearly_sorted", 1024, 0, swaps=4)"""
+
+    return GENERATORS[distribution](size, Random(seed), **options)
+
+
+def scale(levels: list[int], size: int, height: int, only_positive: bool) -> list[int]:
+    """Maps levels between 1 and size to bar heights, up to height if only positive.
+    Else centered on 0, between -height / 2 and height / 2"""
+
+    increase: float = height / size
+
+    return [round(level * increase) or 1 for level in levels] if only_positive else \
+        [round((level - (size + 1) / 2) * increase) or 1 for level in levels]
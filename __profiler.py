@@ -0,0 +1,114 @@
+"""Optional profiler that splits the time of a run between the algorithm, painting, event handling and waiting"""
+
+from __future__ import annotations
+
+from array import array
+from time import perf_counter
+
+
+ALGORITHM, PAINT, EVENTS, WAIT = range(4)  # Phases of a run.
+
+PHASE_NAMES: tuple[str, ...] = ("algorithm", "paint", "events", "wait")  # Names by phase.
+
+FRAME_BUCKETS: tuple[float, ...] = (0.004, 0.008, 0.0167, 0.0334, 0.05, 0.1)  # Upper bounds of the histogram, s.
+
+"""
+The profiler is always in exactly one phase, switch() charges the time since the last switch to the phase that
+is left. Only the costly steps switch: rendering and applying records (PAINT), processEvents() and the event
+loop of a replay (EVENTS), frame pacing and pauses (WAIT). Queueing a bar is a single store and stays part of
+the phase it is done in, ALGORITHM when the algorithm runs on the GUI thread.
+"""
+
+
+class Profiler:
+    """Accumulates the time spent in each phase and the time between frames"""
+
+    def __init__(self, phase: int = ALGORITHM) -> None:
+        self.totals: array = array('d', bytes(8 * len(PHASE_NAMES)))  # Seconds spent in each phase.
+
+        self.frame_times: array = array('d')  # Seconds between consecutive frames.
+
+        self.worker: float = 0.0  # Seconds the algorithm spent on a worker thread, outside of the phases.
+
+        self.phase: int = phase  # Current phase.
+
+        self._since: float = perf_counter()  # perf_counter() of the last switch.
+
+        self._last_frame: float = 0.0  # perf_counter() of the last frame, 0 if the next one starts a sequence.
+
+    def reset(self, phase: int = ALGORITHM) -> None:
+        """Discards everything measured so far and starts in the given phase"""
+
+        self.__init__(phase)
+
+    def switch(self, phase: int) -> int:
+        """Charges the time since the last switch to the current phase and enters the given one.
+        Returns the phase that was left, so that it can be restored"""
+
+        now: float = perf_counter()
+
+        self.totals[self.phase] += now - self._since
+        self._since = now
+
+        previous, self.phase = self.phase, phase
+
+        return previous
+
+    def frame(self) -> None:
+        """Records the time since the previous frame"""
+
+        now: float = perf_counter()
+
+        self.frame_times.append(now - self._last_frame) if self._last_frame else ...
+        self._last_frame = now
+
+    def skip_frame(self) -> None:
+        """The time until the next frame is not recorded, used after a pause"""
+
+        self._last_frame = 0.0
+
+    def percentile(self, p: float) -> float:
+        """Returns the p-th percentile of the frame times in seconds, nearest rank"""
+
+        if not self.frame_times:
+            return 0.0
+
+        ordered: list[float] = sorted(self.frame_times)
+
+        return ordered[min(len(ordered) - 1, max(0, round(p / 100 * len(ordered)) - 1))]
+
+    def histogram(self) -> list[int]:
+        """Returns the number of frame times in each bucket of FRAME_BUCKETS, plus those above the last one"""
+
+        counts: list[int] = [0] * (len(FRAME_BUCKETS) + 1)
+
+        for seconds in self.frame_times:
+            counts[next((i for i, bound in enumerate(FRAME_BUCKETS) if seconds <= bound), len(FRAME_BUCKETS))] += 1
+
+        return counts
+
+    def report(self) -> str:
+        """Returns the breakdown of the run so far and its frame time percentiles and histogram"""
+
+        self.switch(self.phase)
+
+        total: float = sum(self.totals) or 1.0
+
+        lines: list[str] = [f"{name:<10}{seconds:>10.4f} s{100 * seconds / total:>7.1f} %"
+                            for name, seconds in zip(PHASE_NAMES, self.totals)]
+
+        lines.append(f"{'total':<10}{sum(self.totals):>10.4f} s")
+
+        lines.append(f"{'worker':<10}{self.worker:>10.4f} s  (algorithm on the recording thread)") \
+            if self.worker else ...
+
+        lines.append(f"frames {len(self.frame_times)}  p50 {1000 * self.percentile(50):.2f} ms  "
+                     f"p95 {1000 * self.percentile(95):.2f} ms  p99 {1000 * self.percentile(99):.2f} ms")
+
+        bounds: list[str] = [f"<={1000 * bound:g} ms" for bound in FRAME_BUCKETS] + [f">{1000 * FRAME_BUCKETS[-1]:g} ms"]
+        most: int = max(self.histogram()) or 1
+
+        lines.extend(f"{bound:>12} {count:>7} {'#' * round(40 * count / most)}"
+                     for bound, count in zip(bounds, self.histogram()))
+
+        return "\n".join(lines)
@@ -0,0 +1,342 @@
+"""Race of several sorting algorithms on the same input, side by side in one window.
+
+Every algorithm is recorded in a process of its own, so the recordings run on separate cores instead of sharing
+the GIL. Their records are streamed back through pipes and replayed in split panes on a shared frame clock.
+"""
+
+from __future__ import annotations
+
+from array import array
+from math import ceil
+from multiprocessing import get_context
+from multiprocessing.connection import Connection
+from queue import Empty
+from time import perf_counter
+from typing import Callable, Union
+
+from PyQt5.QtCore import QTimer
+from PyQt5.QtGui import QFont
+from PyQt5.QtWidgets import QMainWindow, QWidget, QGridLayout, QLabel, QToolBar, QAction, QSpinBox
+
+from __VisualizingEngine import MainWindow, FrameGovernor, Color, get_app, resolution, \
+    READ, WRITE, SWAP, COMPARE, AUX_READ, AUX_WRITE
+from __recorder import RecordingArray, OpLog, Player, BATCH_OPS
+from __generators import generate, scale
+
+
+_PLACES: tuple[str, ...] = ("1st", "2nd", "3rd")  # Names of the first places, the others are numbered "nth".
+
+
+def _record_into(algorithm: Callable, values: list[int], only_positive: bool, economical: bool, batch: int,
+                 sender: Connection) -> None:
+    """Runs the algorithm on a RecordingArray and sends its records through the pipe, runs in the child process.
+    An empty message ends the recording"""
+
+    arr: RecordingArray = RecordingArray(values, only_positive=only_positive, economical=economical,
+                                         sink=sender.send_bytes, batch=batch)
+
+    try:
+        algorithm(arr)
+        arr.flush()
+
+    finally:
+        sender.send_bytes(b"")
+        sender.close()
+
+
+class RecordingProcess:
+    """Runs a sorting algorithm on a RecordingArray in a separate process.
+    The records are streamed back in batches through a pipe, which blocks the algorithm once its buffer is full"""
+
+    def __init__(self, algorithm: Callable, values: list[int], *, only_positive: bool = False,
+                 economical: bool = False, batch: int = BATCH_OPS) -> None:
+        context = get_context("spawn")  # Qt does not survive a fork.
+
+        self._receiver, sender = context.Pipe(duplex=False)
+
+        self.process = context.Process(target=_record_into, daemon=True,
+                                       args=(algorithm, values, only_positive, economical, batch, sender))
+
+        self._sender: Connection = sender  # Closed in this process once the child has its own copy.
+
+        self.busy: float = 0.0  # Not measured across processes.
+
+        self.error: Union[Exception, None] = None  # Not reported across processes.
+
+    def start(self) -> None:
+        self.process.start()
+        self._sender.close()
+
+    def get_nowait(self) -> Union[array, None]:
+        """Returns the next batch of records, None once the recording is over. Raises Empty if none is ready"""
+
+        try:
+            if not self._receiver.poll():
+                raise Empty()
+
+            data: bytes = self._receiver.recv_bytes()
+
+        except (EOFError, OSError):  # The process has died.
+            return None
+
+        if not data:
+            return None
+
+        records: array = array('i')
+        records.frombytes(data)
+
+        return records
+
+    def cancel(self) -> None:
+        """Stops the recording"""
+
+        self.process.terminate() if self.process.is_alive() else ...
+        self._receiver.close()
+
+
+class RacePane(MainWindow):
+    """Pane of a race, replays the records of one algorithm and shows its counters over the bars"""
+
+    def __init__(self, name: str, values: list[int], size: tuple[int, int], *, only_positive: bool,
+                 background_color: Color, bar_color: Color, access_color: Color, select_color: Color) -> None:
+        super().__init__(color=background_color, bar_color=bar_color, access_color=access_color,
+                         selection_color=select_color, is_separated=False,
+                         only_positive=only_positive, no_toolBar=True, delay=0, fps=60, size=size)
+
+        self.name: str = name  # Name of the algorithm.
+
+        self.economical: bool = False  # Accesses are highlighted by the player.
+
+        self.player: Union[Player, None] = None  # Player of the recording of the pane.
+
+        self.place: str = ""  # Place of the algorithm once it has finished.
+
+        self.seconds: float = 0.0  # Seconds the replay took.
+
+        self.caption: QLabel = QLabel(self.label)  # Name and counters, drawn over the bars.
+
+        self.caption.setFont(QFont("Monaco", 10, QFont.Monospace))
+
+        self.caption.setStyleSheet(f"color: rgb{tuple(bar_color)}; background: transparent")
+
+        self.caption.move(6, 4)
+
+        self.load_background()
+        self.load_geometry(len(values))
+        self.load_values(values)
+        self.load_bars()
+        self.render()
+
+    def show_counts(self) -> None:
+        """Writes the name, place and counters of the algorithm over the bars"""
+
+        counts: array = self.counts
+
+        self.caption.setText(f"{self.name}  {self.place}\n"
+                             f"Cmp {counts[COMPARE]:,}  R {counts[READ]:,}  W {counts[WRITE]:,}  "
+                             f"Sw {counts[SWAP]:,}  Aux {counts[AUX_READ] + counts[AUX_WRITE]:,} "
+                             f"(peak {self.lane.peak:,})  {self.seconds:.2f} s")
+        self.caption.adjustSize()
+
+
+class RaceWindow(QMainWindow):
+    """Window of a race: the panes are laid out in a grid and advanced together by a single frame clock.
+    Every frame shows the same number of operations of each algorithm"""
+
+    def __init__(self, algorithms: dict[str, Callable], sample_size: int = 512, *, distribution: str = "random",
+                 seed: int = None, only_positive: bool = True, economical: bool = False, fps: int = 60,
+                 ops_per_second: int = 5000, background_color: Color = (0, 0, 0),
+                 bar_color: Color = (255, 255, 255), access_color: Color = (255, 0, 0),
+                 select_color: Color = (0, 255, 0)) -> None:
+        get_app()
+
+        super().__init__()
+
+        self.setWindowTitle("Sorting Visualizer Race")
+
+        self.algorithms: dict[str, Callable] = algorithms  # Algorithms that race, by name.
+
+        self.sample_size: int = sample_size  # Number of elements of the input.
+
+        self.distribution: str = distribution  # Input generator.
+
+        self.seed: Union[int, None] = seed  # Seed of the input, None for a new input every race.
+
+        self.only_positive: bool = only_positive  # Indicates whether the input contains only positive values.
+
+        self.economical: bool = economical  # Algorithms use swap() instead of assignments if True.
+
+        self.colors: dict[str, Color] = {"background_color": background_color, "bar_color": bar_color,
+                                         "access_color": access_color, "select_color": select_color}
+
+        self.governor: FrameGovernor = FrameGovernor(fps, ops_per_second)  # Shared frame clock of the panes.
+
+        self.panes: list[RacePane] = []  # One pane per algorithm.
+
+        self.running: bool = False  # Indicates whether the race is running or paused.
+
+        self._started: float = 0.0  # perf_counter() at which the race started, paused time excluded.
+
+        self._elapsed: float = 0.0  # Seconds the race has run.
+
+        self._placed: int = 0  # Number of panes that finished before the current frame.
+
+        self.timer: QTimer = QTimer()  # Frame clock of the race.
+
+        self.timer.setInterval(max(1, round(self.governor.interval * 1000)))
+
+        self.timer.timeout.connect(self.step)
+
+        self.tool_bar: QToolBar = QToolBar("")
+
+        self.tool_bar.setMovable(False)
+
+        self.tool_bar.setFont(QFont("Monaco", 10, QFont.Monospace))
+
+        self.addToolBar(self.tool_bar)
+
+        for title, tip, function in (("Quit", "Closes the race", self.close),
+                                     ("Start / Pause", "Pauses or resumes the race", self.start),
+                                     ("New Input", "Restarts the race on a new input", self.restart)):
+            action: QAction = QAction(title, self)
+            action.setToolTip(tip)
+            action.triggered.connect(function)
+            self.tool_bar.addAction(action)
+            self.tool_bar.addSeparator()
+
+        self.rate_box: QSpinBox = QSpinBox()
+
+        self.rate_box.setToolTip("Number of operations of each algorithm shown per second")
+
+        self.rate_box.setRange(0, 10_000_000)
+
+        self.rate_box.setSpecialValueText("Ops/s: Unlimited")
+
+        self.rate_box.setPrefix("Ops/s: ")
+
+        self.rate_box.setValue(ops_per_second)
+
+        self.rate_box.valueChanged.connect(lambda __value: self.governor.configure(ops_per_second=__value))
+
+        self.tool_bar.addWidget(self.rate_box)
+
+        self.grid: QGridLayout = QGridLayout()
+
+        self.grid.setSpacing(2)
+
+        self.grid.setContentsMargins(0, 0, 0, 0)
+
+        central: QWidget = QWidget()
+
+        central.setLayout(self.grid)
+
+        self.setCentralWidget(central)
+
+        self.restart()
+
+    def pane_size(self) -> tuple[int, int]:
+        """Returns the canvas size of each pane, the panes are laid out in the squarest grid"""
+
+        width, height = resolution()
+        columns: int = ceil(len(self.algorithms) ** 0.5)
+        rows: int = ceil(len(self.algorithms) / columns)
+
+        return (width - 2 * (columns - 1)) // columns, (height - 24 - 2 * (rows - 1)) // rows
+
+    def restart(self) -> None:
+        """Creates the panes on a new input and starts recording every algorithm on it"""
+
+        self.stop()
+
+        width, height = self.pane_size()
+        columns: int = ceil(len(self.algorithms) ** 0.5)
+
+        values: list[int] = scale(generate(self.distribution, self.sample_size, self.seed), self.sample_size, height,
+                                  self.only_positive)
+
+        for i, (name, algorithm) in enumerate(self.algorithms.items()):
+            pane: RacePane = RacePane(name, values, (width, height), only_positive=self.only_positive, **self.colors)
+
+            source: RecordingProcess = RecordingProcess(algorithm, values, only_positive=self.only_positive,
+                                                        economical=self.economical)
+            source.start()
+
+            pane.player = Player(pane, OpLog(values, self.only_positive),
+                                 lambda __pane=pane: self.finish(__pane), source)
+
+            pane.show_counts()
+
+            self.grid.addWidget(pane, i // columns, i % columns)
+            self.panes.append(pane)
+
+        self._elapsed, self._placed = 0.0, 0
+
+    def stop(self) -> None:
+        """Stops the race and removes its panes, cancelling the recordings still running"""
+
+        self.timer.stop()
+        self.running = False
+
+        for pane in self.panes:
+            pane.player.stop()
+            self.grid.removeWidget(pane)
+            pane.deleteLater()
+
+        self.panes.clear()
+
+    def start(self) -> None:
+        """Starts / Pauses / Resumes the race"""
+
+        if all(pane.place for pane in self.panes):
+            self.restart()
+
+        self.running = not self.running
+
+        if self.running:
+            self.governor.restart()
+            self._started = perf_counter() - self._elapsed
+            self.timer.start()
+
+        else:
+            self.timer.stop()
+
+    def step(self) -> None:
+        """Advances every pane by the same number of operations"""
+
+        self._elapsed = perf_counter() - self._started
+
+        budget: int = self.governor.frame_budget()
+
+        for pane in self.panes:
+            if not pane.place:
+                pane.player.step(budget)
+                pane.seconds = self._elapsed if not pane.place else pane.seconds
+                pane.show_counts()
+
+        self._placed = sum(1 for pane in self.panes if pane.place)
+
+    def finish(self, pane: RacePane) -> None:
+        """Gives the pane its place once its algorithm has finished, panes finishing in the same frame tie"""
+
+        pane.place = _PLACES[self._placed] if self._placed < len(_PLACES) else f"{self._placed + 1}th"
+        pane.seconds = self._elapsed
+        pane.clear_highlights()
+        pane.show_counts()
+
+        if all(other.place for other in self.panes):
+            self.timer.stop()
+            self.running = False
+
+    def closeEvent(self, event) -> None:
+        """Cancels the recordings still running"""
+
+        self.stop()
+
+        super().closeEvent(event)
+
+    def run(self) -> None:
+        """Displays the race, it starts with Start / Pause"""
+
+        self.showFullScreen()
+
+        get_app().exec_()
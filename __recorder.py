@@ -0,0 +1,700 @@
+"""Headless recording of sorting algorithms and replay of the recorded operations."""
+
+from __future__ import annotations
+
+from array import array
+from queue import Queue, Empty
+from threading import Thread
+from time import perf_counter
+from typing import Callable, TypeVar, Union
+
+from PyQt5.QtCore import QTimer
+
+from __VisualizingEngine import Bar, READ, WRITE, SWAP, COMPARE, SELECT, DESELECT, ALLOC, AUX_READ, AUX_WRITE, \
+    AUX_ALLOC, AUX_FREE, OP_NAMES, SELECTION
+
+from __auxiliary import Lane, AuxBuffer
+
+from __profiler import PAINT
+
+
+Visual_Array = TypeVar("Visual_Array")
+
+RECORD_WIDTH: int = 4  # Number of integers per record: (op, a, b, c).
+
+RECORDER_VERSION: int = 1  # Version of what is recorded, to be raised whenever the records of a run change.
+
+MAX_OPS: int = 1 << 24  # Default number of records after which a recording is cut off.
+
+BATCH_OPS: int = 1024  # Number of records per batch streamed by a RecordingThread.
+
+MAX_BACKLOG: int = 64  # Number of batches a RecordingThread may run ahead of the player.
+
+CHECKPOINT_OPS: int = 4096  # Fewest records between two checkpoints of a player, at least the array size.
+
+STEP_BACK_LIMIT: int = 256  # Largest backward seek done by inverting records instead of from a checkpoint.
+
+"""Record layouts:
+    READ:     (READ, index, value, 0)
+    WRITE:    (WRITE, index, value, old value)
+    SWAP:     (SWAP, i, j, 0)
+    COMPARE:  (COMPARE, i, j, 0) where j is -1 if the element was compared to a non-array value,
+              an element of an auxiliary buffer at lane index k is given as -2 - k
+    SELECT:   (SELECT, index, 0, 0)
+    DESELECT: (DESELECT, index, 0, 0)
+    ALLOC:    (ALLOC, start, size, 0) for a copy of the elements in [start, start + size)
+    AUX_READ:  (AUX_READ, lane index, value, 0)
+    AUX_WRITE: (AUX_WRITE, lane index, value, old value)
+    AUX_ALLOC: (AUX_ALLOC, start, size, 0) for an auxiliary buffer of the lane elements in [start, start + size)
+    AUX_FREE:  (AUX_FREE, start, size, 0)
+"""
+
+
+class OpLimitReached(Exception):
+    """Raised inside the sorting algorithm once the recording exceeds its maximum number of records"""
+
+
+class RecordingCancelled(Exception):
+    """Raised inside the sorting algorithm of a RecordingThread once it has been cancelled"""
+
+
+class OpLog:
+    """Array-backed log of the operations performed by a sorting algorithm"""
+
+    def __init__(self, initial: list[int], only_positive: bool = False) -> None:
+        self.initial: array = array('i', initial)  # Values of the array before the algorithm ran.
+
+        self.records: array = array('i')  # Flat records, RECORD_WIDTH integers each.
+
+        self.only_positive: bool = only_positive  # Indicates whether the array contains only positive values.
+
+        self.truncated: bool = False  # True if the recording was cut off by its maximum number of records.
+
+    def __len__(self) -> int:
+        """Returns the number of records in the log"""
+
+        return len(self.records) // RECORD_WIDTH
+
+    def __getitem__(self, index: int) -> tuple[int, int, int, int]:
+        """Returns the record at the given index"""
+
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError("record index out of range")
+
+        return tuple(self.records[index * RECORD_WIDTH:(index + 1) * RECORD_WIDTH])
+
+    def final(self) -> list[int]:
+        """Returns the values of the array after applying every record"""
+
+        values: list[int] = self.initial.tolist()
+        records: array = self.records
+
+        for base in range(0, len(records), RECORD_WIDTH):
+            op: int = records[base]
+
+            if op == WRITE:
+                values[records[base + 1]] = records[base + 2]
+
+            elif op == SWAP:
+                i, j = records[base + 1], records[base + 2]
+                values[i], values[j] = values[j], values[i]
+
+        return values
+
+
+class Item(Bar):
+    """Bar read from a RecordingArray, records the comparisons it takes part in"""
+
+    __slots__ = ("index", "owner")
+
+    def __init__(self, value: int, index: int, owner: RecordingArray) -> None:
+        self.val: int = value  # Value of the element, set directly as the comparisons are counted in the log.
+
+        self.index: int = index  # Index the element was read from, -2 - its lane index if auxiliary.
+
+        self.owner: RecordingArray = owner  # Array that records the comparisons.
+
+    def _operand(self, other: Union[Bar, int]) -> int:
+        """Records a comparison with other and returns its value"""
+
+        if isinstance(other, Item):
+            self.owner._record(COMPARE, self.index, other.index)
+            return other.val
+
+        self.owner._record(COMPARE, self.index, -1)
+        return other.val if isinstance(other, Bar) else other
+
+    def __eq__(self, other: Union[Bar, int]) -> bool:
+        return self.val == self._operand(other)
+
+    def __ne__(self, other: Union[Bar, int]) -> bool:
+        return self.val != self._operand(other)
+
+    def __lt__(self, other: Union[Bar, int]) -> bool:
+        return self.val < self._operand(other)
+
+    def __gt__(self, other: Union[Bar, int]) -> bool:
+        return self.val > self._operand(other)
+
+    def __le__(self, other: Union[Bar, int]) -> bool:
+        return self.val <= self._operand(other)
+
+    def __ge__(self, other: Union[Bar, int]) -> bool:
+        return self.val >= self._operand(other)
+
+    def __hash__(self) -> int:
+        return hash(self.val)
+
+    def __repr__(self) -> str:
+        return f"Item({self.val}, {self.index})"
+
+
+def apply(values: array, selected: set[int], records: array, accessed: Union[set[int], None] = None) -> None:
+    """Applies the records to the values and selected indices, the accessed indices are added to accessed"""
+
+    for base in range(0, len(records), RECORD_WIDTH):
+        op, a, b = records[base], records[base + 1], records[base + 2]
+
+        if op == WRITE:
+            values[a] = b
+
+        elif op == SWAP:
+            values[a], values[b] = values[b], values[a]
+
+        elif op == SELECT:
+            selected.add(a)
+
+        elif op == DESELECT:
+            selected.discard(a)
+
+        if accessed is not None and op in (READ, WRITE, SWAP, COMPARE) and 0 <= a:
+            accessed.add(a)
+            accessed.add(b) if op == SWAP or (op == COMPARE and 0 <= b) else ...
+
+
+def heard(records: array, values: array) -> list[int]:
+    """Returns the values accessed by the records, in order. Reads and writes are heard with their value,
+    swaps and comparisons with the values of their elements in the given array"""
+
+    result: list[int] = []
+
+    for base in range(0, len(records), RECORD_WIDTH):
+        op, a, b = records[base], records[base + 1], records[base + 2]
+
+        if op == READ or op == WRITE or op == AUX_READ or op == AUX_WRITE:
+            result.append(b)
+
+        elif op == SWAP:
+            result.append(values[a])
+            result.append(values[b])
+
+        elif op == COMPARE:
+            result.append(values[a]) if 0 <= a else ...
+            result.append(values[b]) if 0 <= b else ...
+
+    return result
+
+
+class RecordingArray:
+    """Lightweight stand-in for the VisualArray that records the operations of a sorting algorithm
+    instead of drawing them"""
+
+    def __init__(self, values: list[int], *, only_positive: bool = False, economical: bool = False,
+                 max_ops: int = MAX_OPS, sink: Callable = None, batch: int = BATCH_OPS) -> None:
+        self._values: list[int] = [int(i) for i in values]  # Current values of the array.
+
+        self.log: OpLog = OpLog(self._values, only_positive)  # Log the operations are recorded to.
+
+        self._records: array = self.log.records  # Records not handed to the sink yet.
+
+        self._sink: Callable = sink  # If given, receives the records in batches instead of the log.
+
+        self._limit: int = (batch if sink else max_ops) * RECORD_WIDTH  # Maximum length of self._records.
+
+        self.only_positive: bool = only_positive  # Indicates whether the array contains only positive values.
+
+        self.economical: bool = economical  # Algorithms use swap() instead of assignments if True.
+
+        self.lane: Lane = Lane()  # Auxiliary buffers of the algorithm.
+
+    def __str__(self) -> str:
+        return str(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def _record(self, op: int, a: int, b: int = 0, c: int = 0) -> None:
+        """Appends a record to the log"""
+
+        self._records.extend((op, a, b, c))
+
+        if self._limit <= len(self._records):
+            if self._sink is None:
+                raise OpLimitReached()
+
+            self.flush()
+
+    def flush(self) -> None:
+        """Hands the records that have not been handed yet to the sink"""
+
+        if self._sink is not None and self._records:
+            records, self._records = self._records, array('i')
+            self._sink(records)
+
+    def __getitem__(self, index: Union[slice, int, Item]) -> Union[Item, list[Item]]:
+        """Records a read of the element at index if index is an int.
+        Else records the reads of the elements in the given index slice"""
+
+        if isinstance(index, slice):
+            indices: range = range(*index.indices(len(self)))
+
+            self._record(ALLOC, indices.start, len(indices))
+
+            return [self[i] for i in indices]
+
+        index = int(index)
+        value: int = self._values[index]
+        index = index if 0 <= index else index + len(self._values)
+
+        self._record(READ, index, value)
+
+        return Item(value, index, self)
+
+    def __setitem__(self, index: Union[slice, int], new_val: Union[list, Item, int]) -> None:
+        """Records a write of new_val at index if index is an int.
+        Else records the writes of the values in the given index slice"""
+
+        if isinstance(index, slice):
+            for i, value in zip(range(*index.indices(len(self))), new_val):
+                self[i] = value
+            return
+
+        index = int(index)
+        value: int = int(new_val)
+        index = index if 0 <= index else index + len(self._values)
+
+        self._record(WRITE, index, value, self._values[index])
+        self._values[index] = value
+
+    def swap(self, i: int, j: int) -> None:
+        """Records a swap of the elements at i and j"""
+
+        self._record(SWAP, i, j)
+        self._values[i], self._values[j] = self._values[j], self._values[i]
+
+    def buffer(self, size: int) -> AuxBuffer:
+        """Records the allocation of an auxiliary buffer of size zeroed elements"""
+
+        start: int = self.lane.allocate(size)
+
+        self._record(AUX_ALLOC, start, size)
+
+        return AuxBuffer(self, start, size)
+
+    def release(self, buffer: AuxBuffer) -> None:
+        """Records the release of an auxiliary buffer"""
+
+        self._record(AUX_FREE, buffer.start, self.lane.free(buffer.start))
+
+    def aux_read(self, index: int) -> Item:
+        """Records a read of the auxiliary element at the given lane index"""
+
+        value: int = self.lane.values[index]
+
+        self._record(AUX_READ, index, value)
+
+        return Item(value, -2 - index, self)
+
+    def aux_write(self, index: int, new_val: Union[Item, int]) -> None:
+        """Records a write of new_val at the given lane index"""
+
+        value: int = int(new_val)
+
+        self._record(AUX_WRITE, index, value, self.lane.values[index])
+        self.lane.values[index] = value
+
+    def select(self, index: int) -> None:
+        """Records the selection of the element at index"""
+
+        self._record(SELECT, index)
+
+    def deselect(self, index: int) -> None:
+        """Records the removal of the selection of the element at index"""
+
+        self._record(DESELECT, index)
+
+
+class CountingArray(RecordingArray):
+    """RecordingArray that only counts the operations by type, without logging them"""
+
+    def __init__(self, values: list[int], *, only_positive: bool = False, economical: bool = False,
+                 max_ops: int = MAX_OPS) -> None:
+        super().__init__(values, only_positive=only_positive, economical=economical, max_ops=max_ops)
+
+        self.counts: array = array('q', bytes(8 * len(OP_NAMES)))  # Number of operations by operation code.
+
+        self._remaining: int = max_ops  # Number of operations left before the run is cut off.
+
+    def _record(self, op: int, a: int, b: int = 0, c: int = 0) -> None:
+        """Counts an operation"""
+
+        self.counts[op] += 1
+        self._remaining -= 1
+
+        if not self._remaining:
+            raise OpLimitReached()
+
+
+def record(algorithm: Callable, values: list[int], *, only_positive: bool = False,
+           economical: bool = False, max_ops: int = MAX_OPS) -> OpLog:
+    """Runs the sorting algorithm on a RecordingArray of the given values, returns the recorded log"""
+
+    arr: RecordingArray = RecordingArray(values, only_positive=only_positive, economical=economical,
+                                         max_ops=max_ops)
+
+    try:
+        algorithm(arr)
+
+    except OpLimitReached:
+        arr.log.truncated = True
+
+    return arr.log
+
+
+class RecordingThread(Thread):
+    """Runs a sorting algorithm on a RecordingArray in a worker thread.
+    The records are streamed in batches through a bounded queue, None marks the end of the recording"""
+
+    def __init__(self, algorithm: Callable, values: list[int], *, only_positive: bool = False,
+                 economical: bool = False, batch: int = BATCH_OPS, backlog: int = MAX_BACKLOG) -> None:
+        super().__init__(daemon=True)
+
+        self.algorithm: Callable = algorithm  # Sorting algorithm that is recorded.
+
+        self.queue: Queue = Queue(backlog)  # Batches of records, blocks the algorithm once full.
+
+        self.array: RecordingArray = RecordingArray(values, only_positive=only_positive, economical=economical,
+                                                    sink=self._send, batch=batch)
+
+        self.cancelled: bool = False  # True once the recording is no longer wanted.
+
+        self.busy: float = 0.0  # Seconds spent running the algorithm, without waiting on the queue.
+
+        self.error: Union[Exception, None] = None  # Exception raised by the algorithm, None if it completed.
+
+        self._blocked: float = 0.0  # Seconds spent waiting on the full queue.
+
+    def _send(self, records: array) -> None:
+        """Puts a batch of records in the queue, waits while the queue is full"""
+
+        if self.cancelled:
+            raise RecordingCancelled()
+
+        began: float = perf_counter()
+        self.queue.put(records)
+        self._blocked += perf_counter() - began
+
+    def run(self) -> None:
+        began: float = perf_counter()
+
+        try:
+            self.algorithm(self.array)
+            self.array.flush()
+
+        except RecordingCancelled:
+            return
+
+        except Exception as error:  # Ends the recording like a completed one, the player checks self.error.
+            self.error = error
+            self.array.flush() if not self.cancelled else ...  # Keeps the records made before the failure.
+
+        finally:
+            self.busy = perf_counter() - began - self._blocked
+            self.queue.put(None) if not self.cancelled else ...
+
+    def get_nowait(self) -> Union[array, None]:
+        """Returns the next batch of records, None once the recording is over. Raises Empty if none is ready"""
+
+        return self.queue.get_nowait()
+
+    def cancel(self) -> None:
+        """Stops the recording, the algorithm exits at its next batch"""
+
+        self.cancelled = True
+
+        while True:  # Empties the queue to release the algorithm if it waits on it.
+            try:
+                self.queue.get_nowait()
+            except Empty:
+                return
+
+
+class Player:
+    """Animates an OpLog on a VisualArray, paced by the frame governor of the VisualArray.
+    If a source is given, a RecordingThread or anything with its get_nowait(), cancel(), busy and error,
+    its records are appended to the log as they are needed"""
+
+    def __init__(self, target: Visual_Array, log: OpLog, on_finish: Callable = None,
+                 source: RecordingThread = None) -> None:
+        self.target: Visual_Array = target  # VisualArray the log is drawn on.
+
+        self.log: OpLog = log  # Log that is played.
+
+        self.source: Union[RecordingThread, None] = source  # Recording that still streams into the log.
+
+        self.position: int = 0  # Index of the next record to be played.
+
+        self._budget: int = 0  # Number of records the current frame may apply.
+
+        self.selected: set[int] = set()  # Indices selected at the current position.
+
+        self.checkpoint_interval: int = max(CHECKPOINT_OPS, len(log.initial))  # Records between two checkpoints.
+
+        self.checkpoints: list[tuple[array, set[int], Lane, array]] = [self.snapshot()]  # State every interval.
+
+        self.on_finish: Callable = on_finish  # Called once the last record has been played.
+
+        self.error: Union[Exception, None] = None  # Exception that ended the recording of the source, if any.
+
+        self.timer: QTimer = QTimer()  # Frame clock of the player.
+
+        self.timer.setInterval(max(1, round(target.governor.interval * 1000)))
+
+        self.timer.timeout.connect(self.step)
+
+    def play(self) -> None:
+        """Starts or resumes the playback"""
+
+        self.target.governor.restart()
+        self.target.profiler.skip_frame() if self.target.profiler else ...
+        self.timer.start()
+
+    def pause(self) -> None:
+        """Pauses the playback"""
+
+        self.timer.stop()
+
+    def stop(self) -> None:
+        """Stops the playback and cancels its source"""
+
+        self.pause()
+
+        if self.source:
+            self.source.cancel()
+            self.source = None
+
+    def snapshot(self) -> tuple[array, set[int], Lane, array]:
+        """Returns the values, selected indices, lane and counters of the target at the current position"""
+
+        target: Visual_Array = self.target
+
+        return array('i', target._values), set(self.selected), target.lane.copy(), array('q', target.counts)
+
+    def restore(self, checkpoint: int) -> None:
+        """Brings the target back to the given checkpoint and moves there"""
+
+        target: Visual_Array = self.target
+        values, selected, lane, counts = self.checkpoints[checkpoint]
+
+        target.load_values(values)
+        target.clear_highlights()
+        target.load_bars()
+
+        self.selected = set(selected)
+
+        for index in selected:
+            target.paint(index, SELECTION)
+
+        drawn: int = len(target.lane.values)
+
+        target.lane = lane.copy()
+        target.lane.values.frombytes(bytes(lane.values.itemsize * max(0, drawn - len(lane.values))))  # Keep it drawn.
+        target.load_lane(0, drawn)
+
+        target.counts[:] = counts
+
+        self.position = checkpoint * self.checkpoint_interval
+
+    def apply(self, end: int, highlight: bool) -> None:
+        """Applies the records from the current position up to end to the target, without rendering.
+        A checkpoint is taken whenever the position reaches a multiple of the checkpoint interval"""
+
+        target: Visual_Array = self.target
+        records: array = self.log.records
+        counts: array = target.counts
+        interval: int = self.checkpoint_interval
+
+        while self.position < end:
+            stop: int = min(end, (self.position // interval + 1) * interval)
+
+            for base in range(self.position * RECORD_WIDTH, stop * RECORD_WIDTH, RECORD_WIDTH):
+                op, a, b = records[base], records[base + 1], records[base + 2]
+
+                counts[op] += 1 if op != SELECT and op != DESELECT else 0  # select() and deselect() count themselves.
+
+                if op == WRITE:
+                    target.bar_at(b, a)
+
+                elif op == SWAP:
+                    values: array = target._values
+                    first, second = values[a], values[b]
+                    target.bar_at(second, a)
+                    target.bar_at(first, b)
+
+                elif op == SELECT:
+                    self.selected.add(a)
+                    target.select(a)
+
+                elif op == DESELECT:
+                    self.selected.discard(a)
+                    target.deselect(a)
+
+                elif highlight and op == READ:
+                    target.highlight(a)
+
+                elif op == AUX_WRITE:
+                    target.aux_at(b, a)
+
+                elif op == AUX_ALLOC:
+                    target.allocate_aux(b)
+
+                elif op == AUX_FREE:
+                    target.free_aux(a)
+
+                elif highlight and op == COMPARE:
+                    target.highlight(a) if 0 <= a else ...
+                    target.highlight(b) if 0 <= b else ...
+
+            self.position = stop
+
+            if not stop % interval and len(self.checkpoints) == stop // interval:
+                self.checkpoints.append(self.snapshot())
+
+    def revert(self) -> None:
+        """Undoes the record before the current position and moves back to it. Records are inverted in O(1),
+        except buffer allocations and releases, which are replayed from the last checkpoint"""
+
+        target: Visual_Array = self.target
+        counts: array = target.counts
+        op, a, b, c = self.log[self.position - 1]
+
+        if op == AUX_ALLOC or op == AUX_FREE:
+            position: int = self.position - 1
+
+            self.restore(min(position // self.checkpoint_interval, len(self.checkpoints) - 1))
+            self.apply(position, False)
+            return
+
+        self.position -= 1
+
+        counts[op] -= 1
+
+        if op == WRITE:
+            target.bar_at(c, a)
+
+        elif op == SWAP:
+            values: array = target._values
+            first, second = values[a], values[b]
+            target.bar_at(second, a)
+            target.bar_at(first, b)
+
+        elif op == SELECT:
+            self.selected.discard(a)
+            target.deselect(a)
+            counts[DESELECT] -= 1
+
+        elif op == DESELECT:
+            self.selected.add(a)
+            target.select(a)
+            counts[SELECT] -= 1
+
+        elif op == AUX_WRITE:
+            target.aux_at(c, a)
+
+        elif op == READ or op == COMPARE:
+            target.highlight(a) if 0 <= a else ...
+            target.highlight(b) if op == COMPARE and 0 <= b else ...
+
+    def seek(self, position: int) -> None:
+        """Moves the target to the state after the given number of records and renders it.
+        Short backward seeks invert records, longer ones replay forward from the nearest checkpoint"""
+
+        position = max(0, min(position, len(self.log)))
+        checkpoint: int = min(position // self.checkpoint_interval, len(self.checkpoints) - 1)
+
+        if position < self.position <= position + STEP_BACK_LIMIT:
+            while position < self.position:
+                self.revert()
+
+        elif position < self.position or self.position < checkpoint * self.checkpoint_interval:
+            self.restore(checkpoint)
+
+        self.apply(position, False)
+
+        self.target.render()
+
+    def step_back(self) -> None:
+        """Undoes a single record and renders the target"""
+
+        self.revert() if self.position else ...
+
+        self.target.render()
+
+    def is_finished(self) -> bool:
+        return self.source is None and len(self.log) <= self.position
+
+    def _receive(self) -> None:
+        """Moves batches from the source to the log until a frame's worth of records is available"""
+
+        while self.source and len(self.log) - self.position < self._budget:
+            try:
+                records: Union[array, None] = self.source.get_nowait()
+            except Empty:
+                return
+
+            if records is None:
+                if self.target.profiler:
+                    self.target.profiler.worker += self.source.busy
+
+                self.error = self.source.error
+                self.log.truncated = self.log.truncated or self.error is not None  # The log is not a complete run.
+
+                self.source = None
+                return
+
+            self.log.records.extend(records)
+
+    def step(self, budget: int = None) -> None:
+        """Applies the records of one frame to the target and updates the screen.
+        The frame applies budget records if given, else as many as the frame governor of the target allows"""
+
+        target: Visual_Array = self.target
+
+        previous: int = target.profiler.switch(PAINT) if target.profiler else 0
+
+        self.timer.setInterval(max(1, round(target.governor.interval * 1000)))
+
+        self._budget = target.governor.frame_budget() if budget is None else budget
+
+        self._receive()
+
+        start, end = self.position, min(len(self.log), self.position + self._budget)
+
+        self.apply(end, not target.economical)
+
+        if target.sonifier:
+            target.sonifier.play(heard(self.log.records[start * RECORD_WIDTH:end * RECORD_WIDTH], target._values),
+                                 target.governor.interval)
+
+        if self.is_finished():
+            self.pause()
+
+        target.render()
+
+        target.profiler.switch(previous) if target.profiler else ...
+
+        if self.is_finished():
+            self.on_finish() if self.on_finish else ...
@@ -0,0 +1,184 @@
+"""Sonification of sorting runs in the style of the Sound of Sorting: every accessed value is heard as a tone whose
+pitch rises with the value.
+
+Audio is synthesized one block per frame, never per access. The tone of every pitch level is precomputed once per
+block length, a block is the sum of the tables of the distinct levels accessed in its frame. Blocks are written to a
+WAV file, or to the default audio device when PyQt5.QtMultimedia and a device are available.
+"""
+
+from __future__ import annotations
+
+import wave
+from array import array
+from math import ceil, pi, sin
+from operator import add
+from sys import byteorder
+from typing import Iterable, Union
+
+from __recorder import OpLog, RECORD_WIDTH, apply, heard
+
+try:
+    from PyQt5.QtMultimedia import QAudio, QAudioDeviceInfo, QAudioFormat, QAudioOutput  # Optional, for live sound.
+except ImportError:
+    QAudioOutput = None
+
+
+SAMPLE_RATE: int = 44100  # Samples per second.
+
+LEVELS: int = 128  # Number of distinct pitches, values are quantized to them.
+
+LOWEST_PITCH: float = 120.0  # Frequency of the lowest value, Hz.
+
+HIGHEST_PITCH: float = 1212.0  # Frequency of the highest value, Hz.
+
+MAX_VOICES: int = 8  # Tones mixed per block, the tones of the last accessed levels are kept.
+
+TABLE_LENGTHS: int = 4  # Block lengths whose tone tables are kept.
+
+FADE_SAMPLES: int = 64  # Samples of the linear fade in and out of every tone, avoids clicks between blocks.
+
+LIVE_BUFFER_SECONDS: float = 0.25  # Audio buffered ahead by the device, blocks that do not fit are dropped.
+
+
+class Sonifier:
+    """Turns the values accessed in a frame into a block of 16 bit mono samples"""
+
+    def __init__(self, highest: int, only_positive: bool, *, rate: int = SAMPLE_RATE, live: bool = False) -> None:
+        self.lowest: int = 1  # Value of the lowest pitch.
+
+        self.span: int = 1  # Values between the lowest and the highest pitch.
+
+        self.set_range(highest, only_positive)
+
+        self.rate: int = rate  # Samples per second.
+
+        self._tables: dict[int, list[array]] = {}  # Tone of each level over one block, by block length.
+
+        self.output: Union[AudioOutput, None] = AudioOutput(rate) if live else None  # Audio device, if any.
+
+    def set_range(self, highest: int, only_positive: bool) -> None:
+        """Maps the pitches to values up to highest, from 1 if only positive, else from -highest"""
+
+        self.lowest = 1 if only_positive else -highest
+        self.span = max(1, highest - self.lowest)
+
+    def level(self, value: int) -> int:
+        """Returns the pitch level of the value"""
+
+        return min(LEVELS - 1, max(0, (value - self.lowest) * (LEVELS - 1) // self.span))
+
+    def tables(self, samples: int) -> list[array]:
+        """Returns the tone of every level over a block of the given length, computed once per length.
+        The last TABLE_LENGTHS lengths are kept, frames alternate between two lengths when fps does not divide rate"""
+
+        if samples not in self._tables:
+            amplitude: float = 32767 / MAX_VOICES
+            fade: int = max(1, min(FADE_SAMPLES, samples // 2))
+
+            envelope: list[float] = [min(1.0, (i + 1) / fade, (samples - i) / fade) for i in range(samples)]
+
+            self._tables[samples] = [array('i', [round(amplitude * envelope[i] * sin(2 * pi * pitch * i / self.rate))
+                                                 for i in range(samples)])
+                                     for pitch in (LOWEST_PITCH + (HIGHEST_PITCH - LOWEST_PITCH) * k / (LEVELS - 1)
+                                                   for k in range(LEVELS))]
+
+            if TABLE_LENGTHS < len(self._tables):
+                del self._tables[next(iter(self._tables))]
+
+        return self._tables[samples]
+
+    def block(self, values: Iterable[int], samples: int) -> array:
+        """Returns a block of the given length in which the values are heard, silence if there are none"""
+
+        levels: list[int] = list(dict.fromkeys(map(self.level, values)))[-MAX_VOICES:]
+
+        if not levels:
+            return array('h', bytes(2 * samples))
+
+        tables: list[array] = self.tables(samples)
+        mixed: array = tables[levels[0]]
+
+        for level in levels[1:]:
+            mixed = array('i', map(add, mixed, tables[level]))
+
+        return array('h', mixed)
+
+    def play(self, values: Iterable[int], seconds: float) -> None:
+        """Sends a block lasting the given seconds to the audio device"""
+
+        self.output.write(self.block(values, max(1, round(seconds * self.rate)))) if self.output else ...
+
+
+class AudioOutput:
+    """Pushes blocks to the default audio device without blocking, does nothing if there is none"""
+
+    def __init__(self, rate: int = SAMPLE_RATE) -> None:
+        self._device = None  # QIODevice the samples are written to, None without an audio device.
+
+        if QAudioOutput is None or QAudioDeviceInfo.defaultOutputDevice().isNull():
+            return
+
+        audio_format: QAudioFormat = QAudioFormat()
+        audio_format.setSampleRate(rate)
+        audio_format.setChannelCount(1)
+        audio_format.setSampleSize(16)
+        audio_format.setCodec("audio/pcm")
+        audio_format.setByteOrder(QAudioFormat.LittleEndian)
+        audio_format.setSampleType(QAudioFormat.SignedInt)
+
+        if not QAudioDeviceInfo.defaultOutputDevice().isFormatSupported(audio_format):
+            return
+
+        self._output: QAudioOutput = QAudioOutput(audio_format)
+
+        self._output.setBufferSize(2 * ceil(rate * LIVE_BUFFER_SECONDS))
+
+        self._device = self._output.start()
+
+    @property
+    def available(self) -> bool:
+        """Indicates whether an audio device is open"""
+
+        return self._device is not None
+
+    def write(self, block: array) -> None:
+        """Queues the block, the part that does not fit in the device buffer is dropped"""
+
+        if self._device is None or self._output.state() == QAudio.StoppedState:
+            return
+
+        data: bytes = block.tobytes()
+
+        self._device.write(data[:self._output.bytesFree() & ~1])
+
+
+def write_wav(log: OpLog, destination: str, *, ops_per_frame: int = 64, fps: int = 30,
+              rate: int = SAMPLE_RATE) -> int:
+    """Writes the sound of the log to a 16 bit mono WAV file, one block of 1 / fps seconds per ops_per_frame records,
+    so that it matches a video exported with the same parameters. Returns the number of blocks"""
+
+    sonifier: Sonifier = Sonifier(max(1, max(map(abs, log.initial), default=1)), log.only_positive, rate=rate)
+
+    values: array = array('i', log.initial)
+    selected: set[int] = set()
+
+    frames: int = max(1, ceil(len(log) / ops_per_frame))
+    step: int = ops_per_frame * RECORD_WIDTH
+
+    with wave.open(destination, "wb") as file:
+        file.setnchannels(1)
+        file.setsampwidth(2)
+        file.setframerate(rate)
+
+        for frame in range(frames):
+            records: array = log.records[frame * step:(frame + 1) * step]
+
+            apply(values, selected, records)
+
+            block: array = sonifier.block(heard(records, values), (frame + 1) * rate // fps - frame * rate // fps)
+
+            block.byteswap() if byteorder == "big" else ...
+
+            file.writeframes(block.tobytes())
+
+    return frames
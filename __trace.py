@@ -0,0 +1,200 @@
+"""Compact binary trace files of sorting runs, loaded through mmap.
+
+A trace is a fixed header, the name of the algorithm, the initial array and the records of the run, all little endian:
+
+    magic        8 bytes   TRACE_MAGIC
+    version      uint32    TRACE_VERSION
+    flags        uint32    FLAG_* bits
+    seed         int64     seed of the input, meaningless without FLAG_SEEDED
+    size         uint32    number of elements
+    name length  uint32    bytes of the algorithm name
+    records      uint64    number of records
+    name         utf-8, padded with zeros to a multiple of 4 bytes
+    initial      size int32
+    records      records * RECORD_WIDTH int32, laid out as in an OpLog
+
+The records are written as they are recorded and loaded as a view of the mapped file, so a trace does not have to
+fit in memory, neither while it is recorded nor while it is replayed or analyzed.
+"""
+
+from __future__ import annotations
+
+from array import array
+from mmap import mmap, ACCESS_READ
+from struct import Struct
+from sys import byteorder
+from typing import BinaryIO, Callable, Union
+
+from __recorder import OpLog, RecordingArray, OpLimitReached, RECORD_WIDTH, BATCH_OPS, MAX_OPS, OP_NAMES
+
+
+TRACE_MAGIC: bytes = b"SVTRACE\0"  # First bytes of every trace file.
+
+TRACE_VERSION: int = 1  # Version of the layout written.
+
+FLAG_ONLY_POSITIVE, FLAG_TRUNCATED, FLAG_SEEDED = 1, 2, 4  # Bits of the flags field.
+
+_HEADER: Struct = Struct("<8sIIqIIQ")  # Fixed part of the header.
+
+_FLAGS_OFFSET: int = 12  # Offset of the flags, patched once the trace is complete.
+
+_RECORDS_OFFSET: int = _HEADER.size - 8  # Offset of the number of records, patched once the trace is complete.
+
+_SCAN_RECORDS: int = 1 << 16  # Records counted per chunk by op_counts().
+
+
+def _little_endian(values: array) -> bytes:
+    """Returns the bytes of an int32 array in little endian order"""
+
+    if byteorder == "big":
+        values = array('i', values)
+        values.byteswap()
+
+    return values.tobytes()
+
+
+class TraceWriter:
+    """Writes a trace file, the records are appended as they arrive. Usable as the sink of a RecordingArray"""
+
+    def __init__(self, path: str, initial: list[int], *, algorithm: str = "", seed: int = None,
+                 only_positive: bool = False) -> None:
+        self.file: BinaryIO = open(path, "wb")  # File the trace is written to.
+
+        self.records: int = 0  # Number of records written so far.
+
+        self.flags: int = FLAG_ONLY_POSITIVE * only_positive | FLAG_SEEDED * (seed is not None)  # Flags of the trace.
+
+        name: bytes = algorithm.encode()
+
+        self.file.write(_HEADER.pack(TRACE_MAGIC, TRACE_VERSION, self.flags, seed or 0, len(initial), len(name), 0))
+        self.file.write(name + bytes(-len(name) % 4))
+        self.file.write(_little_endian(array('i', initial)))
+
+    def write(self, records: array) -> None:
+        """Appends the records to the trace"""
+
+        self.file.write(_little_endian(records))
+        self.records += len(records) // RECORD_WIDTH
+
+    def close(self, truncated: bool = False) -> None:
+        """Writes the number of records and the final flags to the header and closes the file"""
+
+        self.flags |= FLAG_TRUNCATED * truncated
+
+        self.file.seek(_FLAGS_OFFSET)
+        self.file.write(Struct("<I").pack(self.flags))
+
+        self.file.seek(_RECORDS_OFFSET)
+        self.file.write(Struct("<Q").pack(self.records))
+
+        self.file.close()
+
+
+class Trace(OpLog):
+    """OpLog of a trace file, its records are a read only view of the mapped file. Close it once done"""
+
+    def __init__(self, path: str) -> None:
+        with open(path, "rb") as file:
+            self._map: mmap = mmap(file.fileno(), 0, access=ACCESS_READ)
+
+        magic, version, flags, seed, size, name_length, records = _HEADER.unpack_from(self._map)
+
+        if magic != TRACE_MAGIC or version != TRACE_VERSION:
+            self._map.close()
+            raise ValueError(f"{path} is not a version {TRACE_VERSION} trace")
+
+        name_end: int = _HEADER.size + name_length
+        initial_end: int = name_end + -name_length % 4 + 4 * size
+
+        initial: array = array('i')
+        initial.frombytes(self._map[initial_end - 4 * size:initial_end])
+        initial.byteswap() if byteorder == "big" else ...
+
+        super().__init__(initial, bool(flags & FLAG_ONLY_POSITIVE))
+
+        self.truncated = bool(flags & FLAG_TRUNCATED)
+
+        self.algorithm: str = self._map[_HEADER.size:name_end].decode()  # Name of the algorithm that ran.
+
+        self.seed: Union[int, None] = seed if flags & FLAG_SEEDED else None  # Seed of the input, if known.
+
+        self._view: memoryview = memoryview(self._map)[initial_end:initial_end + 4 * RECORD_WIDTH * records]
+
+        if byteorder == "little":
+            self.records = self._view.cast('i')  # Records read straight from the mapped file.
+
+        else:
+            self.records = array('i')
+            self.records.frombytes(self._view)
+            self.records.byteswap()
+
+    def op_counts(self) -> dict[str, int]:
+        """Returns the number of records of each operation, scanned in chunks"""
+
+        counts: list[int] = [0] * len(OP_NAMES)
+        step: int = _SCAN_RECORDS * RECORD_WIDTH
+
+        for start in range(0, len(self.records), step):
+            for op in self.records[start:start + step:RECORD_WIDTH]:
+                counts[op] += 1
+
+        return dict(zip(OP_NAMES, counts))
+
+    def close(self) -> None:
+        """Releases the views of the file and unmaps it"""
+
+        self.records.release() if isinstance(self.records, memoryview) else ...
+        self.records = array('i')
+
+        self._view.release()
+        self._map.close()
+
+    def __enter__(self) -> Trace:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def save_trace(log: OpLog, path: str, *, algorithm: str = "", seed: int = None) -> None:
+    """Writes a recorded log to a trace file"""
+
+    writer: TraceWriter = TraceWriter(path, log.initial.tolist(), algorithm=algorithm, seed=seed,
+                                      only_positive=log.only_positive)
+
+    writer.write(array('i', log.records))
+    writer.close(log.truncated)
+
+
+def record_trace(algorithm: Callable, values: list[int], path: str, *, name: str = "", seed: int = None,
+                 only_positive: bool = False, economical: bool = False, max_ops: int = MAX_OPS) -> int:
+    """Runs the sorting algorithm on a RecordingArray of the values, streaming its records to a trace file.
+    Only a batch of records is held in memory at a time. Returns the number of records"""
+
+    writer: TraceWriter = TraceWriter(path, values, algorithm=name, seed=seed, only_positive=only_positive)
+
+    def write(records: array) -> None:
+        """Writes a batch, the recording is cut off after its first max_ops records"""
+
+        if max_ops < writer.records + len(records) // RECORD_WIDTH:
+            writer.write(records[:(max_ops - writer.records) * RECORD_WIDTH])
+            raise OpLimitReached()
+
+        writer.write(records)
+
+    arr: RecordingArray = RecordingArray(values, only_positive=only_positive, economical=economical,
+                                         sink=write, batch=BATCH_OPS)
+
+    truncated: bool = False
+
+    try:
+        algorithm(arr)
+        arr.flush()
+
+    except OpLimitReached:
+        truncated = True
+
+    finally:
+        writer.close(truncated)
+
+    return writer.records
@@ -1,48 +1,43 @@
 """Messy import file"""
 
 from __VisualizingEngine import Union, \
-    _resolution, Color, ticker, MainWindow, ThreadedTask, QAction, QPushButton, QFont, app
+    resolution, headless, get_app, Color, MainWindow, QAction, QPushButton, QFont, AGGREGATIONS, \
+    BACKGROUND, BAR, ACCESS, SELECTION, QColor
 
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
 
-from PyQt5.QtWidgets import QSlider, QMenu
+from PyQt5.QtWidgets import QSlider, QMenu, QSpinBox, QAbstractSpinBox, QLabel
 
-from random import randint, shuffle as true_shuffle
+from random import shuffle as true_shuffle, randrange
 
 from sys import exit as sysexit
 
 from __builtin_algorithms import *
 
-from time import sleep
+from __VisualizingEngine import Bar, READ, WRITE, SWAP, COMPARE, SELECT, ALLOC, AUX_READ, AUX_WRITE, AUX_ALLOC, \
+    AUX_FREE  # Imported after the algorithms,
+# which only define Bar as a TypeVar.
 
-VisualArray = list[any]
-
-SortingAlgorithm = Union[Callable[Union[VisualArray, list], any], None]
+from __recorder import Player, OpLog, RecordingThread
 
+from __auxiliary import AuxBuffer
 
-def shuffle(arr: any) -> None:
-    return true_shuffle(arr)
-
+from __cache import TraceCache, cache_key
 
-def rand_array(begin: int, end: int, size: int, true_rand: bool) -> [int]:
-    if true_rand:
-        return [randint(begin, end) for _ in range(size)]
+from __profiler import Profiler, ALGORITHM, EVENTS
 
-    increase: float = _resolution[1] / size
+from __generators import GENERATORS, generate, scale
 
-    result: list[int] = [round((i + (1 if 0 <= i else 0)) * increase) if -1 <= i
-                         else (i + (1 if 0 <= i else 0)) * increase
-                         for i in range(-size // 2, size // 2)] \
-        if begin < 0 else \
-        [(i + 1) * increase for i in range(size)]
+from __sonify import Sonifier
 
-    shuffle(result)
+from time import perf_counter
 
-    return result
+from traceback import print_exception
 
+VisualArray = list[any]
 
-def ge_factors(n: int) -> list[int]:
-    return [n // i for i in range(int(n ** 0.5) * 2, 0, -1) if not n % i]
+SortingAlgorithm = Union[Callable[Union[VisualArray, list], any], None]
 
 
-_TWR_FACTORS: list[int] = ge_factors(_resolution[0])
+def shuffle(arr: any) -> None:
+    return true_shuffle(arr)
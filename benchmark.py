@@ -0,0 +1,171 @@
+"""Headless benchmark of the builtin sorting algorithms across sizes and input shapes.
+
+Runs every algorithm on a CountingArray, without any window, and records the wall time, the number of
+comparisons, reads, writes, swaps and slice copies, the reads, writes and peak elements of the auxiliary
+buffers, and the peak auxiliary memory of each run.
+
+Usage: python3 benchmark.py --sizes 64 256 1024 --json results.json --csv results.csv --compare baseline.json
+"""
+
+from __future__ import annotations
+
+from argparse import ArgumentParser, BooleanOptionalAction, Namespace
+from csv import DictWriter
+from json import dump, load
+from platform import python_version
+from time import perf_counter, strftime
+from tracemalloc import start as start_tracing, stop as stop_tracing, get_traced_memory, reset_peak
+from typing import Callable
+
+from __generators import GENERATORS, generate
+from __recorder import CountingArray, OpLimitReached, OP_NAMES, READ, WRITE, SWAP, COMPARE, SELECT, ALLOC, \
+    AUX_READ, AUX_WRITE
+from VisualArray import _BUILTIN_FUNCS
+
+
+SHAPES: tuple[str, ...] = ("random", "sorted", "reversed", "true_random")  # Default input shapes of the benchmark.
+
+FIELDS: tuple[str, ...] = ("algorithm", "shape", "size", "seconds", "comparisons", "reads", "writes", "swaps",
+                           "selects", "allocations", "aux_reads", "aux_writes", "peak_aux_elements",
+                           "peak_aux_bytes", "sorted", "truncated")  # Columns of the results.
+
+
+def sort(algorithm: Callable, arr: CountingArray) -> CountingArray:
+    """Runs the algorithm on the array, a run cut off by its maximum number of operations is marked truncated"""
+
+    try:
+        algorithm(arr)
+
+    except OpLimitReached:
+        arr.log.truncated = True
+
+    return arr
+
+
+def run_once(algorithm: Callable, values: list[int], economical: bool, max_ops: int) -> CountingArray:
+    """Runs the algorithm on a CountingArray of the values, returns the array"""
+
+    return sort(algorithm, CountingArray(values, only_positive=True, economical=economical, max_ops=max_ops))
+
+
+def peak_memory(algorithm: Callable, values: list[int], economical: bool, max_ops: int) -> int:
+    """Returns the peak number of bytes allocated by the algorithm on top of its input array.
+    The array is built before tracing starts, so its copy of the values is not counted"""
+
+    arr: CountingArray = CountingArray(values, only_positive=True, economical=economical, max_ops=max_ops)
+
+    start_tracing()
+
+    try:
+        baseline: int = get_traced_memory()[0]
+        reset_peak()
+        sort(algorithm, arr)
+        return max(0, get_traced_memory()[1] - baseline)
+
+    finally:
+        stop_tracing()
+
+
+def benchmark(name: str, shape: str, size: int, args: Namespace) -> dict:
+    """Benchmarks a single algorithm on a single input, returns a row of results"""
+
+    algorithm: Callable = _BUILTIN_FUNCS[name]
+    values: list[int] = generate(shape, size, args.seed)
+
+    seconds: float = float("inf")
+
+    for _ in range(args.repeat):
+        began: float = perf_counter()
+        arr: CountingArray = run_once(algorithm, values, args.economical, args.max_ops)
+        seconds = min(seconds, perf_counter() - began)
+
+    counts = arr.counts
+
+    return {"algorithm": name, "shape": shape, "size": size, "seconds": round(seconds, 6),
+            "comparisons": counts[COMPARE], "reads": counts[READ], "writes": counts[WRITE],
+            "swaps": counts[SWAP], "selects": counts[SELECT], "allocations": counts[ALLOC],
+            "aux_reads": counts[AUX_READ], "aux_writes": counts[AUX_WRITE], "peak_aux_elements": arr.lane.peak,
+            "peak_aux_bytes": peak_memory(algorithm, values, args.economical, args.max_ops) if args.memory else None,
+            "sorted": arr._values == sorted(values), "truncated": arr.log.truncated}
+
+
+def compare(rows: list[dict], path: str) -> None:
+    """Prints the time and operation ratios of the rows against the rows of a previous JSON result"""
+
+    with open(path) as file:
+        baseline: dict = {(row["algorithm"], row["shape"], row["size"]): row for row in load(file)["results"]}
+
+    print(f"\n{'algorithm':<22}{'shape':<15}{'size':>6}{'time ratio':>12}{'ops ratio':>11}")
+
+    for row in rows:
+        old: dict = baseline.get((row["algorithm"], row["shape"], row["size"]))
+
+        if old is None:
+            continue
+
+        ops: int = sum(row[field] for field in ("comparisons", "reads", "writes", "swaps"))
+        old_ops: int = sum(old[field] for field in ("comparisons", "reads", "writes", "swaps"))
+
+        print(f"{row['algorithm']:<22}{row['shape']:<15}{row['size']:>6}"
+              f"{row['seconds'] / old['seconds'] if old['seconds'] else 0:>12.3f}"
+              f"{ops / old_ops if old_ops else 0:>11.3f}")
+
+
+def main() -> None:
+    parser: ArgumentParser = ArgumentParser(description=__doc__.split("\n\n")[0])
+
+    parser.add_argument("--sizes", type=int, nargs="+", default=[64, 256, 1024], help="Array sizes")
+    parser.add_argument("--shapes", nargs="+", default=list(SHAPES), choices=list(GENERATORS),
+                        help="Input shapes, see __generators.py")
+    parser.add_argument("--algorithms", nargs="+", default=None, help="Algorithms to run, all by default")
+    parser.add_argument("--skip", nargs="+", default=["Bogo Sort"], help="Algorithms not to run")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the inputs")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per measurement, the fastest is kept")
+    parser.add_argument("--max-ops", type=int, default=50_000_000, help="Operations after which a run is cut off")
+    parser.add_argument("--economical", action=BooleanOptionalAction, default=True,
+                        help="Let the algorithms use swap() instead of assignments")
+    parser.add_argument("--memory", action=BooleanOptionalAction, default=True,
+                        help="Measure the peak auxiliary memory in an extra traced run")
+    parser.add_argument("--json", help="Path of the JSON output")
+    parser.add_argument("--csv", help="Path of the CSV output")
+    parser.add_argument("--compare", help="Path of a previous JSON output to compare against")
+
+    args: Namespace = parser.parse_args()
+
+    names: list[str] = [name for name in (args.algorithms or _BUILTIN_FUNCS) if name not in args.skip]
+
+    rows: list[dict] = []
+
+    print(("{:<22}{:<15}{:>6}{:>11}" + "{:>12}" * 6 + "{:>15}").format(
+        "algorithm", "shape", "size", "seconds", "comparisons", "reads", "writes", "swaps", "aux r+w", "aux peak",
+        "peak aux B"))
+
+    for name in names:
+        for shape in args.shapes:
+            for size in args.sizes:
+                row: dict = benchmark(name, shape, size, args)
+                rows.append(row)
+
+                print(("{:<22}{:<15}{:>6}{:>11.4f}" + "{:>12}" * 6 + "{:>15}{}").format(
+                    name, shape, size, row["seconds"], row["comparisons"], row["reads"], row["writes"],
+                    row["swaps"], row["aux_reads"] + row["aux_writes"], row["peak_aux_elements"],
+                    str(row["peak_aux_bytes"]),
+                    "" if row["sorted"] else "  NOT SORTED" + (" (truncated)" if row["truncated"] else "")))
+
+    if args.json:
+        with open(args.json, "w") as file:
+            dump({"date": strftime("%Y-%m-%d %H:%M:%S"), "python": python_version(), "seed": args.seed,
+                  "economical": args.economical, "operations": OP_NAMES, "results": rows}, file, indent=1)
+
+    if args.csv:
+        with open(args.csv, "w", newline="") as file:
+            writer: DictWriter = DictWriter(file, FIELDS)
+            writer.writeheader()
+            writer.writerows(rows)
+
+    if args.compare:
+        compare(rows, args.compare)
+
+
+if __name__ == "__main__":
+    main()
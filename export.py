@@ -0,0 +1,77 @@
+"""Offline export of a sorting run as a PNG sequence or an animated image, and its sound as a WAV file.
+
+Records the algorithm without any window, then renders the frames offscreen on every CPU core, independently
+of the display and much faster than the animation itself. Recorded runs are cached, exporting the same run again
+skips the recording.
+
+Usage: python3 export.py --algorithm "Merge Sort" --size 1920 --animation merge_sort.gif --wav merge_sort.wav
+"""
+
+from __future__ import annotations
+
+from argparse import ArgumentParser, Namespace
+from math import ceil
+from time import perf_counter
+
+from __VisualizingEngine import AGGREGATIONS
+from __cache import TraceCache, CACHE_DIRECTORY
+from __exporter import export, to_animation
+from __generators import GENERATORS, generate
+from __recorder import OpLog
+from __sonify import write_wav
+from VisualArray import _BUILTIN_FUNCS
+
+
+def main() -> None:
+    parser: ArgumentParser = ArgumentParser(description=__doc__.split("\n\n")[0])
+
+    parser.add_argument("--algorithm", default="Merge Sort", choices=list(_BUILTIN_FUNCS), help="Algorithm to run")
+    parser.add_argument("--size", type=int, default=1920, help="Array size")
+    parser.add_argument("--shape", default="random", choices=list(GENERATORS), help="Input shape")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the input")
+    parser.add_argument("--economical", action="store_true", help="Let the algorithm use swap() instead of assignments")
+    parser.add_argument("--ops-per-frame", type=int, help="Records per frame, derived from --duration by default")
+    parser.add_argument("--duration", type=float, default=20, help="Seconds the animation lasts at --fps")
+    parser.add_argument("--fps", type=int, default=30, help="Frame rate of the animation")
+    parser.add_argument("--width", type=int, default=1920, help="Frame width")
+    parser.add_argument("--height", type=int, default=1080, help="Frame height")
+    parser.add_argument("--aggregation", default="max", choices=list(AGGREGATIONS),
+                        help="Value shown by a pixel column of several elements")
+    parser.add_argument("--workers", type=int, help="Rendering processes, one per CPU core by default")
+    parser.add_argument("--frames-dir", default="frames", help="Directory of the PNG sequence")
+    parser.add_argument("--animation", help="Path of an animated image (.gif, .webp, .png), requires Pillow")
+    parser.add_argument("--wav", help="Path of a WAV file of the sound of the run, in sync with the frames")
+    parser.add_argument("--cache-dir", default=CACHE_DIRECTORY, help="Directory of the cached runs")
+    parser.add_argument("--cache-mb", type=int, default=2048, help="Size budget of the cached runs, 0 disables it")
+
+    args: Namespace = parser.parse_args()
+
+    began: float = perf_counter()
+
+    cache: TraceCache = TraceCache(args.cache_dir, disk_bytes=args.cache_mb << 20)
+
+    log: OpLog = cache.record(_BUILTIN_FUNCS[args.algorithm], generate(args.shape, args.size, args.seed),
+                              only_positive=True, economical=args.economical)
+
+    print(f"Cache: {cache.summary()}")
+
+    ops_per_frame: int = args.ops_per_frame or max(1, ceil(len(log) / (args.duration * args.fps)))
+
+    frames: int = export(log, args.frames_dir, ops_per_frame=ops_per_frame, width=args.width, height=args.height,
+                         workers=args.workers, aggregation=args.aggregation)
+
+    print(f"{len(log)} operations, {frames} frames of {ops_per_frame} operations in {args.frames_dir}")
+
+    if args.animation:
+        to_animation(args.frames_dir, frames, args.animation, args.fps)
+        print(f"Animation written to {args.animation}")
+
+    if args.wav:
+        write_wav(log, args.wav, ops_per_frame=ops_per_frame, fps=args.fps)
+        print(f"Sound written to {args.wav}")
+
+    print(f"Done in {perf_counter() - began:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,286 @@
+"""Micro-benchmark of the overhead of the visualizer over a plain list.
+
+Measures the throughput of the VisualArray operations (reads, writes, swaps, slices, shuffle, change_size, end_sort)
+and of a whole sorting algorithm, on Qt's offscreen platform, in economical and non-economical modes, against the same
+operations on a plain list. The overhead is the ratio of the two throughputs.
+
+Usage: python3 overhead.py --size 1024 --json overhead.json --compare baseline.json
+"""
+
+from __future__ import annotations
+
+from argparse import ArgumentParser, Namespace
+from csv import DictWriter
+from json import dump, load
+from platform import python_version
+from random import shuffle
+from sys import exit as sysexit
+from time import perf_counter, strftime
+from typing import Callable, Union
+
+from __VisualizingEngine import headless
+from __generators import generate, scale
+from VisualArray import VisualArray, _BUILTIN_FUNCS
+
+
+CASES: tuple[str, ...] = ("getitem", "setitem", "swap", "slice", "shuffle", "change_size", "end_sort",
+                          "algorithm")  # Measured operations.
+
+FIELDS: tuple[str, ...] = ("case", "economical", "size", "visual_ops", "list_ops", "overhead")  # Columns of a result.
+
+
+class PlainBuffer(list):
+    """Auxiliary buffer of a PlainArray, a list that can be released"""
+
+    def release(self) -> None:
+        ...
+
+    def __enter__(self) -> PlainBuffer:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        ...
+
+
+class PlainArray(list):
+    """List with the interface the sorting algorithms expect from a VisualArray, at the cost of a list"""
+
+    def __init__(self, values: list[int], economical: bool) -> None:
+        super().__init__(values)
+
+        self.only_positive: bool = True  # The benchmark inputs are positive.
+
+        self.economical: bool = economical  # Algorithms use swap() instead of assignments if True.
+
+    def swap(self, i: int, j: int) -> None:
+        self[i], self[j] = self[j], self[i]
+
+    def buffer(self, size: int) -> PlainBuffer:
+        return PlainBuffer([0] * size)
+
+    def select(self, index: int) -> None:
+        ...
+
+    def deselect(self, index: int) -> None:
+        ...
+
+
+def timed(function: Callable[[], int], repeat: int) -> float:
+    """Returns the highest number of operations per second of the function over repeat runs,
+    the function returns the number of operations it did"""
+
+    best: float = 0.0
+
+    for _ in range(repeat):
+        began: float = perf_counter()
+        ops: int = function()
+        best = max(best, ops / max(perf_counter() - began, 1e-9))
+
+    return best
+
+
+def visual_cases(arr: VisualArray, args: Namespace) -> dict[str, Callable[[], int]]:
+    """Returns the measured operations on the visual array"""
+
+    size: int = len(arr)
+    pairs: list[tuple[int, int]] = [(i, (i * 7 + 3) % size) for i in range(size)]
+    algorithm: Callable = _BUILTIN_FUNCS[args.algorithm]
+
+    def getitem() -> int:
+        for i in range(size):
+            arr[i]
+        return size
+
+    def setitem() -> int:
+        values: list[int] = arr._values.tolist()
+        for i in range(size):
+            arr[i] = values[i]
+        return size
+
+    def swap() -> int:
+        for i, j in pairs:
+            arr.swap(i, j)
+        return size
+
+    def slice_access() -> int:
+        for _ in range(args.slices):
+            arr[0:size]
+        return args.slices * size
+
+    def shuffle_array() -> int:
+        arr.shuffle()
+        arr.running = True
+        return size
+
+    def change_size() -> int:
+        arr.change_size(size)
+        arr.running = True
+        return size
+
+    def end_sort() -> int:
+        arr.end_sort()
+        arr.running = True
+        return size
+
+    def run_algorithm() -> int:
+        arr.load_values(arr.rand_values())
+        arr.clear()
+        arr.reset_counts()
+        algorithm(arr)
+        return sum(arr.counts)
+
+    return {"getitem": getitem, "setitem": setitem, "swap": swap, "slice": slice_access, "shuffle": shuffle_array,
+            "change_size": change_size, "end_sort": end_sort, "algorithm": run_algorithm}
+
+
+def list_cases(values: list[int], inputs: list[int], economical: bool, args: Namespace,
+               operations: int) -> dict[str, Union[Callable[[], int], None]]:
+    """Returns the same operations on a plain list of the values, None for those without an equivalent.
+    The algorithm sorts the same inputs as on the visual array, and is credited with the operations it did there"""
+
+    size: int = len(values)
+    arr: PlainArray = PlainArray(values, economical)
+    pairs: list[tuple[int, int]] = [(i, (i * 7 + 3) % size) for i in range(size)]
+    algorithm: Callable = _BUILTIN_FUNCS[args.algorithm]
+
+    def getitem() -> int:
+        for i in range(size):
+            arr[i]
+        return size
+
+    def setitem() -> int:
+        for i in range(size):
+            arr[i] = values[i]
+        return size
+
+    def swap() -> int:
+        for i, j in pairs:
+            arr.swap(i, j)
+        return size
+
+    def slice_access() -> int:
+        for _ in range(args.slices):
+            arr[0:size]
+        return args.slices * size
+
+    def shuffle_list() -> int:
+        shuffle(arr)
+        return size
+
+    def change_size() -> int:
+        arr[:] = scale(generate("random", size, args.seed), size, args.height, True)
+        return size
+
+    def run_algorithm() -> int:
+        arr[:] = inputs
+        algorithm(arr)
+        return operations
+
+    return {"getitem": getitem, "setitem": setitem, "swap": swap, "slice": slice_access, "shuffle": shuffle_list,
+            "change_size": change_size, "end_sort": None, "algorithm": run_algorithm}
+
+
+def measure(economical: bool, args: Namespace) -> list[dict]:
+    """Measures every case in one mode, returns a row per case"""
+
+    arr: VisualArray = VisualArray(sample_size=args.size, only_positive=True, economical=economical, delay=0,
+                                   fps=args.fps, recorded=False, seed=args.seed, cached=False)
+    arr.running = True
+
+    visual: dict[str, Callable[[], int]] = visual_cases(arr, args)
+
+    rows: list[dict] = []
+
+    for case in args.cases:
+        visual_ops: float = timed(visual[case], args.repeat)
+
+        plain: Union[Callable[[], int], None] = list_cases(arr._values.tolist(), arr.rand_values(), economical, args,
+                                                           sum(arr.counts))[case]
+        list_ops: Union[float, None] = timed(plain, args.repeat) if plain else None
+
+        rows.append({"case": case, "economical": economical, "size": args.size, "visual_ops": round(visual_ops),
+                     "list_ops": round(list_ops) if list_ops else None,
+                     "overhead": round(list_ops / visual_ops, 2) if list_ops and visual_ops else None})
+
+    arr.close()
+
+    return rows
+
+
+def compare(rows: list[dict], path: str, tolerance: float) -> bool:
+    """Prints the overheads of the rows against those of a previous JSON result.
+    Returns False if an overhead grew by more than the tolerance"""
+
+    with open(path) as file:
+        baseline: dict = {(row["case"], row["economical"], row["size"]): row for row in load(file)["results"]}
+
+    print(f"\n{'case':<14}{'economical':>11}{'size':>7}{'baseline':>11}{'now':>9}{'ratio':>9}")
+
+    passed: bool = True
+
+    for row in rows:
+        old: dict = baseline.get((row["case"], row["economical"], row["size"]))
+
+        if old is None or not old["overhead"] or not row["overhead"]:
+            continue
+
+        ratio: float = row["overhead"] / old["overhead"]
+        passed &= ratio <= tolerance
+
+        print(f"{row['case']:<14}{str(row['economical']):>11}{row['size']:>7}{old['overhead']:>11.2f}"
+              f"{row['overhead']:>9.2f}{ratio:>9.3f}{'  SLOWER' if tolerance < ratio else ''}")
+
+    return passed
+
+
+def main() -> None:
+    parser: ArgumentParser = ArgumentParser(description=__doc__.split("\n\n")[0])
+
+    parser.add_argument("--size", type=int, default=1024, help="Array size")
+    parser.add_argument("--cases", nargs="+", default=list(CASES), choices=list(CASES), help="Operations to measure")
+    parser.add_argument("--algorithm", default="Quick Sort", choices=list(_BUILTIN_FUNCS),
+                        help="Algorithm of the algorithm case")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the inputs")
+    parser.add_argument("--fps", type=int, default=60, help="Frame rate of the visual array, frames cost time too")
+    parser.add_argument("--slices", type=int, default=16, help="Full slices per slice measurement")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement, the fastest is kept")
+    parser.add_argument("--width", type=int, default=1920, help="Width of the offscreen screen")
+    parser.add_argument("--height", type=int, default=1080, help="Height of the offscreen screen")
+    parser.add_argument("--json", help="Path of the JSON output")
+    parser.add_argument("--csv", help="Path of the CSV output")
+    parser.add_argument("--compare", help="Path of a previous JSON output to compare against")
+    parser.add_argument("--tolerance", type=float, default=1.1,
+                        help="Largest accepted growth of an overhead against --compare, exits with 1 above it")
+
+    args: Namespace = parser.parse_args()
+
+    headless(args.width, args.height)  # Before any window is created.
+
+    rows: list[dict] = []
+
+    print(f"{'case':<14}{'economical':>11}{'size':>7}{'visual ops/s':>15}{'list ops/s':>15}{'overhead':>10}")
+
+    for economical in (False, True):
+        for row in measure(economical, args):
+            rows.append(row)
+
+            print(f"{row['case']:<14}{str(economical):>11}{row['size']:>7}{row['visual_ops']:>15,}"
+                  + (f"{row['list_ops']:>15,}{row['overhead']:>9.1f}x" if row["overhead"] else f"{'-':>15}{'-':>10}"))
+
+    if args.json:
+        with open(args.json, "w") as file:
+            dump({"date": strftime("%Y-%m-%d %H:%M:%S"), "python": python_version(), "seed": args.seed,
+                  "fps": args.fps, "algorithm": args.algorithm, "results": rows}, file, indent=1)
+
+    if args.csv:
+        with open(args.csv, "w", newline="") as file:
+            writer: DictWriter = DictWriter(file, FIELDS)
+            writer.writeheader()
+            writer.writerows(rows)
+
+    if args.compare and not compare(rows, args.compare, args.tolerance):
+        sysexit(1)
+
+
+if __name__ == "__main__":
+    main()
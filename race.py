@@ -0,0 +1,40 @@
+"""Race of builtin sorting algorithms on the same input, side by side.
+
+Every algorithm is recorded in a process of its own and replayed in a pane of one window, all panes showing the
+same number of operations per second.
+
+Usage: python3 race.py "Quick Sort" "Intro Sort" "Tim Sort" --size 512 --distribution nearly_sorted --seed 0
+"""
+
+from __future__ import annotations
+
+from argparse import ArgumentParser, Namespace
+
+from __generators import GENERATORS
+from __race import RaceWindow
+from VisualArray import _BUILTIN_FUNCS
+
+
+def main() -> None:
+    parser: ArgumentParser = ArgumentParser(description=__doc__.split("\n\n")[0])
+
+    parser.add_argument("algorithms", nargs="*", default=["Quick Sort", "Intro Sort", "Tim Sort"],
+                        choices=list(_BUILTIN_FUNCS), metavar="algorithm", help="Algorithms that race")
+    parser.add_argument("--size", type=int, default=512, help="Array size")
+    parser.add_argument("--distribution", default="random", choices=list(GENERATORS), help="Input distribution")
+    parser.add_argument("--seed", type=int, help="Seed of the input, a new input every race by default")
+    parser.add_argument("--signed", action="store_true", help="Use positive and negative values")
+    parser.add_argument("--economical", action="store_true", help="Let the algorithms use swap() instead of assignments")
+    parser.add_argument("--fps", type=int, default=60, help="Frame rate")
+    parser.add_argument("--ops-per-second", type=int, default=5000,
+                        help="Operations of each algorithm shown per second, 0 for unlimited")
+
+    args: Namespace = parser.parse_args()
+
+    RaceWindow({name: _BUILTIN_FUNCS[name] for name in args.algorithms}, args.size,
+               distribution=args.distribution, seed=args.seed, only_positive=not args.signed,
+               economical=args.economical, fps=args.fps, ops_per_second=args.ops_per_second).run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,9 @@
+"""Makes the modules of the repository importable and runs Qt without a display"""
+
+from os import environ
+from os.path import dirname, abspath
+from sys import path
+
+environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+path.insert(0, dirname(dirname(abspath(__file__))))
@@ -0,0 +1,9 @@
+from __auxiliary import Lane
+
+
+def test_allocate_grows_by_elements() -> None:
+    lane = Lane()
+
+    assert (lane.allocate(10), lane.allocate(5)) == (0, 10)
+    assert len(lane.values) == lane.used == 15
+    assert lane.values.tolist() == [0] * 15
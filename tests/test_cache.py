@@ -0,0 +1,112 @@
+from random import Random
+from time import sleep
+
+from __cache import TraceCache, cache_key
+from __recorder import OpLog, record
+from __builtin_algorithms import insertion_sort, tim_sort
+from VisualArray import VisualArray
+
+
+def log_of(size: int, records: int) -> OpLog:
+    """Returns a log of size values and records reads, 4 * (size + 4 * records) bytes"""
+
+    log = OpLog(list(range(size)))
+    log.records.extend([0] * 4 * records)
+    return log
+
+
+def test_key() -> None:
+    values: list[int] = Random(3).sample(range(100), 100)
+
+    assert cache_key(tim_sort, values) == cache_key(tim_sort, list(values))
+    assert cache_key(tim_sort, values) != cache_key(insertion_sort, values)
+    assert cache_key(tim_sort, values) != cache_key(tim_sort, values, only_positive=True)
+    assert cache_key(tim_sort, values) != cache_key(tim_sort, values[::-1])
+
+
+def test_record_hits(tmp_path) -> None:
+    values: list[int] = Random(4).sample(range(100), 100)
+    cache = TraceCache(str(tmp_path))
+
+    log = cache.record(tim_sort, values)
+
+    assert cache.record(tim_sort, values) is log
+    assert TraceCache(str(tmp_path)).record(tim_sort, values).records.tolist() == log.records.tolist()
+    assert record(tim_sort, values).records.tolist() == log.records.tolist()
+
+
+def test_memory_evicts_least_recently_used(tmp_path) -> None:
+    cache = TraceCache(None, memory_bytes=2 * 4 * (10 + 4 * 100))
+
+    cache.put("a", log_of(10, 100))
+    cache.put("b", log_of(10, 100))
+    cache.get("a")
+    cache.put("c", log_of(10, 100))
+
+    assert "a" in cache and "b" not in cache and "c" in cache
+    assert cache.memory_bytes == 2 * 4 * (10 + 4 * 100)
+
+
+def test_disk_evicts_least_recently_used(tmp_path) -> None:
+    cache = TraceCache(str(tmp_path), memory_bytes=0)
+
+    cache.put("a", log_of(10, 100))
+    cache.disk_budget = 2 * cache.disk_bytes
+
+    cache.put("b", log_of(10, 100))
+    assert cache.get("a") is not None
+    cache.put("c", log_of(10, 100))
+
+    assert "a" in cache and "b" not in cache and "c" in cache
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["a.svt", "c.svt"]
+    assert cache.disk_bytes <= cache.disk_budget
+
+
+def test_truncated_logs_are_not_cached() -> None:
+    cache = TraceCache(None)
+    log = log_of(10, 100)
+    log.truncated = True
+
+    cache.put("a", log)
+
+    assert "a" not in cache
+
+
+def run_in_window(arr, values: list[int]) -> None:
+    """Records the algorithm of the window on the values and replays it to the end"""
+
+    arr.load_values(values)
+    arr.run_algorithm()
+
+    while arr.player:
+        arr.player.step(1 << 20)
+        sleep(0.001)
+
+
+def test_window_replays_second_run_from_cache(tmp_path) -> None:
+    values: list[int] = Random(5).sample(range(1, 201), 200)
+    arr = VisualArray(values)
+    arr.cache, arr.algorithm = TraceCache(str(tmp_path)), tim_sort  # Starts empty.
+
+    for _ in range(2):
+        run_in_window(arr, values)
+        assert arr._values.tolist() == sorted(values)
+
+    assert (len(arr.cache), arr.cache.memory_hits, arr.cache.misses) == (1, 1, 1)
+
+
+def test_failed_run_is_not_cached(tmp_path) -> None:
+    def failing_sort(arr) -> None:
+        tim_sort(arr)
+        raise RecursionError("maximum recursion depth exceeded")
+
+    values: list[int] = Random(6).sample(range(1, 201), 200)
+    arr = VisualArray(values)
+    arr.cache, arr.algorithm = TraceCache(str(tmp_path)), failing_sort
+
+    run_in_window(arr, values)
+
+    assert not arr.finished and not arr.is_algo_running
+    assert arr.history.log.truncated and isinstance(arr.history.error, RecursionError)
+    assert arr._values.tolist() == sorted(values)  # Records made before the failure are kept.
+    assert len(arr.cache) == 0
@@ -0,0 +1,18 @@
+from __generators import GENERATORS, generate
+
+
+def test_seeded_and_in_range() -> None:
+    for name in GENERATORS:
+        values: list[int] = generate(name, 100, 5)
+
+        assert values == generate(name, 100, 5)
+        assert len(values) == 100 and all(1 <= value <= 100 for value in values)
+
+
+def test_nearly_sorted_swaps() -> None:
+    assert generate("nearly_sorted", 100, 5, swaps=0) == list(range(1, 101))
+    assert generate("nearly_sorted", 100, 5) == generate("nearly_sorted", 100, 5, swaps=100 // 32)
+
+    moved: int = sum(value != i + 1 for i, value in enumerate(generate("nearly_sorted", 1000, 5, swaps=3)))
+
+    assert 0 < moved <= 6
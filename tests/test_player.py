@@ -0,0 +1,65 @@
+from array import array
+from random import Random
+
+import pytest
+
+from __recorder import record, apply, RECORD_WIDTH, STEP_BACK_LIMIT
+from __builtin_algorithms import tim_sort
+from VisualArray import VisualArray
+
+
+VALUES: list[int] = Random(2).sample(range(1, 301), 300)
+
+
+@pytest.fixture(scope="module")
+def arr() -> VisualArray:
+    arr = VisualArray(VALUES, cached=False, no_toolBar=True)
+    arr.replay(record(tim_sort, VALUES))  # Merges in auxiliary buffers, so the lane is exercised too.
+    return arr
+
+
+def state(arr: VisualArray) -> tuple:
+    """Returns what seeking must restore: values, selection, live lane elements and counters"""
+
+    return (arr._values.tolist(), set(arr.player.selected), arr.lane.values[:arr.lane.used].tolist(), arr.lane.live,
+            arr.counts.tolist())
+
+
+def forward(arr: VisualArray, position: int) -> tuple:
+    """Returns the state after replaying the first position records from the start"""
+
+    arr.replay(arr.log)
+    arr.seek(position)
+
+    return state(arr)
+
+
+def test_seek_to_end_sorts(arr: VisualArray) -> None:
+    arr.seek(len(arr.log))
+
+    assert arr._values.tolist() == sorted(VALUES)
+
+
+@pytest.mark.parametrize("back", [1, STEP_BACK_LIMIT, STEP_BACK_LIMIT + 1, 5000])
+def test_backward_seek_matches_forward(arr: VisualArray, back: int) -> None:
+    position: int = len(arr.log) - back
+
+    arr.seek(len(arr.log))
+    arr.seek(position)
+    reached: tuple = state(arr)
+
+    values, selected = array('i', VALUES), set()
+    apply(values, selected, arr.log.records[:position * RECORD_WIDTH])
+
+    assert reached[:2] == (values.tolist(), selected)
+    assert reached == forward(arr, position)
+
+
+def test_step_back_matches_forward(arr: VisualArray) -> None:
+    arr.seek(len(arr.log) // 2)
+
+    for _ in range(50):
+        arr.step_back()
+
+    assert arr.player.position == len(arr.log) // 2 - 50
+    assert state(arr) == forward(arr, len(arr.log) // 2 - 50)
@@ -0,0 +1,39 @@
+from random import Random
+
+from __recorder import record
+from __trace import Trace, save_trace, record_trace
+from __builtin_algorithms import insertion_sort, tim_sort
+
+
+VALUES: list[int] = Random(1).sample(range(1, 201), 200)
+
+
+def test_round_trip(tmp_path) -> None:
+    log = record(tim_sort, VALUES, only_positive=True)
+    save_trace(log, str(tmp_path / "run.svt"), algorithm="tim_sort", seed=1)
+
+    with Trace(str(tmp_path / "run.svt")) as trace:
+        assert trace.initial == log.initial
+        assert trace.records.tolist() == log.records.tolist()
+        assert (trace.algorithm, trace.seed, trace.only_positive, trace.truncated) == ("tim_sort", 1, True, False)
+        assert trace.final() == sorted(VALUES)
+
+
+def test_streamed_trace_matches_record(tmp_path) -> None:
+    log = record(tim_sort, VALUES)
+
+    assert record_trace(tim_sort, VALUES, str(tmp_path / "run.svt")) == len(log)
+
+    with Trace(str(tmp_path / "run.svt")) as trace:
+        assert trace.records.tolist() == log.records.tolist()
+        assert trace.seed is None
+
+
+def test_truncated_at_max_ops(tmp_path) -> None:
+    full = record(insertion_sort, VALUES)
+
+    assert record_trace(insertion_sort, VALUES, str(tmp_path / "run.svt"), max_ops=1000) == 1000
+
+    with Trace(str(tmp_path / "run.svt")) as trace:
+        assert trace.truncated
+        assert trace.records.tolist() == full.records[:4000].tolist()
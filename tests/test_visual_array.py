@@ -0,0 +1,44 @@
+from random import Random
+from time import sleep
+
+import __VisualizingEngine
+from __VisualizingEngine import resolution
+from __builtin_algorithms import tim_sort
+from VisualArray import VisualArray
+
+
+VALUES: list[int] = Random(7).sample(range(1, 201), 200)
+
+
+class NoEvents:
+    """Stands in for the application, fails if events are processed in a nested loop"""
+
+    @staticmethod
+    def processEvents() -> None:
+        raise AssertionError("nested event loop")
+
+
+def test_recorded_run_never_nests_event_loops(monkeypatch) -> None:
+    arr = VisualArray(VALUES, cached=False)
+    arr.algorithm = tim_sort
+
+    monkeypatch.setattr(__VisualizingEngine, "get_app", NoEvents)
+
+    arr.run_algorithm()
+
+    while arr.player:
+        arr.player.step(1 << 20)
+        sleep(0.001)
+
+    assert arr.finished and arr._sweep_timer.isActive()
+
+    arr.shuffle()  # Clicked during the end-of-sort sweep.
+
+    assert not arr.finished and not arr._sweep_timer.isActive()
+    assert arr._values.tolist() != sorted(VALUES)
+
+
+def test_separation_follows_the_argument() -> None:
+    assert VisualArray(VALUES[:16], cached=False).is_separated
+    assert not VisualArray(VALUES[:16], cached=False, is_separated=False).is_separated
+    assert not VisualArray(list(range(1, 4 * resolution()[0])), cached=False).is_separated  # One pixel wide.
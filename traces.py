@@ -0,0 +1,102 @@
+"""Binary operation traces of sorting runs: recording, inspection and replay.
+
+A trace holds the algorithm name, seed, size, initial array and every operation of a run in a compact binary file
+(see __trace.py). Traces are loaded through mmap, so traces larger than the memory can be replayed or analyzed, on any
+machine, without running the algorithm again.
+
+Usage: python3 traces.py record --algorithm "Bubble Sort" --size 2048 --out bubble.svt
+       python3 traces.py info bubble.svt
+       python3 traces.py play bubble.svt
+"""
+
+from __future__ import annotations
+
+from argparse import ArgumentParser, Namespace
+from os import path
+from time import perf_counter
+
+from __generators import GENERATORS, generate, scale
+from __trace import Trace, record_trace
+from VisualArray import VisualArray, _BUILTIN_FUNCS
+
+
+def record_command(args: Namespace) -> None:
+    """Records a run of an algorithm to a trace file"""
+
+    values: list[int] = scale(generate(args.shape, args.size, args.seed), args.size, args.height, not args.signed)
+
+    began: float = perf_counter()
+
+    records: int = record_trace(_BUILTIN_FUNCS[args.algorithm], values, args.out, name=args.algorithm,
+                                seed=args.seed, only_positive=not args.signed, economical=args.economical,
+                                max_ops=args.max_ops)
+
+    print(f"{records:,} records written to {args.out} ({path.getsize(args.out):,} bytes) "
+          f"in {perf_counter() - began:.2f} s")
+
+
+def info_command(args: Namespace) -> None:
+    """Prints the header and the operation counts of a trace"""
+
+    with Trace(args.trace) as trace:
+        print(f"algorithm  {trace.algorithm}\nseed       {trace.seed}\nsize       {len(trace.initial):,}\n"
+              f"positive   {trace.only_positive}\nrecords    {len(trace):,}\ntruncated  {trace.truncated}")
+
+        for name, count in trace.op_counts().items():
+            print(f"{name:<11}{count:,}") if count else ...
+
+        if args.verify:
+            final: list[int] = trace.final()
+            print(f"sorted     {final == sorted(final)}")
+
+
+def play_command(args: Namespace) -> None:
+    """Replays a trace in the visualizer, it starts with Start / Pause"""
+
+    with Trace(args.trace) as trace:
+        arr: VisualArray = VisualArray(trace.initial.tolist(), only_positive=trace.only_positive, fps=args.fps,
+                                       delay=1 / args.ops_per_second if args.ops_per_second else 0)
+
+        arr.setWindowTitle(f"Sorting Visualizer - {trace.algorithm or path.basename(args.trace)}")
+
+        arr.replay(trace)
+        arr.run()
+
+        arr.stop_replay()
+
+
+def main() -> None:
+    parser: ArgumentParser = ArgumentParser(description=__doc__.split("\n\n")[0])
+
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    record: ArgumentParser = commands.add_parser("record", help="Record a run of an algorithm to a trace file")
+    record.add_argument("--algorithm", default="Bubble Sort", choices=list(_BUILTIN_FUNCS), help="Algorithm to run")
+    record.add_argument("--size", type=int, default=1024, help="Array size")
+    record.add_argument("--shape", default="random", choices=list(GENERATORS), help="Input shape")
+    record.add_argument("--seed", type=int, default=0, help="Seed of the input")
+    record.add_argument("--height", type=int, default=1080, help="Height the values are scaled to")
+    record.add_argument("--signed", action="store_true", help="Use positive and negative values")
+    record.add_argument("--economical", action="store_true", help="Let the algorithm use swap() instead of assignments")
+    record.add_argument("--max-ops", type=int, default=1 << 31, help="Operations after which the run is cut off")
+    record.add_argument("--out", required=True, help="Path of the trace file")
+    record.set_defaults(function=record_command)
+
+    info: ArgumentParser = commands.add_parser("info", help="Print the header and operation counts of a trace")
+    info.add_argument("trace", help="Path of the trace file")
+    info.add_argument("--verify", action="store_true", help="Check that the trace ends sorted")
+    info.set_defaults(function=info_command)
+
+    play: ArgumentParser = commands.add_parser("play", help="Replay a trace in the visualizer")
+    play.add_argument("trace", help="Path of the trace file")
+    play.add_argument("--fps", type=int, default=60, help="Frame rate")
+    play.add_argument("--ops-per-second", type=int, default=5000, help="Operations shown per second, 0 for unlimited")
+    play.set_defaults(function=play_command)
+
+    args: Namespace = parser.parse_args()
+
+    args.function(args)
+
+
+if __name__ == "__main__":
+    main()